@@ -0,0 +1,178 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# Makes it so that the game's modules in src can be imported.
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src")
+sys.path.insert(0, SOURCE_DIRECTORY)
+
+from brick_field import BrickField
+from world import World
+
+# The default number of frames that are checked for allocations.
+DEFAULT_FRAMES = 10000
+
+# The number of frames that are run before checking, so that anything that is only created
+# once (e.g. the ball's scratch list growing to its usual size) isn't counted.
+WARMUP_FRAMES = 600
+
+# How far the ball's centre can be from the paddle's centre before the bot moves the paddle.
+DEAD_ZONE = 20
+
+def create_game(empty):
+    """Returns a function that moves the paddle and ball by one frame, with the paddle following
+    the ball and the game reset whenever the ball is lost so that it never leaves its steady
+    state, and the function that resets it
+
+    Resetting puts the ball and paddle back exactly as they started, so that their attributes
+    hold the same objects as before and don't count as allocations when the game is measured.
+
+    Parameters:
+        empty (bool): Whether all of the bricks are removed first
+
+    Returns:
+        frame (function): The function that runs one frame
+        reset (function): The function that puts the ball and paddle back where they started
+    """
+
+    # Creates a world, removing the bricks if necessary.
+    world = World(seed=0)
+    if empty:
+        world.bricks = BrickField()
+        world.create_new_ball()
+    ball = world.ball
+    paddle = world.paddle
+    timestep = world.timestep
+
+    # Stores how the ball and paddle start so that they can be put back without creating a new
+    # ball or paddle.
+    ball_start = (ball.left_x, ball.top_y, ball.right_x, ball.bottom_y, ball.x_velocity,
+                  ball.y_velocity, ball.speed)
+    paddle_start = (paddle.left_x, paddle.right_x)
+
+    def reset():
+        (ball.left_x, ball.top_y, ball.right_x, ball.bottom_y, ball.x_velocity,
+         ball.y_velocity, ball.speed) = ball_start
+        paddle.left_x, paddle.right_x = paddle_start
+        paddle.stop()
+
+    def frame():
+
+        # Moves the paddle towards the ball.
+        ball_centre_x = ball.left_x + ball.radius
+        paddle_centre_x = (paddle.left_x + paddle.right_x) / 2
+        if ball_centre_x > paddle_centre_x + DEAD_ZONE:
+            paddle.move_right()
+        elif ball_centre_x < paddle_centre_x - DEAD_ZONE:
+            paddle.move_left()
+        else:
+            paddle.stop()
+        paddle.move(timestep)
+
+        # Moves the ball, resetting the game if it is lost.
+        lose_life, _ = ball.move(timestep)
+        if lose_life:
+            reset()
+
+    return frame, reset
+
+def measure(empty, frames=DEFAULT_FRAMES):
+    """Runs a number of frames of a new game whilst tracing memory allocations
+
+    Only allocations made by the game's modules in src are counted, so the benchmark's own
+    variables don't count. The garbage collector is disabled whilst measuring so that it
+    can't free anything that the frames left behind, and is run by hand before each snapshot
+    instead, as a full collection also empties Python's free lists of spare floats. Anything it
+    finds after the frames is garbage that the frames created, so it is counted separately.
+
+    Parameters:
+        empty (bool): Whether all of the bricks are removed first
+        frames (int) (default 10000): How many frames to run
+
+    Returns:
+        net_bytes (int): How many more bytes the game's modules had allocated after the frames
+                         than before them
+        net_blocks (int): How many more memory blocks the game's modules had allocated after
+                          the frames than before them
+        garbage (int): How many objects the frames left for the garbage collector to free
+        peak_bytes (int): The most memory that was allocated during any one frame
+                          (and freed again by the end of it)
+    """
+
+    # Tracing starts before the game is created so that the values the frames replace (e.g.
+    # the ball's old position) were traced when they were allocated, and so count when freed.
+    source_filter = [tracemalloc.Filter(True, os.path.join(SOURCE_DIRECTORY, "*"))]
+    tracemalloc.start()
+    try:
+        frame, reset = create_game(empty)
+        for _ in range(WARMUP_FRAMES):
+            frame()
+        reset()
+        gc.disable()
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(source_filter)
+
+        # Finds the most memory allocated during a frame on top of what was already allocated.
+        # The cost of measuring is found by running an empty function, and is taken off.
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        (lambda: None)()
+        overhead = tracemalloc.get_traced_memory()[1] - current
+        peak_bytes = 0
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            frame()
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1] - current - overhead)
+
+        reset()
+        garbage = gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(source_filter)
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    differences = after.compare_to(before, "filename")
+    net_bytes = sum(difference.size_diff for difference in differences)
+    net_blocks = sum(difference.count_diff for difference in differences)
+    return net_bytes, net_blocks, garbage, peak_bytes
+
+def main(arguments=None):
+    """Prints how much memory the ball and paddle updates leave allocated across many frames,
+    which should be nothing, so that the garbage collector never has to run because of them
+
+    Parameters:
+        arguments (List[str]) (default None): The command line arguments.
+                                              If None, sys.argv is used.
+
+    Returns:
+        exit_code (int): 1 if any memory was left allocated, otherwise 0
+    """
+
+    parser = argparse.ArgumentParser(description="Checks that moving the ball and paddle "
+                                                 "doesn't leave any memory allocated.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES,
+                        help=f"how many frames are checked (default {DEFAULT_FRAMES})")
+    arguments = parser.parse_args(arguments)
+
+    # Checks the ball bouncing around an empty field and breaking bricks in a full one.
+    leaks = []
+    for name, empty in (("empty field", True), ("full field", False)):
+        net_bytes, net_blocks, garbage, peak_bytes = measure(empty, arguments.frames)
+        print(f"{name:>11}: {net_bytes:+6d} bytes in {net_blocks:+4d} blocks left allocated "
+              f"and {garbage} garbage objects after {arguments.frames} frames, "
+              f"at most {peak_bytes} bytes during a frame")
+        if net_bytes > 0 or net_blocks > 0 or garbage:
+            leaks.append(name)
+
+    # Fails if any memory was left allocated.
+    if leaks:
+        print(f"Memory was left allocated in: {', '.join(leaks)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
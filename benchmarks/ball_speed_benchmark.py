@@ -0,0 +1,79 @@
+import math
+import os
+import sys
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+import constants
+from world import World
+
+# The ball speeds (in pixels per second) that are benchmarked, labelled by roughly which level
+# the ball reaches that speed on.
+BALL_SPEEDS = {"level 1": constants.DEFAULT_BALL_SPEED,
+               "level 8": constants.DEFAULT_BALL_SPEED * 1.2**7,
+               "level 12": constants.DEFAULT_BALL_SPEED * 1.2**11,
+               "level 16": constants.DEFAULT_BALL_SPEED * 1.2**15}
+
+# The number of frames that are simulated for each ball speed.
+FRAMES = 20000
+
+def set_ball_speed(world, speed, angle=math.radians(-60)):
+    """Sets the speed of the world's ball whilst giving it a fixed direction
+
+    Parameters:
+        world (World): The world whose ball is changed
+        speed (float): The new speed of the ball in pixels per second
+        angle (float) (default -60 degrees): The direction of the ball in radians
+    """
+
+    world.ball.speed = speed
+    world.ball.x_velocity = speed * math.cos(angle)
+    world.ball.y_velocity = speed * math.sin(angle)
+
+def benchmark_speed(speed, frames=FRAMES):
+    """Simulates frames of the game with the ball moving at the given speed and returns the
+    average time that each frame took
+
+    Parameters:
+        speed (float): The speed of the ball in pixels per second
+        frames (int) (default 20000): How many frames to simulate
+
+    Returns:
+        time_per_frame (float): The average time each frame took in seconds
+    """
+
+    # Creates a world with lots of lives so that the game doesn't end during the benchmark.
+    world = World(lives=frames)
+    set_ball_speed(world, speed)
+
+    # Simulates the frames and times how long they take.
+    start = time.perf_counter()
+    for _ in range(frames):
+        lost_life, level_cleared = world.step()
+
+        # A new ball is created at the default speed when the user loses a life or clears
+        # the level, so set it back to the speed being benchmarked.
+        if lost_life or level_cleared:
+            set_ball_speed(world, speed)
+    end = time.perf_counter()
+
+    return (end - start) / frames
+
+def main():
+    """Prints how long a frame takes at each of the benchmarked ball speeds"""
+
+    # Frame budget at 60 frames per second, for reference.
+    print(f"Frame budget: {1e6 / constants.PHYSICS_STEPS_PER_SECOND:.0f} us")
+
+    for label, speed in BALL_SPEEDS.items():
+        substeps = max(1, math.ceil(speed / constants.PHYSICS_STEPS_PER_SECOND
+                                    / constants.MAX_BALL_SUBSTEP_DISTANCE))
+        time_per_frame = benchmark_speed(speed)
+        print(f"{label:>8}: speed {speed:6.1f} px/s, up to {substeps} substeps, "
+              f"{time_per_frame * 1e6:7.2f} us/frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from batch_simulation import BatchSimulation
+
+# The numbers of games that are simulated at once.
+BATCH_SIZES = [1, 100, 1000, 10000]
+
+# The number of ticks that each batch is stepped for.
+TICKS = 500
+
+def benchmark_batch(games, ticks=TICKS):
+    """Steps a batch of games with the paddles following the balls and returns how many
+    game-steps were simulated per second
+
+    Parameters:
+        games (int): How many games to simulate at once
+        ticks (int) (default 500): How many ticks to step the batch for
+
+    Returns:
+        steps_per_second (float): The number of game-steps (games * ticks) simulated per second
+    """
+
+    # Creates a batch with lots of lives so that no games end during the benchmark.
+    simulation = BatchSimulation(games, lives=ticks, seed=0)
+
+    # Steps the batch and times how long it takes.
+    start = time.perf_counter()
+    for _ in range(ticks):
+        simulation.step()
+    end = time.perf_counter()
+
+    return games * ticks / (end - start)
+
+def main():
+    """Prints how many game-steps per second are simulated for each batch size"""
+
+    for games in BATCH_SIZES:
+        steps_per_second = benchmark_batch(games)
+        print(f"{games:>6} games: {steps_per_second:12,.0f} game-steps/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import os
+import random
+import sys
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from brick_field import BrickField
+import constants
+
+# The numbers of bricks that are benchmarked. 40 is the number of bricks in a normal level.
+BRICK_COUNTS = [40, 1000, 5000]
+
+# The number of ball positions that are looked up for each number of bricks.
+QUERIES = 20000
+
+# The size of each brick.
+BRICK_WIDTH = 20
+BRICK_HEIGHT = 10
+
+def create_bricks(count):
+    """Creates a brick field with bricks laid out on a regular grid like the bricks in a level
+
+    Parameters:
+        count (int): How many bricks to create
+
+    Returns:
+        field (BrickField): The brick field that the bricks are stored in
+        bricks (List[Brick]): A list of the bricks, like the list the game used to store them in
+    """
+
+    # Works out how many bricks fit in a row across the window.
+    bricks_per_row = constants.WINDOW_WIDTH // BRICK_WIDTH
+
+    field = BrickField(BRICK_WIDTH, BRICK_HEIGHT)
+    for i in range(count):
+        row, column = divmod(i, bricks_per_row)
+        field.add(column * BRICK_WIDTH, row * BRICK_HEIGHT, constants.DEFAULT_BRICK_SCORE,
+                  "#FFFFFF", BRICK_WIDTH, BRICK_HEIGHT)
+
+    return field, list(field)
+
+def overlaps(box, brick):
+    """Returns whether a box overlaps with a brick, in the same way as the bounding box check
+    that the ball does before checking exactly whether it touches the brick
+
+    Parameters:
+        box (Tuple[float, float, float, float]): The left x, top y, right x and bottom y of the box
+        brick (Brick): The brick to check
+
+    Returns:
+        overlapping (bool): Whether the box and the brick overlap
+    """
+
+    return (box[0] <= brick.right_x and box[2] >= brick.left_x
+            and box[1] <= brick.bottom_y and box[3] >= brick.top_y)
+
+def create_ball_boxes(bricks, count):
+    """Creates random ball-sized boxes within the area covered by the bricks
+
+    Parameters:
+        bricks (List[Brick]): The bricks that the boxes should be among
+        count (int): How many boxes to create
+
+    Returns:
+        boxes (List[Tuple[float, float, float, float]]): The boxes created
+    """
+
+    # Uses a fixed seed so that every run looks up the same positions.
+    rng = random.Random(0)
+    bottom = max(brick.bottom_y for brick in bricks)
+    diameter = 2 * constants.DEFAULT_BALL_RADIUS
+
+    boxes = []
+    for _ in range(count):
+        x = rng.uniform(0, constants.WINDOW_WIDTH - diameter)
+        y = rng.uniform(0, bottom)
+        boxes.append((x, y, x + diameter, y + diameter))
+
+    return boxes
+
+def benchmark_scan(bricks, boxes):
+    """Returns the average time taken to find the bricks touching a box by checking every brick
+
+    Parameters:
+        bricks (List[Brick]): The bricks to search
+        boxes (List[Tuple[float, float, float, float]]): The boxes to look up
+
+    Returns:
+        time_per_query (float): The average time per box in seconds
+    """
+
+    start = time.perf_counter()
+    for box in boxes:
+        [brick for brick in bricks if overlaps(box, brick)]
+    return (time.perf_counter() - start) / len(boxes)
+
+def benchmark_field(field, boxes):
+    """Returns the average time taken to find the bricks touching a box using a BrickField
+    (which uses its BrickGrid)
+
+    Parameters:
+        field (BrickField): The brick field to search
+        boxes (List[Tuple[float, float, float, float]]): The boxes to look up
+
+    Returns:
+        time_per_query (float): The average time per box in seconds
+    """
+
+    start = time.perf_counter()
+    for box in boxes:
+        field.overlapping(*box)
+    return (time.perf_counter() - start) / len(boxes)
+
+def benchmark_list_removal(bricks, removal_order):
+    """Returns the average time taken to remove every brick from a list
+
+    Parameters:
+        bricks (List[Brick]): The list to remove the bricks from
+        removal_order (List[Brick]): The bricks to remove, in a random order
+
+    Returns:
+        time_per_removal (float): The average time per brick in seconds
+    """
+
+    start = time.perf_counter()
+    for brick in removal_order:
+        bricks.remove(brick)
+    return (time.perf_counter() - start) / len(removal_order)
+
+def benchmark_field_removal(field, removal_order):
+    """Returns the average time taken to destroy every brick in a BrickField
+
+    Parameters:
+        field (BrickField): The brick field to destroy the bricks in
+        removal_order (List[Brick]): The bricks to destroy, in a random order
+
+    Returns:
+        time_per_removal (float): The average time per brick in seconds
+    """
+
+    start = time.perf_counter()
+    for brick in removal_order:
+        field.remove(brick.index)
+    return (time.perf_counter() - start) / len(removal_order)
+
+def main():
+    """Prints the time taken to look up and remove bricks with a list scan and a BrickField"""
+
+    for count in BRICK_COUNTS:
+        field, bricks = create_bricks(count)
+        boxes = create_ball_boxes(bricks, QUERIES)
+
+        # Checks that both ways of looking up bricks find the same bricks.
+        for box in boxes[:1000]:
+            assert ({brick.index for brick in bricks if overlaps(box, brick)}
+                    == {brick.index for brick in field.overlapping(*box)})
+
+        scan_time = benchmark_scan(bricks, boxes)
+        grid_time = benchmark_field(field, boxes)
+
+        # Removes the bricks in a random order so that the list has to search for them.
+        removal_order = bricks.copy()
+        random.Random(1).shuffle(removal_order)
+        list_removal_time = benchmark_list_removal(bricks, removal_order)
+        grid_removal_time = benchmark_field_removal(field, removal_order)
+
+        print(f"{count:5} bricks: lookup scan {scan_time * 1e6:8.2f} us, "
+              f"field {grid_time * 1e6:6.2f} us ({scan_time / grid_time:6.1f}x) | "
+              f"remove list {list_removal_time * 1e6:6.2f} us, "
+              f"field {grid_removal_time * 1e6:5.2f} us")
+
+if __name__ == "__main__":
+    main()
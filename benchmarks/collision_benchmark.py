@@ -0,0 +1,170 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from collision import circle_rectangle_contact, reflect
+import constants
+
+# The size and position of the brick that the ball is checked against.
+BRICK = (300.0, 100.0, 380.0, 120.0)
+
+# The default number of ball positions that are checked against the brick.
+DEFAULT_CHECKS = 100000
+
+# The number of times each way of checking is timed. The fastest time is used as it is the one
+# least affected by anything else running on the computer.
+REPEATS = 7
+
+def create_balls(count, near, seed=0):
+    """Creates random balls moving in random directions, either next to the brick or anywhere
+    in the bottom half of the window
+
+    Balls next to the brick have bounding boxes that overlap the brick, but their centres are
+    outside it, as a substep never moves the ball further than its radius. These are the checks
+    that happen when the ball reaches a brick or the paddle. Balls in the bottom half of the
+    window are nowhere near the brick, which is what the paddle check sees on most substeps.
+
+    Parameters:
+        count (int): How many balls to create
+        near (bool): Whether the balls are next to the brick
+        seed (int) (default 0): The seed for the random number generator
+
+    Returns:
+        balls (List[tuple[float, float, float, float]]): The x and y coordinates of each ball's
+                                                         centre and its x and y velocities
+    """
+
+    rng = random.Random(seed)
+    radius = constants.DEFAULT_BALL_RADIUS
+    left_x, top_y, right_x, bottom_y = BRICK
+    balls = []
+    while len(balls) < count:
+        if near:
+            centre_x = rng.uniform(left_x - radius, right_x + radius)
+            centre_y = rng.uniform(top_y - radius, bottom_y + radius)
+            if left_x < centre_x < right_x and top_y < centre_y < bottom_y:
+                continue
+        else:
+            centre_x = rng.uniform(0, constants.WINDOW_WIDTH)
+            centre_y = rng.uniform(constants.WINDOW_HEIGHT / 2, constants.WINDOW_HEIGHT)
+        balls.append((centre_x, centre_y, rng.uniform(-480, 480), rng.uniform(-480, 480)))
+    return balls
+
+def bounding_box_bounce(centre_x, centre_y, x_velocity, y_velocity):
+    """Bounces a ball off the brick in the way Ball did before it used exact collisions, by
+    treating the ball as its bounding box and bouncing it off the edge it overlaps least deeply
+
+    Parameters:
+        centre_x (float): The x coordinate of the ball's centre
+        centre_y (float): The y coordinate of the ball's centre
+        x_velocity (float): The velocity of the ball in the x direction
+        y_velocity (float): The velocity of the ball in the y direction
+
+    Returns:
+        velocity (tuple[float, float]): The ball's new velocity, or None if it didn't hit the brick
+    """
+
+    radius = constants.DEFAULT_BALL_RADIUS
+    brick_left_x, brick_top_y, brick_right_x, brick_bottom_y = BRICK
+    left_x = centre_x - radius
+    top_y = centre_y - radius
+    right_x = centre_x + radius
+    bottom_y = centre_y + radius
+
+    if not (left_x <= brick_right_x and right_x >= brick_left_x
+            and top_y <= brick_bottom_y and bottom_y >= brick_top_y):
+        return None
+
+    collision_depth = {}
+    if left_x < brick_left_x and x_velocity > 0:
+        collision_depth["left"] = right_x - brick_left_x
+    if right_x + radius > brick_right_x and x_velocity < 0:
+        collision_depth["right"] = brick_right_x - left_x
+    if top_y + radius < brick_top_y and y_velocity > 0:
+        collision_depth["top"] = bottom_y - brick_top_y
+    if bottom_y + radius > brick_bottom_y and y_velocity < 0:
+        collision_depth["bottom"] = brick_bottom_y - top_y
+
+    if collision_depth:
+        direction = min(collision_depth, key=collision_depth.get)
+        if direction in ("left", "right"):
+            x_velocity = -x_velocity
+        else:
+            y_velocity = -y_velocity
+    return x_velocity, y_velocity
+
+def circle_bounce(centre_x, centre_y, x_velocity, y_velocity):
+    """Bounces a ball off the brick in the way Ball does, by checking whether the circle touches
+    the brick exactly and reflecting the ball's velocity off the contact normal
+
+    Parameters:
+        centre_x (float): The x coordinate of the ball's centre
+        centre_y (float): The y coordinate of the ball's centre
+        x_velocity (float): The velocity of the ball in the x direction
+        y_velocity (float): The velocity of the ball in the y direction
+
+    Returns:
+        velocity (tuple[float, float]): The ball's new velocity, or None if it didn't hit the brick
+    """
+
+    brick_left_x, brick_top_y, brick_right_x, brick_bottom_y = BRICK
+    contact = circle_rectangle_contact(centre_x, centre_y, constants.DEFAULT_BALL_RADIUS,
+                                       brick_left_x, brick_top_y, brick_right_x, brick_bottom_y)
+    if contact is None:
+        return None
+    return reflect(x_velocity, y_velocity, contact[0], contact[1])
+
+def benchmark(bounce, balls):
+    """Times how long a way of bouncing takes for each ball
+
+    Parameters:
+        bounce (function): bounding_box_bounce or circle_bounce
+        balls (List[tuple[float, float, float, float]]): The balls from create_balls()
+
+    Returns:
+        time_per_check (float): The fastest average time each check took in seconds
+        hits (int): How many of the balls hit the brick
+    """
+
+    best_time = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        hits = 0
+        for ball in balls:
+            if bounce(*ball) is not None:
+                hits += 1
+        duration = time.perf_counter() - start
+        if best_time is None or duration < best_time:
+            best_time = duration
+
+    return best_time / len(balls), hits
+
+def main():
+    """Prints how long the old bounding box check and the exact circle check take for balls
+    far from and next to a brick, and how many more hits the bounding box counts"""
+
+    parser = argparse.ArgumentParser(description="Compares the ball's old bounding box "
+                                                 "collision check with the exact circle check.")
+    parser.add_argument("--checks", type=int, default=DEFAULT_CHECKS,
+                        help=f"how many ball positions are checked (default {DEFAULT_CHECKS})")
+    arguments = parser.parse_args()
+
+    for label, near in (("far from the brick", False), ("next to the brick", True)):
+        balls = create_balls(arguments.checks, near)
+        box_time, box_hits = benchmark(bounding_box_bounce, balls)
+        circle_time, circle_hits = benchmark(circle_bounce, balls)
+
+        print(f"{label}:")
+        print(f"  bounding box: {box_time * 1e9:6.0f} ns/check, {box_hits} hits")
+        print(f"        circle: {circle_time * 1e9:6.0f} ns/check, {circle_hits} hits "
+              f"({box_hits - circle_hits} fewer near the brick's corners)")
+        print(f"       speedup: {box_time / circle_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from brick_field import BrickField
+import constants
+from leaderboard import store_on_leaderboard
+from world import World
+
+# The default number of untimed runs before the timed runs, and the number of timed runs.
+DEFAULT_WARMUP = 20
+DEFAULT_REPEATS = 200
+
+# How much slower (as a fraction) the median time of a hot path can get compared to the
+# baseline before it counts as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+# The number of ball moves timed in each run of the Ball.move benchmarks.
+MOVES_PER_RUN = 100
+
+def aim_ball(ball, speed, angle):
+    """Sets the speed of a ball and the direction it travels in
+
+    Parameters:
+        ball (Ball): The ball to change
+        speed (float): The new speed of the ball in pixels per second
+        angle (float): The direction of the ball in degrees anti-clockwise from the positive
+                       x-axis (as the y-axis points down, 90 degrees is straight up)
+    """
+
+    ball.speed = speed
+    ball.x_velocity = speed * math.cos(math.radians(angle))
+    ball.y_velocity = -speed * math.sin(math.radians(angle))
+
+def setup_ball_move(empty, speed):
+    """Returns a function that moves a ball MOVES_PER_RUN times in a new world
+
+    Parameters:
+        empty (bool): Whether all of the bricks are removed first
+        speed (float): The speed of the ball in pixels per second
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of ball moves the function does
+    """
+
+    # Creates a world with the ball travelling up and to the right towards the bricks.
+    # The same seed is used every time so that every run bounces the same way.
+    world = World(seed=0)
+    if empty:
+        world.bricks = BrickField()
+        world.create_new_ball()
+    aim_ball(world.ball, speed, 60)
+    move = world.ball.move
+
+    def function():
+        for _ in range(MOVES_PER_RUN):
+            move()
+
+    return function, MOVES_PER_RUN
+
+def setup_brick_collisions():
+    """Returns a function that moves a ball up by one substep into the bottom edge of every
+    brick in a full field, resolving the collisions
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of collision checks the function does
+    """
+
+    # Creates a world with a ball travelling up.
+    world = World(seed=0)
+    ball = world.ball
+    aim_ball(ball, constants.DEFAULT_BALL_SPEED, 80)
+    check_brick_collisions = ball._Ball__check_brick_collisions
+    radius = ball.radius
+
+    # Gets the positions of the balls so that they are just below the bottom of each brick,
+    # and how far the ball moves up in one substep.
+    positions = [((brick.left_x + brick.right_x) / 2 - radius, brick.bottom_y + 1)
+                 for brick in world.bricks]
+    y_distance = -constants.MAX_BALL_SUBSTEP_DISTANCE
+
+    def function():
+        for left_x, top_y in positions:
+            ball.left_x = left_x
+            ball.top_y = top_y
+            ball.right_x = left_x + 2 * radius
+            ball.bottom_y = top_y + 2 * radius
+            check_brick_collisions(0.0, y_distance)
+
+    return function, len(positions)
+
+def setup_paddle_move():
+    """Returns a function that moves the paddle 1000 times, bouncing between the walls
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of paddle moves the function does
+    """
+
+    paddle = World(seed=0).paddle
+
+    def function():
+        for _ in range(10):
+            paddle.move_left()
+            for _ in range(50):
+                paddle.move()
+            paddle.move_right()
+            for _ in range(50):
+                paddle.move()
+
+    return function, 1000
+
+def setup_create_initial_bricks():
+    """Returns a function that creates the initial bricks of a game
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of times the function creates the bricks
+    """
+
+    world = World(seed=0)
+    return world.create_initial_bricks, 1
+
+def setup_save_load_round_trip(directory):
+    """Returns a function that saves a game to a JSON file and loads it back into a world,
+    in the same way as saving from the pause menu and loading from the main menu
+
+    Parameters:
+        directory (str): The directory to write the save file in
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of round trips the function does
+    """
+
+    # Creates a world part of the way through a game.
+    world = World(seed=0)
+    for _ in range(300):
+        world.step()
+    loaded_world = World(seed=0)
+    file_path = os.path.join(directory, "data.json")
+
+    def function():
+        with open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(world.to_save_data(), f)
+        with open(file_path, "rt", encoding="utf-8") as f:
+            loaded_world.load_save_data(json.load(f))
+
+    return function, 1
+
+def setup_store_on_leaderboard(directory):
+    """Returns a function that stores a score on a full leaderboard
+
+    Parameters:
+        directory (str): The directory to write the leaderboard file in
+
+    Returns:
+        function (function): The function to time
+        operations (int): The number of scores the function stores
+    """
+
+    # Creates a full leaderboard so that every score stored is compared with the 10th score
+    # and rewrites the file.
+    file_path = os.path.join(directory, "leaderboard.csv")
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    for score in range(1000, 0, -100):
+        store_on_leaderboard("AB", score, file_path)
+
+    return lambda: store_on_leaderboard("CD", 550, file_path), 1
+
+def create_benchmarks(directory):
+    """Returns the setup function for each hot path
+
+    Parameters:
+        directory (str): A temporary directory that benchmarks can write files to
+
+    Returns:
+        benchmarks (dict[str: function]): Maps the name of each hot path to a function that
+                                          returns the function to time and how many
+                                          operations it does
+    """
+
+    high_speed = constants.DEFAULT_BALL_SPEED * constants.DEFAULT_LEVEL_SCALING**15
+    return {"Ball.move (empty field)":
+                lambda: setup_ball_move(True, constants.DEFAULT_BALL_SPEED),
+            "Ball.move (full field)":
+                lambda: setup_ball_move(False, constants.DEFAULT_BALL_SPEED),
+            "Ball.move (high speed)":
+                lambda: setup_ball_move(False, high_speed),
+            "Ball.__check_brick_collisions": setup_brick_collisions,
+            "Paddle.move": setup_paddle_move,
+            "World.create_initial_bricks": setup_create_initial_bricks,
+            "Save/load round trip": lambda: setup_save_load_round_trip(directory),
+            "store_on_leaderboard": lambda: setup_store_on_leaderboard(directory)}
+
+def measure(setup, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS):
+    """Times a hot path repeatedly after warming it up
+
+    Each run calls the setup function first (which isn't timed), so every run starts from
+    the same state.
+
+    Parameters:
+        setup (function): Returns the function to time and how many operations it does
+        warmup (int) (default 20): The number of untimed runs first
+        repeats (int) (default 200): The number of timed runs
+
+    Returns:
+        times (List[float]): The time per operation of each timed run in seconds
+    """
+
+    times = []
+    for run in range(warmup + repeats):
+        function, operations = setup()
+        start = time.perf_counter()
+        function()
+        end = time.perf_counter()
+        if run >= warmup:
+            times.append((end - start) / operations)
+
+    return times
+
+def summarise(times):
+    """Returns the median and 99th percentile of a list of times in microseconds
+
+    Parameters:
+        times (List[float]): The times in seconds
+
+    Returns:
+        summary (dict[str: float]): The median, 99th percentile, minimum and number of times
+    """
+
+    return {"median_us": statistics.median(times) * 1e6,
+            "p99_us": statistics.quantiles(times, n=100)[98] * 1e6,
+            "min_us": min(times) * 1e6,
+            "runs": len(times)}
+
+def compare(results, baseline, threshold):
+    """Compares results with a baseline and returns the hot paths that regressed
+
+    Parameters:
+        results (dict[str: dict]): The summaries of the current run
+        baseline (dict[str: dict]): The summaries of the baseline run
+        threshold (float): How much slower (as a fraction) the median can get before it
+                           counts as a regression
+
+    Returns:
+        changes (dict[str: float]): The fractional change of the median of each hot path
+                                    that is in both runs
+        regressions (List[str]): The names of the hot paths that regressed
+    """
+
+    changes = {}
+    regressions = []
+    for name, summary in results.items():
+        if name in baseline:
+            change = summary["median_us"] / baseline[name]["median_us"] - 1
+            changes[name] = change
+            if change > threshold:
+                regressions.append(name)
+
+    return changes, regressions
+
+def main(arguments=None):
+    """Runs the benchmark suite from the command line arguments
+
+    Parameters:
+        arguments (List[str]) (default None): The command line arguments.
+                                              If None, sys.argv is used.
+
+    Returns:
+        exit_code (int): 1 if a hot path regressed compared to the baseline, otherwise 0
+    """
+
+    parser = argparse.ArgumentParser(description="Times the game's hot paths and compares "
+                                                 "them with a baseline.")
+    parser.add_argument("--output", metavar="PATH",
+                        help="write the results to a JSON file (which can be used as a "
+                             "baseline later)")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="a JSON file from an earlier --output to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fail if a median gets slower than the baseline by more than "
+                             f"this fraction (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help=f"untimed runs before timing (default {DEFAULT_WARMUP})")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help=f"timed runs (default {DEFAULT_REPEATS})")
+    parser.add_argument("--filter", default="",
+                        help="only run hot paths whose names contain this text")
+    arguments = parser.parse_args(arguments)
+
+    # Times each hot path, using a temporary directory for the files that are written.
+    directory = tempfile.mkdtemp()
+    try:
+        results = {}
+        for name, setup in create_benchmarks(directory).items():
+            if arguments.filter in name:
+                results[name] = summarise(measure(setup, arguments.warmup, arguments.repeats))
+    finally:
+        shutil.rmtree(directory)
+
+    # Compares the results with the baseline if one was given.
+    changes = {}
+    regressions = []
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "rt", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        changes, regressions = compare(results, baseline, arguments.threshold)
+
+    # Prints the results as a table.
+    print(f"{'hot path':<32} {'median us':>10} {'p99 us':>10} {'vs baseline':>12}")
+    for name, summary in results.items():
+        change = f"{changes[name]:+.1%}" if name in changes else ""
+        flag = " REGRESSED" if name in regressions else ""
+        print(f"{name:<32} {summary['median_us']:>10.2f} {summary['p99_us']:>10.2f} "
+              f"{change:>12}{flag}")
+
+    # Writes the results to a JSON file if one was given.
+    if arguments.output is not None:
+        with open(arguments.output, "wt", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "results": results}, f, indent=4)
+
+    # Fails if any of the hot paths regressed.
+    if regressions:
+        print(f"{len(regressions)} hot path(s) regressed by more than "
+              f"{arguments.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
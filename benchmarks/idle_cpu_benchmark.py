@@ -0,0 +1,151 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tkinter
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+import constants
+from main import create_window
+from main_menu import MainMenu
+
+# The screens that are measured and how many times the menu pointer is moved down from
+# New Game to select each of them in the main menu.
+SCREENS = {"main menu": None, "leaderboard": 3, "key bindings": 4}
+
+# The default number of seconds that each screen is left idle for whilst it is measured.
+DEFAULT_SECONDS = 5.0
+
+# The number of seconds that each screen is left to settle before it is measured, which gives
+# the main menu time to finish warming up the other screens after it first appears.
+SETTLE_SECONDS = 1.0
+
+def count_timer_callbacks():
+    """Makes Tkinter count every callback scheduled with after() or after_idle() that runs
+
+    Returns:
+        counter (List[int]): A list holding the number of callbacks that have run so far
+    """
+
+    counter = [0]
+    original_after = tkinter.Misc.after
+
+    # Wraps each callback so that it counts itself when it runs. after_idle() calls after(),
+    # so idle callbacks are counted as well.
+    def after(widget, ms, func=None, *args):
+        if func is None:
+            return original_after(widget, ms)
+
+        def counted_func(*args):
+            counter[0] += 1
+            return func(*args)
+
+        return original_after(widget, ms, counted_func, *args)
+
+    tkinter.Misc.after = after
+    return counter
+
+def load_key_bindings():
+    """Returns the key bindings that the main menu will use
+
+    Returns:
+        key_bindings (dict[str: str]): A dictionary that maps the commands to the key binding
+    """
+
+    try:
+        file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 "assets", "key_bindings.json")
+        with open(file_path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return constants.DEFAULT_KEY_BINDINGS
+
+def run_for(window, seconds):
+    """Runs Tkinter's event loop for a number of seconds
+
+    Parameters:
+        window (Tk): The window whose event loop is run
+        seconds (float): How long to run the event loop for
+    """
+
+    window.after(int(seconds * 1000), window.quit)
+    window.mainloop()
+
+def press_key(window, key):
+    """Presses a key on the canvas that is being shown in the window
+
+    Parameters:
+        window (Tk): The window that the canvas is in
+        key (str): The name of the key
+    """
+
+    canvas = window.pack_slaves()[0]
+    canvas.focus_force()
+    canvas.event_generate(f"<KeyPress-{key}>")
+
+def measure_screen(moves_down, key_bindings, counter, seconds=DEFAULT_SECONDS):
+    """Shows a screen from the main menu, leaves it idle and measures how busy the program is
+
+    Parameters:
+        moves_down (int): How many times the menu pointer is moved down before confirming,
+                          or None to stay on the main menu
+        key_bindings (dict[str: str]): The key bindings that the main menu uses
+        counter (List[int]): The counter returned by count_timer_callbacks()
+        seconds (float) (default 5.0): How long the screen is left idle for
+
+    Returns:
+        cpu_per_second (float): The CPU time used per second of idling in seconds
+        callbacks_per_second (float): The number of timer callbacks run per second of idling
+    """
+
+    # Creates the window and the main menu, and lets the main menu finish starting up.
+    window = create_window(constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
+    MainMenu(window)
+    run_for(window, SETTLE_SECONDS)
+
+    # Shows the screen and lets it settle.
+    if moves_down is not None:
+        for _ in range(moves_down):
+            press_key(window, key_bindings["Move Menu Pointer Down"])
+        press_key(window, key_bindings["Confirm Option"])
+        run_for(window, SETTLE_SECONDS)
+
+    # Measures the CPU time used and the callbacks that run whilst the screen is idle.
+    # The callback that stops the event loop is not counted.
+    callbacks = counter[0]
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    run_for(window, seconds)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+    callbacks = counter[0] - callbacks - 1
+
+    window.destroy()
+    return cpu_time / wall_time, callbacks / wall_time
+
+def main():
+    """Prints how much CPU time and how many timer callbacks each non-game screen uses whilst
+    it is idle, which should both be close to zero"""
+
+    parser = argparse.ArgumentParser(description="Measures how busy the non-game screens are "
+                                                 "whilst nothing is happening.")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS,
+                        help="how long each screen is left idle for")
+    arguments = parser.parse_args()
+
+    counter = count_timer_callbacks()
+    key_bindings = load_key_bindings()
+
+    for name, moves_down in SCREENS.items():
+        cpu_per_second, callbacks_per_second = measure_screen(moves_down, key_bindings, counter,
+                                                              arguments.seconds)
+        print(f"{name:>12}: {cpu_per_second * 1000:6.2f} ms CPU per second "
+              f"({cpu_per_second * 100:5.2f}%), {callbacks_per_second:5.1f} timer callbacks "
+              "per second")
+
+if __name__ == "__main__":
+    main()
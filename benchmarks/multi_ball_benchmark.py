@@ -0,0 +1,88 @@
+import math
+import os
+import random
+import sys
+import time
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+import constants
+from world import World
+
+# The numbers of balls that are benchmarked.
+BALL_COUNTS = [1, 50, 200]
+
+# The number of frames that are simulated for each number of balls.
+FRAMES = 600
+
+def fill_with_balls(world, count):
+    """Splits the world's balls until it has the given number of balls, with each new ball
+    at a random position below the bricks and travelling in a random direction
+
+    Parameters:
+        world (World): The world to add balls to
+        count (int): How many balls the world should have
+    """
+
+    while len(world.balls) < count:
+        ball = world.split_ball(world.ball)
+        angle = random.uniform(0, 2 * math.pi)
+        ball.x_velocity = ball.speed * math.cos(angle)
+        ball.y_velocity = ball.speed * math.sin(angle)
+        ball.left_x = random.uniform(0, world.width - 2 * ball.radius)
+        ball.top_y = random.uniform(world.height / 2, world.height * 0.7)
+        ball.right_x = ball.left_x + 2 * ball.radius
+        ball.bottom_y = ball.top_y + 2 * ball.radius
+
+def benchmark_balls(count, frames=FRAMES):
+    """Simulates frames of a multi-ball game that is kept topped up with the given number of
+    balls and returns the average and worst time that each frame took
+
+    Parameters:
+        count (int): How many balls are kept in play
+        frames (int) (default 600): How many frames to simulate
+
+    Returns:
+        time_per_frame (float): The average time each frame took in seconds
+        worst_frame (float): The longest time a frame took in seconds
+    """
+
+    # Creates a multi-ball world with lots of lives so that the game doesn't end during the
+    # benchmark. The same random positions are used every time the benchmark is run.
+    random.seed(0)
+    world = World(lives=frames, multi_ball=True)
+    fill_with_balls(world, count)
+
+    # Simulates the frames and times each of them.
+    frame_times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        lost_life, level_cleared = world.step()
+        frame_times.append(time.perf_counter() - start)
+
+        # Keeps the game on level 1 so that the balls don't get faster as levels are cleared,
+        # and tops the balls back up after they are lost. This isn't timed.
+        if level_cleared:
+            world.level = 1
+            world.create_new_ball()
+        fill_with_balls(world, count)
+
+    return sum(frame_times) / frames, max(frame_times)
+
+def main():
+    """Prints how long a frame takes for each number of balls compared to the frame budget"""
+
+    # Frame budget at 60 frames per second.
+    budget = 1 / constants.PHYSICS_STEPS_PER_SECOND
+    print(f"Frame budget: {budget * 1e3:.2f} ms")
+
+    for count in BALL_COUNTS:
+        time_per_frame, worst_frame = benchmark_balls(count)
+        print(f"{count:>4} balls: {time_per_frame * 1e3:6.2f} ms/frame average, "
+              f"{worst_frame * 1e3:6.2f} ms worst, "
+              f"{'within' if worst_frame < budget else 'OVER'} budget")
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,76 @@
 import math
 import random
+import time
+from collision import circle_rectangle_contact, circle_rectangle_time_of_impact, reflect
 import constants
+from tracer import TRACER
 
 class Ball:
     """A class that represents the ball of the game"""
 
-    def __init__(self, canvas, paddle, bricks, level, x_velocity=0.0,
+    def __init__(self, canvas_width, canvas_height, paddle, bricks, level, x_velocity=0.0,
                  y_velocity=constants.DEFAULT_BALL_SPEED,
                  bounces_until_speed_up=constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP,
                  speed_up_amount=constants.DEFAULT_SPEED_UP_AMOUNT,
                  radius=constants.DEFAULT_BALL_RADIUS, paddle_gap=constants.DEFAULT_PADDLE_GAP,
-                 colour=constants.DEFAULT_BALL_COLOUR):
-        """Initialises Ball and creates a sphere on the canvas centred horizontally
-        and slightly above the paddle to represent this
+                 colour=constants.DEFAULT_BALL_COLOUR, original_bounces_until_speed_up=None,
+                 rng=None):
+        """Initialises Ball and positions it centred horizontally and slightly above the paddle
+
+        The ball doesn't draw itself, so it can be used without a window.
 
         Parameters:
-            canvas (Canvas): The canvas that the ball will be drawn on
+            canvas_width (int): The width of the canvas that the ball moves within
+            canvas_height (int): The height of the canvas that the ball moves within
             paddle (Paddle): The paddle is being used in the game
-            bricks (List[Brick]): A list that contains the Brick objects in the game
+            bricks (BrickField): The brick field that contains the bricks in the game
             level (int): The level of the game
-            x_velocity (float) (default 0.0): The initial velocity of the ball
-                                              in the x direction (can be negative)
-            y_velocity (float) (default 8.0): The initial velocity of the ball
-                                              in the y direction (can be negative)
+            x_velocity (float) (default 0.0): The initial velocity of the ball in pixels per
+                                              second in the x direction (can be negative)
+            y_velocity (float) (default 480.0): The initial velocity of the ball in pixels per
+                                                second in the y direction (can be negative)
             bounces_until_speed_up (int) (default 3): How many times the ball has to
                                                       bounce off the paddle to speed the ball up
-            speed_up_amount (float) (default 1.0): How much the ball should speed up by when it does
+            speed_up_amount (float) (default 60.0): How much the ball should speed up by
+                                                    (in pixels per second) when it does
             radius (int) (default 8): The radius of the ball
             paddle_gap (int) (default 100): The initial gap between the top of the paddle
                                             and the bottom of the ball
             colour (str) (default "white"): The colour of the ball.
                                             This can be in the form "#RRGGBB"
                                             or any locally defined standard colour name.
+            original_bounces_until_speed_up (int) (default None): What bounces_until_speed_up
+                                                                  is reset to after the ball
+                                                                  speeds up.
+                                                                  If None, this is worked out
+                                                                  from the level.
+            rng (Random) (default None): The random number generator used when the ball
+                                         bounces off the paddle, so that a game can be
+                                         reproduced from its seed.
+                                         If None, the random module's shared generator is used.
         """
 
         # Assigns values to the object's attributes based on the arguments to the initialiser.
-        self.__canvas = canvas
+        self.__canvas_width = canvas_width
+        self.__canvas_height = canvas_height
         self.__paddle = paddle
         self.__bricks = bricks
         self.__x_velocity = x_velocity
         self.__y_velocity = y_velocity
         self.__speed = math.sqrt(x_velocity**2 + y_velocity**2)
-        self.__original_bounces_until_speed_up = max(1, constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP
-                                                        - level + 1)
+        self.__original_bounces_until_speed_up = original_bounces_until_speed_up
+
+        # If the number of bounces to reset to after speeding up wasn't given, then work it out
+        # from the level so that the ball speeds up more often in further levels.
+        if original_bounces_until_speed_up is None:
+            self.__original_bounces_until_speed_up = max(1,
+                                                         constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP
+                                                         - level + 1)
         self.__bounces_until_speed_up = bounces_until_speed_up
         self.__speed_up_amount = speed_up_amount
         self.__radius = radius
-
-        # Gets the canvas's width.
-        canvas_width = canvas.winfo_reqwidth()
+        self.__colour = colour
+        self.__random = rng if rng is not None else random
 
         # Calculates the x and y coordinates for the top, bottom, left and right edges of the ball
         # (if you place a square around it).
@@ -59,33 +81,85 @@ class Ball:
         self.__right_x = int(canvas_width/2 + radius)
         self.__bottom_y = int(paddle.top_y - paddle_gap + radius)
 
-        # Creates a white circle at the coordinates calculated that represents the ball
-        # and stores the object ID of the ball.
-        self.__id = canvas.create_oval(self.__left_x, self.__top_y, self.__right_x, self.__bottom_y,
-                                     fill=colour)
+        # Stores the x and y coordinates of the left and top edges of the ball before it last
+        # moved, so that it can be drawn in between where it was and where it is.
+        self.__previous_left_x = self.__left_x
+        self.__previous_top_y = self.__top_y
 
-    def move(self):
-        """Causes the ball to move based on its velocity
+        # Stores a list that is reused every substep to hold the indices of the bricks near
+        # the ball, so that moving the ball doesn't allocate a new list each time.
+        self.__nearby_bricks = []
+
+    def move(self, timestep=1 / constants.PHYSICS_STEPS_PER_SECOND):
+        """Causes the ball to move based on its velocity for a number of seconds
 
         This also checks if the ball collides with anything relevant (bricks, paddle, walls)
         and calls the relevant functions to deal with this.
+        If the ball is moving fast, the movement is split into smaller substeps of at most
+        constants.MAX_BALL_SUBSTEP_DISTANCE pixels so that it can't pass through the paddle
+        or bricks without colliding with them.
+
+        Parameters:
+            timestep (float) (default 1/60): The number of seconds that the ball moves for
 
         Returns:
-            new_lives (int): The number of lives the user has after the ball has moved
+            lose_life (bool): Whether the user should lose a life after the ball has moved
+            score (int): The score the player gained from destroying any bricks
         """
 
-        # Moves the ball according to its speed.
-        self.__canvas.move(self.__id, self.__x_velocity, self.__y_velocity)
+        # Stores where the ball was before it moved.
+        self.__previous_left_x = self.__left_x
+        self.__previous_top_y = self.__top_y
+
+        # Calculates how many substeps the movement needs to be split into so that the ball
+        # moves at most constants.MAX_BALL_SUBSTEP_DISTANCE pixels in each direction per substep.
+        substeps = max(1, math.ceil(max(abs(self.__x_velocity), abs(self.__y_velocity))
+                                    * timestep / constants.MAX_BALL_SUBSTEP_DISTANCE))
 
-        # Updates the x and y coordinates of the top, bottom, left and right edges of the ball.
-        self.__left_x = self.__canvas.coords(self.__id)[0]
-        self.__top_y = self.__canvas.coords(self.__id)[1]
-        self.__right_x = self.__canvas.coords(self.__id)[2]
-        self.__bottom_y = self.__canvas.coords(self.__id)[3]
+        # Stores whether the user should lose a life and the score the player gained
+        # from destroying any bricks.
+        lose_life = False
+        score = 0
+
+        # Moves the ball one substep at a time.
+        # The velocity is read again for each substep as it changes when the ball bounces.
+        # A while loop is used instead of a range so that moving the ball doesn't allocate
+        # anything.
+        duration = timestep / substeps
+        while substeps:
+            lose_life, substep_score = self.__move_substep(duration)
+            score += substep_score
+            substeps -= 1
+
+            # If the ball went past the bottom of the canvas, then stop moving it.
+            if lose_life:
+                break
+
+        # Returns whether the user should lose a life or not after the ball moved
+        # and the score the player gained from destroying any bricks.
+        return lose_life, score
+
+    def __move_substep(self, duration):
+        # Moves the ball by its velocity for the number of seconds passed in, resolves any
+        # collisions, and returns whether the user should lose a life and any score the
+        # player gained.
+
+        # Moves the ball according to its speed, bouncing it off and destroying any bricks
+        # that it hits on the way in the order that it hits them.
+        # Stores the score the player gained from destroying any bricks.
+        # The movement is only timed when tracing is enabled as it happens every substep.
+        x_distance = self.__x_velocity * duration
+        y_distance = self.__y_velocity * duration
+        if TRACER.enabled:
+            start = time.perf_counter()
+            score = self.__check_brick_collisions(x_distance, y_distance)
+            TRACER.add_span("Ball.check_brick_collisions", start)
+        else:
+            score = self.__check_brick_collisions(x_distance, y_distance)
 
         # Gets the canvas's width and height.
-        canvas_width = self.__canvas.winfo_reqwidth()
-        canvas_height = self.__canvas.winfo_reqheight()
+        canvas_width = self.__canvas_width
+        canvas_height = self.__canvas_height
 
         # If the ball moves past the left side of the canvas
         # then reverse its x direction and move it to be within the canvas.
@@ -93,8 +167,6 @@ class Ball:
             self.__x_velocity = -self.__x_velocity
             self.__left_x = 0
             self.__right_x = 2 * self.__radius
-            self.__canvas.coords(self.__id, self.__left_x, self.__top_y, self.__right_x,
-                                 self.__bottom_y)
 
         # If the ball moves past the right side of the canvas
         # then reverse its x direction and move it to be within the canvas.
@@ -102,8 +174,6 @@ class Ball:
             self.__x_velocity = -self.__x_velocity
             self.__left_x = canvas_width - 2 * self.__radius
             self.__right_x = canvas_width
-            self.__canvas.coords(self.__id, self.__left_x, self.__top_y, self.__right_x,
-                                 self.__bottom_y)
 
         # If the ball moves past the top side of the canvas
         # then reverse its y direction and move it to be within the canvas.
@@ -111,8 +181,6 @@ class Ball:
             self.__y_velocity = -self.__y_velocity
             self.__top_y = 0
             self.__bottom_y = 2 * self.__radius
-            self.__canvas.coords(self.__id, self.__left_x, self.__top_y, self.__right_x,
-                                 self.__bottom_y)
 
         # Stores whether the user should lose a life or not
         # and is returned at the end of the function.
@@ -126,37 +194,40 @@ class Ball:
             # Changes the return value to make the user to lose a life and reset the ball.
             lose_life = True
 
-        # Gets a list of object IDs that the ball is overlapping with.
-        overlapping_objects = self.__canvas.find_overlapping(self.__left_x, self.__top_y,
-                                                             self.__right_x, self.__bottom_y)
+        # Checks whether the ball touches the paddle, and gets the contact normal if it does.
+        # The ball is above the paddle for most of the game, so that is checked first as it
+        # only needs one comparison.
+        paddle = self.__paddle
+        if self.__bottom_y < paddle.top_y:
+            contact = None
+        else:
+            contact = circle_rectangle_contact(self.__left_x + self.__radius,
+                                               self.__top_y + self.__radius, self.__radius,
+                                               paddle.left_x, paddle.top_y, paddle.right_x,
+                                               paddle.bottom_y)
 
         # If the ball hits the paddle then calculate the new direction of the ball
-        # based on which edge the ball hit the paddle.
-        if self.__paddle.id in overlapping_objects:
-
-            # If the ball hit the paddle's left or right side then reverse the ball's x direction.
-            if ((self.__left_x < self.__paddle.left_x
-                    and self.__x_velocity > 0)
-                    or (self.__right_x > self.__paddle.right_x
-                        and self.__x_velocity < 0)):
-                self.__x_velocity = -self.__x_velocity
+        # based on which edge of the paddle the contact normal points out of.
+        if contact is not None:
+            normal_x, normal_y, _ = contact
+
+            # If the ball hit the paddle's left or right side whilst moving towards it,
+            # then reverse the ball's x direction.
+            if abs(normal_x) > abs(normal_y):
+                if normal_x * self.__x_velocity < 0:
+                    self.__x_velocity = -self.__x_velocity
 
             # If the ball hit the paddle's top side then call a subroutine
             # that calculates how the ball should be rebounded.
-            elif (self.__top_y < self.__paddle.top_y
-                and self.__y_velocity > 0):
-                self.__bounce_ball_off_paddle()
+            elif normal_y < 0:
+                if self.__y_velocity > 0:
+                    self.__bounce_ball_off_paddle()
 
             # If the ball hit the paddle's bottom side (somehow)
             # then reverse the ball's y direction.
-            elif (self.__bottom_y > self.__paddle.bottom_y
-                and self.__y_velocity < 0):
+            elif self.__y_velocity < 0:
                 self.__y_velocity = -self.__y_velocity
 
-        # Checks for any collisions with bricks and resolves them.
-        # Stores the score the player gained from destroying any bricks.
-        score = self.__check_brick_collisions(overlapping_objects)
-
         # Returns whether the user should lives or not after the ball moved
         # and the score the player gained from destroying any bricks.
         return lose_life, score
@@ -186,29 +257,29 @@ class Ball:
         # If the ball was travelling at a very gradual angle
         # then randomly generate an offset to make it less gradual.
         if 0 <= ball_angle <= 20:
-            random_angle_change = random.uniform(-45, -20)
+            random_angle_change = self.__random.uniform(-45, -20)
         elif 160 <= ball_angle <= 180:
-            random_angle_change = random.uniform(20, 45)
+            random_angle_change = self.__random.uniform(20, 45)
 
         # If the ball was travelling at a very steep angle
         # then randomly generate an offset to make it less steep.
         elif 80 <= ball_angle <= 100:
-            random_angle_change = random.uniform(-45, 45)
+            random_angle_change = self.__random.uniform(-45, 45)
 
             # Keeps on generating random offsets until one is generated
             # that is either in the range [-45, -20] or [20, 45].
             while -20 < random_angle_change < 20:
-                random_angle_change = random.uniform(-45, 45)
+                random_angle_change = self.__random.uniform(-45, 45)
 
         # If the ball was travelling from left to right then randomly generate an offset
         # to make it more likely that it will rebound in the same direction.
         elif ball_angle >= 90:
-            random_angle_change = random.uniform(-30, 10)
+            random_angle_change = self.__random.uniform(-30, 10)
 
         # If the ball was travelling from right to left then randomly generate an offset
         # to make it more likely that it will rebound in the same direction.
         else:
-            random_angle_change = random.uniform(-10, 30)
+            random_angle_change = self.__random.uniform(-10, 30)
 
         # Causes the random offset to be scaled to a greater value the further away the ball was
         # from the paddle's centre when it hit the paddle.
@@ -243,166 +314,102 @@ class Ball:
         self.__y_velocity = -(self.__speed * math.sin(ball_angle))
 
         # Moves the ball to be right above the paddle in the same x coordinates.
-        self.__canvas.coords(self.__id, self.__left_x, self.__paddle.top_y - 2 * self.__radius,
-                             self.__right_x, self.__paddle.top_y)
-
-    def __check_brick_collisions(self, overlapping_objects):
-        # Checks for any collisions with bricks, resolves them
-        # and returns any score the player gained from destoying any bricks.
-
-        # Stores the Brick objects that were hit by the ball and need to be removed.
-        # This is done outside of the loop to ensure that all bricks are iterated over properly.
-        bricks_to_delete = []
-
-        # Iterates over all the Brick objects.
-        for brick in self.__bricks:
-
-            # If the ball collided with the brick then bounce the ball off of the brick
-            # and then remove the brick from the game.
-            if brick.id in overlapping_objects:
-
-                # Stores how in the ball is overlapping with each edge of the brick
-                # (if the ball is overlapping with that edge of the brick)
-                collision_depth = {}
-
-                # If the ball collided with the left side of the brick
-                # then store how far in it collided with that side of the brick.
-                if (self.__left_x < brick.left_x
-                        and self.__x_velocity > 0):
-                    collision_depth["left"] = self.__right_x - brick.left_x
-
-                # If the ball collided with the right side of the brick
-                # then store how far in it collided with that side of the brick.
-                if (self.__right_x + self.__radius > brick.right_x
-                        and self.__x_velocity < 0):
-                    collision_depth["right"] = brick.right_x - self.__left_x
-
-                # If the ball collided with the top side of the brick
-                # then store how far in it collided with that side of the brick.
-                if (self.__top_y + self.__radius < brick.top_y
-                        and self.__y_velocity > 0):
-                    collision_depth["top"] = self.__bottom_y - brick.top_y
-
-                # If the ball collided with the bottom side of the brick
-                # then store how far in it collided with that side of the brick.
-                if(self.__bottom_y + self.__radius > brick.bottom_y
-                        and self.__y_velocity < 0):
-                    collision_depth["bottom"] = brick.bottom_y - self.__top_y
-
-                # Appends the Brick object and its collision depth in relevant directions
-                # to the list of bricks that are to be removed.
-                # The collision depths are stored to calculate which way the ball should bounce off.
-                bricks_to_delete.append((brick, collision_depth))
-
-        # If the ball hit 3 bricks, then reverse its x and y velocity so that
-        # it goes back the way it came.
-        # It compares to >= in case the ball somehow manages to hit more than 3 bricks.
-        if len(bricks_to_delete) >= 3:
-            self.__x_velocity = -self.__x_velocity
-            self.__y_velocity = -self.__y_velocity
-
-        # If the ball hit 2 bricks, then check if the bricks are in the same column or the same row.
-        elif len(bricks_to_delete) == 2:
-
-            # If the bricks are in the same column, then reverse the ball's x velocity.
-            if bricks_to_delete[0][0].left_x == bricks_to_delete[1][0].left_x:
-                self.__x_velocity = -self.x_velocity
-
-            # If the bricks are in the same row, then reverse the ball's y velocity.
-            elif bricks_to_delete[0][0].top_y == bricks_to_delete[1][0].top_y:
-                self.__y_velocity = -self.__y_velocity
-
-            # If the bricks aren't in the same row or column then that must mean that
-            # they are diagonally adjacent and the ball hit the corner joining them,
-            # so reverse the ball's x and y velocity.
-            else:
-                self.__x_velocity = -self.__x_velocity
-                self.__y_velocity = -self.__y_velocity
-
-        # If the ball hit 1 brick, then check how many edges of the brick that the ball
-        # collided with.
-        elif len(bricks_to_delete) == 1:
-
-            # If the ball only collided with 1 edge of the brick, then change its velocity
-            # depending on the edge hit.
-            if len(bricks_to_delete[0][1]) == 1:
-
-                # If the ball collided with the left or right edge of the brick,
-                # then reverse its x velocity.
-                if list(bricks_to_delete[0][1])[0] in ("left", "right"):
-                    self.__x_velocity = -self.__x_velocity
-
-                # If the ball collided with the top or bottom edge of the brick,
-                # then reverse its y velocity.
-                elif list(bricks_to_delete[0][1])[0] in ("top", "bottom"):
-                    self.__y_velocity = -self.__y_velocity
-
-            # If the ball collided with more than 1 edge, then change its velocity based on the edge
-            # it collided least deeply with.
-            else:
-
-                # Stores the lowest depth that the ball collided into an edge with.
-                lowest_collision_depth = None
-
-                # Stores the edge that the ball collided with the lowest depth.
-                direction = None
-
-                # Iterates over the edges that the ball collided with.
-                for key in bricks_to_delete[0][1]:
-
-                    # If a lowest depth hasn't been stored yet, then store this depth and edge
-                    # as the lowest depth.
-                    if lowest_collision_depth is None:
-                        lowest_collision_depth = bricks_to_delete[0][1][key]
-                        direction = key
-
-                    # Otherwise check that the collision depth for this edge is lower
-                    # than the current lowest collision depth.
-                    else:
-
-                        # If the collision depth for this edge is lower than the current lowest
-                        # collision depth, then store this depth and edge as the lowest depth.
-                        if bricks_to_delete[0][1][key] < lowest_collision_depth:
-                            lowest_collision_depth = bricks_to_delete[0][1][key]
-                            direction = key
-
-                # If the ball had the lowest collision depth with the left or right
-                # edge of the brick, then reverse its x velocity.
-                if direction in ("left", "right"):
-                    self.__x_velocity = -self.__x_velocity
-
-                # If the ball had the lowest collision depth with the top or bottom
-                # edge of the brick, then reverse its y velocity.
-                elif direction in ("top", "bottom"):
-                    self.__y_velocity = -self.__y_velocity
+        self.__top_y = self.__paddle.top_y - 2 * self.__radius
+        self.__bottom_y = self.__paddle.top_y
+
+    def __check_brick_collisions(self, x_distance, y_distance):
+        # Moves the ball by the distances passed in, resolving any collisions with bricks in
+        # the order that the ball hits them, and returns any score the player gained from
+        # destroying any bricks.
+        # When the ball hits a brick, it bounces off the brick and destroys it, and then
+        # carries on in its new direction for the rest of the distance. Each brick is hit
+        # at most once, so this only loops once for each brick that is actually hit.
+
+        # Gets the radius of the ball and the edges of its bounding box.
+        # Local variables are used whilst the ball moves as they are faster than attributes.
+        radius = self.__radius
+        left_x = self.__left_x
+        top_y = self.__top_y
+        right_x = self.__right_x
+        bottom_y = self.__bottom_y
 
         # Stores the score the player gained from destroying any bricks.
         score = 0
 
-        # Iterates over the Brick objects that were hit by the ball.
-        for brick in bricks_to_delete:
+        while True:
 
-            # Adds the brick's score value to the score that the user wil gain.
-            score += brick[0].score
-
-            # Removes the brick from the canvas.
-            self.__canvas.delete(brick[0].id)
-
-            # Removes the Brick object from the list of all Brick objects in the game.
-            self.__bricks.remove(brick[0])
-
-        # Returns how much score the player gained from destroying any bricks.
-        return score
-
-    @property
-    def id(self):
-        """(int): The object ID of the ball when it is created on the canvas"""
-
-        return self.__id
+            # Gets the edges of the box that the ball's bounding box sweeps through whilst it
+            # moves the rest of the distance.
+            if x_distance < 0:
+                sweep_left_x = left_x + x_distance
+                sweep_right_x = right_x
+            else:
+                sweep_left_x = left_x
+                sweep_right_x = right_x + x_distance
+            if y_distance < 0:
+                sweep_top_y = top_y + y_distance
+                sweep_bottom_y = bottom_y
+            else:
+                sweep_top_y = top_y
+                sweep_bottom_y = bottom_y + y_distance
+
+            # Finds the brick that the ball hits first and when it hits it, and the contact
+            # normal. Only the bricks that overlap with the swept box are checked, and they are
+            # found using the brick field's grid, so bricks far away from the ball aren't checked.
+            # The indices of the bricks are put in the ball's scratch list, so looking for them
+            # doesn't allocate anything.
+            first_impact = None
+            first_index = None
+            bricks = self.__bricks
+            indices = bricks.overlapping_indices(sweep_left_x, sweep_top_y, sweep_right_x,
+                                                 sweep_bottom_y, self.__nearby_bricks)
+            if indices:
+                centre_x = left_x + radius
+                centre_y = top_y + radius
+                for index in indices:
+                    impact = circle_rectangle_time_of_impact(centre_x, centre_y, radius,
+                                                             x_distance, y_distance,
+                                                             bricks.left_x(index),
+                                                             bricks.top_y(index),
+                                                             bricks.right_x(index),
+                                                             bricks.bottom_y(index))
+                    if impact is not None and (first_impact is None
+                                               or impact[0] < first_impact[0]):
+                        first_impact = impact
+                        first_index = index
+
+            # If the ball doesn't hit any bricks, then move it the rest of the distance by
+            # updating the x and y coordinates of the top, bottom, left and right edges of
+            # the ball.
+            if first_impact is None:
+                self.__left_x = left_x + x_distance
+                self.__top_y = top_y + y_distance
+                self.__right_x = right_x + x_distance
+                self.__bottom_y = bottom_y + y_distance
+                return score
+
+            # Otherwise, move the ball to where it hits the brick.
+            impact_time, normal_x, normal_y = first_impact
+            left_x += x_distance * impact_time
+            top_y += y_distance * impact_time
+            right_x += x_distance * impact_time
+            bottom_y += y_distance * impact_time
+
+            # Bounces the ball's velocity and the rest of the distance off the brick.
+            self.__x_velocity, self.__y_velocity = reflect(self.__x_velocity, self.__y_velocity,
+                                                           normal_x, normal_y)
+            x_distance, y_distance = reflect(x_distance * (1 - impact_time),
+                                             y_distance * (1 - impact_time), normal_x, normal_y)
+
+            # Adds the brick's score value to the score that the user will gain and destroys
+            # the brick in the brick field of all the bricks in the game.
+            score += bricks.score(first_index)
+            bricks.remove(first_index)
 
     @property
     def x_velocity(self):
-        """(float): The velocity of the ball in the x direction (can be negative)"""
+        """(float): The velocity of the ball in pixels per second in the x direction
+        (can be negative)"""
 
         return self.__x_velocity
 
@@ -413,7 +420,8 @@ class Ball:
 
     @property
     def y_velocity(self):
-        """(float): The velocity of the ball in the y direction (can be negative)"""
+        """(float): The velocity of the ball in pixels per second in the y direction
+        (can be negative)"""
 
         return self.__y_velocity
 
@@ -424,7 +432,8 @@ class Ball:
 
     @property
     def speed(self):
-        """(float): The speed of the ball, or the magnitude of the ball's velocity"""
+        """(float): The speed of the ball in pixels per second, or the magnitude of the ball's
+        velocity"""
 
         return self.__speed
 
@@ -442,7 +451,7 @@ class Ball:
 
     @property
     def speed_up_amount(self):
-        """(float): How much the ball will speed up by when it does"""
+        """(float): How much the ball will speed up by (in pixels per second) when it does"""
 
         return self.__speed_up_amount
 
@@ -462,6 +471,7 @@ class Ball:
     def left_x(self, value):
 
         self.__left_x = value
+        self.__previous_left_x = value
 
     @property
     def top_y(self):
@@ -473,6 +483,21 @@ class Ball:
     def top_y(self, value):
 
         self.__top_y = value
+        self.__previous_top_y = value
+
+    @property
+    def previous_left_x(self):
+        """(float): The x coordinate of the left edge of the ball before it last moved
+        (the same as left_x if it was put somewhere by setting left_x)"""
+
+        return self.__previous_left_x
+
+    @property
+    def previous_top_y(self):
+        """(float): The y coordinate of the top edge of the ball before it last moved
+        (the same as top_y if it was put somewhere by setting top_y)"""
+
+        return self.__previous_top_y
 
     @property
     def right_x(self):
@@ -501,7 +526,7 @@ class Ball:
         """(str): The colour of the ball in the form #RRGGBB
         or any locally defined standard colour name"""
 
-        return self.__canvas.itemcget(self.__id, "fill")
+        return self.__colour
 
     @property
     def paddle_gap(self):
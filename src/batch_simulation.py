@@ -0,0 +1,593 @@
+import numpy as np
+import constants
+
+class BatchSimulation:
+    """A class that simulates many independent games of Breakout at once using NumPy arrays
+
+    The ball positions and velocities, paddle positions and which bricks are alive in every game
+    are stored in arrays, and one call to step() advances all of the games by one tick using
+    the same wall, paddle and brick rules as Ball and World. No Tkinter is used, so this is
+    meant for balancing and regression testing rather than playing.
+
+    Methods:
+        step(paddle_directions): Advances every game that isn't over by one tick
+        tracking_paddle_directions(): Returns the directions a simple bot would move the paddles
+    """
+
+    def __init__(self, games, level=constants.DEFAULT_STARTING_LEVEL,
+                 lives=constants.DEFAULT_STARTING_LIVES, width=constants.WINDOW_WIDTH,
+                 height=constants.WINDOW_HEIGHT, level_scaling=constants.DEFAULT_LEVEL_SCALING,
+                 seed=None):
+        """Initialises BatchSimulation and creates the paddle, ball and bricks for every game
+
+        Parameters:
+            games (int): How many games to simulate at once
+            level (int) (default 1): The level every game starts on
+            lives (int) (default 3): The number of lives every game starts with
+            width (int) (default 800): The width of the area the games are played in
+            height (int) (default 500): The height of the area the games are played in
+            level_scaling (float) (default 1.2): How many times faster the ball's speed and
+                                                 speed up amount get each level
+            seed (int) (default None): The seed for the random number generator used when
+                                       the balls bounce off the paddles
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__games = games
+        self.__width = width
+        self.__height = height
+        self.__level_scaling = level_scaling
+        self.__rng = np.random.default_rng(seed)
+
+        # Stores the size of the paddles and balls, which are the same in every game.
+        self.__radius = constants.DEFAULT_BALL_RADIUS
+        self.__paddle_width = constants.DEFAULT_PADDLE_WIDTH
+        self.__paddle_top_y = height - constants.DEFAULT_CANVAS_GAP - constants.DEFAULT_PADDLE_HEIGHT
+        self.__paddle_bottom_y = height - constants.DEFAULT_CANVAS_GAP
+
+        # Stores the lives, score and level of each game and whether each game is over.
+        self.__lives = np.full(games, lives, dtype=np.int64)
+        self.__score = np.zeros(games, dtype=np.int64)
+        self.__level = np.full(games, level, dtype=np.int64)
+        self.__game_over = np.zeros(games, dtype=bool)
+
+        # Stores how many ticks each game has been played for and how many seconds each tick
+        # moves the paddles and balls for, in the same way as World.
+        self.__ticks = np.zeros(games, dtype=np.int64)
+        self.__timestep = 1 / constants.PHYSICS_STEPS_PER_SECOND
+
+        # Stores the x coordinate of the left edge of each paddle and how many pixels per second
+        # each paddle moves. The y coordinates of the paddles never change.
+        self.__paddle_left_x = np.zeros(games)
+        self.__paddle_speed = np.zeros(games)
+
+        # Stores the x and y coordinates of the top left of each ball's bounding box,
+        # each ball's velocity and speed (in pixels per second), and the values used to speed
+        # each ball up.
+        self.__ball_left_x = np.zeros(games)
+        self.__ball_top_y = np.zeros(games)
+        self.__x_velocity = np.zeros(games)
+        self.__y_velocity = np.zeros(games)
+        self.__speed = np.zeros(games)
+        self.__bounces_until_speed_up = np.zeros(games, dtype=np.int64)
+        self.__original_bounces_until_speed_up = np.zeros(games, dtype=np.int64)
+        self.__speed_up_amount = np.zeros(games)
+
+        # Creates the layout of the bricks, which is the same in every game, in the same way as
+        # World.create_initial_bricks().
+        colours = constants.DEFAULT_BRICK_COLOURS
+        brick_width = int(width / constants.DEFAULT_BRICKS_PER_ROW)
+        brick_height = constants.DEFAULT_BRICK_HEIGHT
+        brick_left_x = []
+        brick_top_y = []
+        brick_score = []
+        for row in range(len(colours)):
+            for x in range(0, constants.DEFAULT_BRICKS_PER_ROW * brick_width, brick_width):
+                brick_left_x.append(x)
+                brick_top_y.append(row * brick_height
+                                   + constants.DEFAULT_ROW_GAP_FROM_TOP * brick_height)
+                brick_score.append((len(colours) - row) * constants.DEFAULT_BRICK_SCORE)
+        self.__brick_left_x = np.array(brick_left_x, dtype=float)
+        self.__brick_top_y = np.array(brick_top_y, dtype=float)
+        self.__brick_right_x = self.__brick_left_x + brick_width
+        self.__brick_bottom_y = self.__brick_top_y + brick_height
+        self.__brick_score = np.array(brick_score, dtype=np.int64)
+
+        # Stores the y coordinates of the top of the highest brick and the bottom of the lowest
+        # brick, so that balls that are nowhere near the bricks can be skipped straight away.
+        self.__bricks_top_y = self.__brick_top_y.min()
+        self.__bricks_bottom_y = self.__brick_bottom_y.max()
+
+        # Stores which bricks are alive in each game (one row per game).
+        self.__bricks_alive = np.ones((games, len(brick_left_x)), dtype=bool)
+
+        # Places the paddle and ball of every game at their starting positions.
+        every_game = np.ones(games, dtype=bool)
+        self.__reset_paddles(every_game)
+        self.__create_new_balls(every_game)
+
+    def __reset_paddles(self, mask):
+        # Resets the paddles of the games in the mask back to the starting position.
+
+        self.__paddle_left_x[mask] = int(self.__width/2 - self.__paddle_width/2)
+
+    def __create_new_balls(self, mask):
+        # Resets the balls of the games in the mask back to the starting position and applies
+        # level scaling, in the same way as World.create_new_ball().
+
+        level = self.__level[mask]
+        self.__ball_left_x[mask] = int(self.__width/2 - self.__radius)
+        self.__ball_top_y[mask] = int(self.__paddle_top_y - constants.DEFAULT_PADDLE_GAP
+                                      - self.__radius)
+        self.__speed[mask] = constants.DEFAULT_BALL_SPEED * self.__level_scaling**(level - 1)
+        self.__x_velocity[mask] = 0.0
+        self.__y_velocity[mask] = self.__speed[mask]
+        self.__bounces_until_speed_up[mask] = np.maximum(1, constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP
+                                                            - level + 1)
+        self.__original_bounces_until_speed_up[mask] = self.__bounces_until_speed_up[mask]
+        self.__speed_up_amount[mask] = (constants.DEFAULT_SPEED_UP_AMOUNT
+                                        * self.__level_scaling**(level - 1))
+
+    def tracking_paddle_directions(self, dead_zone=20):
+        """Returns the directions that a simple bot would move each paddle in so that the
+        paddle's centre follows the ball's centre
+
+        Parameters:
+            dead_zone (float) (default 20): How far the ball's centre can be from the paddle's
+                                            centre before the bot moves the paddle
+
+        Returns:
+            paddle_directions (ndarray): -1 (left), 0 (stop) or 1 (right) for each game
+        """
+
+        ball_centre_x = self.__ball_left_x + self.__radius
+        paddle_centre_x = self.__paddle_left_x + self.__paddle_width/2
+        return (np.where(ball_centre_x > paddle_centre_x + dead_zone, 1, 0)
+                - np.where(ball_centre_x < paddle_centre_x - dead_zone, 1, 0))
+
+    def step(self, paddle_directions=None):
+        """Advances every game that isn't over by one tick
+
+        Parameters:
+            paddle_directions (ndarray) (default None): -1 (left), 0 (stop) or 1 (right) for
+                                                        each game's paddle.
+                                                        If None, the paddles follow the balls
+                                                        using tracking_paddle_directions().
+        """
+
+        # Only the games that aren't over are stepped.
+        playing = ~self.__game_over
+
+        # Sets each paddle's speed from the direction it should move in.
+        if paddle_directions is None:
+            paddle_directions = self.tracking_paddle_directions()
+        self.__paddle_speed = np.where(playing, paddle_directions, 0) * constants.DEFAULT_PADDLE_SPEED
+
+        # Moves each paddle and keeps it inside the canvas, in the same way as Paddle.move().
+        self.__paddle_left_x += self.__paddle_speed * self.__timestep
+        np.clip(self.__paddle_left_x, 0, self.__width - self.__paddle_width,
+                out=self.__paddle_left_x)
+
+        # Calculates how many substeps each ball's movement is split into, in the same way as
+        # Ball.move().
+        substeps = np.maximum(1, np.ceil(np.maximum(np.abs(self.__x_velocity),
+                                                    np.abs(self.__y_velocity))
+                                         * self.__timestep
+                                         / constants.MAX_BALL_SUBSTEP_DISTANCE)).astype(np.int64)
+
+        # Stores which games lost a life and how much score each game gained this tick.
+        lost_life = np.zeros(self.__games, dtype=bool)
+        score = np.zeros(self.__games, dtype=np.int64)
+
+        # Moves the balls one substep at a time. Games that have finished their substeps
+        # (or whose ball went past the bottom of the canvas) are masked out.
+        for substep in range(int(substeps[playing].max(initial=0))):
+            moving = playing & (substep < substeps) & ~lost_life
+            duration = self.__timestep / substeps
+            lost_life |= self.__move_balls(moving, duration, score)
+
+        # Adds the score gained to each game's total score, with higher level bricks being
+        # worth a higher score.
+        self.__score += self.__level * score
+        self.__ticks[playing] += 1
+
+        # Makes the games that lost a life lose a life, in the same way as World.lose_life().
+        if lost_life.any():
+            self.__lives[lost_life] -= 1
+            self.__reset_paddles(lost_life)
+            self.__create_new_balls(lost_life)
+            self.__game_over |= self.__lives <= 0
+
+        # Makes the games with no bricks left go onto the next level, in the same way as
+        # World.next_level().
+        level_cleared = playing & ~self.__bricks_alive.any(axis=1)
+        if level_cleared.any():
+            self.__level[level_cleared] += 1
+            self.__bricks_alive[level_cleared] = True
+            self.__reset_paddles(level_cleared)
+            self.__create_new_balls(level_cleared)
+
+    def __move_balls(self, moving, duration, score):
+        # Moves the balls of the games in the moving mask by their velocity for the duration,
+        # resolves collisions with the walls, paddle and bricks, adds any score gained to the
+        # score array, and returns a mask of the games whose ball went past the bottom.
+
+        # Gets the ball's radius and diameter.
+        radius = self.__radius
+        diameter = 2 * radius
+
+        # Moves the balls according to their velocities, bouncing them off and destroying any
+        # bricks that they hit on the way in the order that they hit them.
+        self.__check_brick_collisions(moving, duration, score)
+
+        # If a ball moves past the left side of the canvas then reverse its x direction and move
+        # it to be within the canvas.
+        hit_left = moving & (self.__ball_left_x < 0)
+        self.__x_velocity[hit_left] = -self.__x_velocity[hit_left]
+        self.__ball_left_x[hit_left] = 0
+
+        # If a ball moves past the right side of the canvas then reverse its x direction and move
+        # it to be within the canvas.
+        hit_right = moving & (self.__ball_left_x + diameter > self.__width)
+        self.__x_velocity[hit_right] = -self.__x_velocity[hit_right]
+        self.__ball_left_x[hit_right] = self.__width - diameter
+
+        # If a ball moves past the top side of the canvas then reverse its y direction and move
+        # it to be within the canvas.
+        hit_top = moving & (self.__ball_top_y < 0)
+        self.__y_velocity[hit_top] = -self.__y_velocity[hit_top]
+        self.__ball_top_y[hit_top] = 0
+
+        # If a ball moves past the bottom side of the canvas, then the game should lose a life.
+        lose_life = moving & (self.__ball_top_y + diameter > self.__height)
+
+        # Finds the balls whose bounding boxes reach their paddle, in the same way as Ball.move().
+        # The ball is above the paddle for most of the game, so usually only a few balls are
+        # checked exactly.
+        paddle_left_x = self.__paddle_left_x
+        near_paddle = np.flatnonzero(moving
+                                     & (self.__ball_top_y + diameter >= self.__paddle_top_y)
+                                     & (self.__ball_left_x <= paddle_left_x + self.__paddle_width)
+                                     & (self.__ball_left_x + diameter >= paddle_left_x))
+        if len(near_paddle):
+
+            # Finds which of those balls touch their paddle and the contact normals.
+            near_paddle_left_x = paddle_left_x[near_paddle]
+            touching, near_normal_x, near_normal_y = self.__circle_rectangle_contacts(
+                self.__ball_left_x[near_paddle] + radius, self.__ball_top_y[near_paddle] + radius,
+                near_paddle_left_x, self.__paddle_top_y, near_paddle_left_x + self.__paddle_width,
+                self.__paddle_bottom_y)
+            hit_paddle = np.zeros(self.__games, dtype=bool)
+            hit_paddle[near_paddle] = touching
+            normal_x = np.zeros(self.__games)
+            normal_x[near_paddle] = near_normal_x
+            normal_y = np.zeros(self.__games)
+            normal_y[near_paddle] = near_normal_y
+
+            # Works out which edge of its paddle each ball hit from the contact normal.
+            hit_side = hit_paddle & (np.abs(normal_x) > np.abs(normal_y))
+            hit_top = hit_paddle & ~hit_side & (normal_y < 0)
+            hit_bottom = hit_paddle & ~hit_side & ~hit_top
+
+            # If a ball hit its paddle's left or right side whilst moving towards it, then
+            # reverse the ball's x direction.
+            paddle_side = hit_side & (normal_x * self.__x_velocity < 0)
+            self.__x_velocity[paddle_side] = -self.__x_velocity[paddle_side]
+
+            # If a ball hit its paddle's top side then rebound it off the paddle.
+            paddle_top = hit_top & (self.__y_velocity > 0)
+            if paddle_top.any():
+                self.__bounce_balls_off_paddles(paddle_top)
+
+            # If a ball hit its paddle's bottom side (somehow) then reverse its y direction.
+            paddle_bottom = hit_bottom & (self.__y_velocity < 0)
+            self.__y_velocity[paddle_bottom] = -self.__y_velocity[paddle_bottom]
+
+        return lose_life
+
+    def __bounce_balls_off_paddles(self, mask):
+        # Rebounds the balls of the games in the mask off their paddles, in the same way as
+        # Ball.__bounce_ball_off_paddle().
+
+        # Gets the velocities of the balls that are bouncing.
+        x_velocity = self.__x_velocity[mask]
+        y_velocity = self.__y_velocity[mask]
+        count = len(x_velocity)
+
+        # Calculates the horizontal distance from each paddle's centre to its ball's centre,
+        # treating the ball's centre as being on the edge of the paddle if it is outside it.
+        paddle_centre_x = self.__paddle_left_x[mask] + self.__paddle_width/2
+        ball_centre_x = self.__ball_left_x[mask] + self.__radius
+        ball_distance_from_centre = np.minimum(np.abs(paddle_centre_x - ball_centre_x),
+                                               self.__paddle_width/2)
+
+        # Calculates the angle in degrees each ball was travelling at towards its paddle.
+        ball_angle = np.degrees(np.arctan2(y_velocity, -x_velocity))
+
+        # Generates the random offsets to the angles based on the same ranges as Ball uses.
+        # Steep angles get an offset in [-45, -20] or [20, 45], which is what Ball's rejection
+        # sampling loop produces.
+        steep_offset = self.__rng.uniform(20, 45, count) * self.__rng.choice((-1, 1), count)
+        random_angle_change = np.select(
+            [(0 <= ball_angle) & (ball_angle <= 20),
+             (160 <= ball_angle) & (ball_angle <= 180),
+             (80 <= ball_angle) & (ball_angle <= 100),
+             ball_angle >= 90],
+            [self.__rng.uniform(-45, -20, count),
+             self.__rng.uniform(20, 45, count),
+             steep_offset,
+             self.__rng.uniform(-30, 10, count)],
+            self.__rng.uniform(-10, 30, count))
+
+        # Scales each offset up to 1.5x the further the ball was from its paddle's centre.
+        random_angle_change *= (ball_distance_from_centre / (self.__paddle_width/2)) * 0.5 + 1
+
+        # Calculates each ball's new angle and keeps it in the range [20, 160].
+        ball_angle = np.radians(np.clip(180 - ball_angle + random_angle_change, 20, 160))
+
+        # Speeds up the balls that have bounced enough times and resets their counters.
+        bounces_until_speed_up = self.__bounces_until_speed_up[mask] - 1
+        speed = self.__speed[mask]
+        speed_up = bounces_until_speed_up == 0
+        speed[speed_up] += self.__speed_up_amount[mask][speed_up]
+        bounces_until_speed_up[speed_up] = self.__original_bounces_until_speed_up[mask][speed_up]
+        self.__bounces_until_speed_up[mask] = bounces_until_speed_up
+        self.__speed[mask] = speed
+
+        # Calculates the new velocities and moves the balls to be right above the paddles.
+        self.__x_velocity[mask] = speed * np.cos(ball_angle)
+        self.__y_velocity[mask] = -(speed * np.sin(ball_angle))
+        self.__ball_top_y[mask] = self.__paddle_top_y - 2 * self.__radius
+
+    def __check_brick_collisions(self, moving, duration, score):
+        # Moves the balls of the games in the moving mask by their velocities for the duration,
+        # resolving any collisions with their bricks in the order that they hit them and adding
+        # any score gained to the score array, in the same way as
+        # Ball.__check_brick_collisions().
+
+        # Gets the games whose balls are still moving and how far each of them still has to move.
+        # Games are dropped from these arrays once their ball has finished moving, so each pass
+        # only works on the balls that might still hit a brick.
+        radius = self.__radius
+        diameter = 2 * radius
+        games = np.flatnonzero(moving)
+        x_distance = self.__x_velocity[games] * duration[games]
+        y_distance = self.__y_velocity[games] * duration[games]
+
+        # Each pass moves each ball until it hits its first brick (or the whole way if it
+        # doesn't hit one), so this only loops once for each brick that a ball actually hits.
+        while len(games):
+
+            # Gets the edges of the box that each ball's bounding box sweeps through whilst it
+            # moves the rest of the distance.
+            left_x = self.__ball_left_x[games]
+            top_y = self.__ball_top_y[games]
+            sweep_top_y = top_y + np.minimum(y_distance, 0.0)
+            sweep_bottom_y = top_y + diameter + np.maximum(y_distance, 0.0)
+
+            # Moves the balls whose swept boxes don't reach the rows of bricks the whole way,
+            # as they can't hit any bricks, and stops resolving them.
+            near = (sweep_bottom_y >= self.__bricks_top_y) & (sweep_top_y <= self.__bricks_bottom_y)
+            far = ~near
+            self.__ball_left_x[games[far]] = left_x[far] + x_distance[far]
+            self.__ball_top_y[games[far]] = top_y[far] + y_distance[far]
+            if not near.any():
+                return
+            games = games[near]
+            x_distance = x_distance[near]
+            y_distance = y_distance[near]
+            left_x = left_x[near]
+            top_y = top_y[near]
+            sweep_top_y = sweep_top_y[near]
+            sweep_bottom_y = sweep_bottom_y[near]
+            sweep_left_x = left_x + np.minimum(x_distance, 0.0)
+            sweep_right_x = left_x + diameter + np.maximum(x_distance, 0.0)
+
+            # Finds the pairs of balls and alive bricks whose boxes overlap, and only checks
+            # those pairs exactly, in the same way as Ball uses the brick field's grid.
+            ball, brick = np.nonzero(self.__bricks_alive[games]
+                                     & (sweep_left_x[:, None] <= self.__brick_right_x)
+                                     & (sweep_right_x[:, None] >= self.__brick_left_x)
+                                     & (sweep_top_y[:, None] <= self.__brick_bottom_y)
+                                     & (sweep_bottom_y[:, None] >= self.__brick_top_y))
+            impact_time, normal_x, normal_y = self.__circle_rectangle_times_of_impact(
+                left_x[ball] + radius, top_y[ball] + radius, x_distance[ball], y_distance[ball],
+                self.__brick_left_x[brick], self.__brick_top_y[brick],
+                self.__brick_right_x[brick], self.__brick_bottom_y[brick])
+
+            # Finds which brick each ball hits first (one row per ball). Ties go to the brick
+            # that was added first, in the same way as Ball.
+            impact_times = np.full((len(games), len(self.__brick_score)), np.inf)
+            impact_times[ball, brick] = impact_time
+            pair = np.zeros(impact_times.shape, dtype=np.int64)
+            pair[ball, brick] = np.arange(len(ball))
+            every_ball = np.arange(len(games))
+            first_brick = np.argmin(impact_times, axis=1)
+            first_impact_time = impact_times[every_ball, first_brick]
+            first_pair = pair[every_ball, first_brick]
+            hit = np.isfinite(first_impact_time)
+
+            # Moves each ball to where it hits its first brick, or the whole way if it doesn't
+            # hit one, and stops resolving the balls that didn't hit one.
+            fraction = np.where(hit, first_impact_time, 1.0)
+            self.__ball_left_x[games] = left_x + x_distance * fraction
+            self.__ball_top_y[games] = top_y + y_distance * fraction
+            if not hit.any():
+                return
+            games = games[hit]
+            fraction = fraction[hit]
+            first_brick = first_brick[hit]
+            normal_x = normal_x[first_pair[hit]]
+            normal_y = normal_y[first_pair[hit]]
+
+            # Bounces the velocity and the rest of the distance of each ball off the brick it
+            # hit. Only the parts moving into the brick are reflected, which keeps their speed.
+            x_velocity = self.__x_velocity[games]
+            y_velocity = self.__y_velocity[games]
+            x_distance = x_distance[hit] * (1 - fraction)
+            y_distance = y_distance[hit] * (1 - fraction)
+            for x_values, y_values in ((x_velocity, y_velocity), (x_distance, y_distance)):
+                speed_along_normal = np.minimum(0.0, x_values * normal_x + y_values * normal_y)
+                x_values -= 2 * speed_along_normal * normal_x
+                y_values -= 2 * speed_along_normal * normal_y
+            self.__x_velocity[games] = x_velocity
+            self.__y_velocity[games] = y_velocity
+
+            # Adds the score of the bricks hit to each game's score and destroys them.
+            score[games] += self.__brick_score[first_brick]
+            self.__bricks_alive[games, first_brick] = False
+
+    def __circle_rectangle_times_of_impact(self, centre_x, centre_y, x_distance, y_distance,
+                                           left_x, top_y, right_x, bottom_y):
+        # Returns when each moving ball (with its centre starting at the coordinates passed in)
+        # first hits each rectangle as a fraction of its movement (or infinity if it doesn't)
+        # and the x and y components of the contact normals, in the same way as
+        # collision.circle_rectangle_time_of_impact(). The arguments are broadcast against
+        # each other.
+
+        radius = self.__radius
+        with np.errstate(divide="ignore", invalid="ignore"):
+
+            # Finds the fractions of the movement at which each centre enters and leaves each
+            # rectangle grown by the radius between its left and right edges. Centres that
+            # don't move in the x direction are either always or never between them.
+            near_x = np.where(x_distance > 0, left_x - radius, right_x + radius)
+            far_x = np.where(x_distance > 0, right_x + radius, left_x - radius)
+            between_x = (left_x - radius <= centre_x) & (centre_x <= right_x + radius)
+            enter_x = np.where(x_distance != 0, (near_x - centre_x) / x_distance,
+                               np.where(between_x, -np.inf, np.inf))
+            exit_x = np.where(x_distance != 0, (far_x - centre_x) / x_distance,
+                              np.where(between_x, np.inf, -np.inf))
+
+            # Does the same between its top and bottom edges.
+            near_y = np.where(y_distance > 0, top_y - radius, bottom_y + radius)
+            far_y = np.where(y_distance > 0, bottom_y + radius, top_y - radius)
+            between_y = (top_y - radius <= centre_y) & (centre_y <= bottom_y + radius)
+            enter_y = np.where(y_distance != 0, (near_y - centre_y) / y_distance,
+                               np.where(between_y, -np.inf, np.inf))
+            exit_y = np.where(y_distance != 0, (far_y - centre_y) / y_distance,
+                              np.where(between_y, np.inf, -np.inf))
+
+            # Gets when each centre enters each grown rectangle and the normal of the edge it
+            # enters through, and whether it is ever inside it during the movement.
+            enter_time = np.maximum(0.0, np.maximum(enter_x, enter_y))
+            exit_time = np.minimum(1.0, np.minimum(exit_x, exit_y))
+            enters_y = (enter_y > 0) & (enter_y > enter_x)
+            enters_x = (enter_x > 0) & ~enters_y
+            normal_x = np.where(enters_x, -np.sign(x_distance), 0.0)
+            normal_y = np.where(enters_y, -np.sign(y_distance), 0.0)
+            impact_time = np.where(enter_time <= exit_time, enter_time, np.inf)
+
+            # If a centre enters a grown rectangle near one of the rectangle's corners, then
+            # finds when the ball first touches that corner (if it does) instead.
+            hit_x = centre_x + x_distance * enter_time
+            hit_y = centre_y + y_distance * enter_time
+            at_corner = (~((left_x <= hit_x) & (hit_x <= right_x))
+                         & ~((top_y <= hit_y) & (hit_y <= bottom_y)))
+            offset_x = centre_x - np.where(hit_x < left_x, left_x, right_x)
+            offset_y = centre_y - np.where(hit_y < top_y, top_y, bottom_y)
+            a = x_distance * x_distance + y_distance * y_distance
+            b = offset_x * x_distance + offset_y * y_distance
+            c = offset_x * offset_x + offset_y * offset_y - radius * radius
+            corner_time = (-b - np.sqrt(b * b - a * c)) / a
+            corner_time = np.where((corner_time >= 0) & (corner_time <= 1), corner_time, np.inf)
+            impact_time = np.where(at_corner & np.isfinite(impact_time), corner_time,
+                                   impact_time)
+            normal_x = np.where(at_corner, (offset_x + x_distance * corner_time) / radius,
+                                normal_x)
+            normal_y = np.where(at_corner, (offset_y + y_distance * corner_time) / radius,
+                                normal_y)
+
+        # Balls that already touch a rectangle hit it straight away if they are moving into it,
+        # and don't hit it if they are moving away from (or along) it.
+        touching, contact_x, contact_y = self.__circle_rectangle_contacts(
+            centre_x, centre_y, left_x, top_y, right_x, bottom_y)
+        moving_in = contact_x * x_distance + contact_y * y_distance < 0
+        impact_time = np.where(touching, np.where(moving_in, 0.0, np.inf), impact_time)
+        normal_x = np.where(touching, contact_x, normal_x)
+        normal_y = np.where(touching, contact_y, normal_y)
+
+        return impact_time, normal_x, normal_y
+
+    def __circle_rectangle_contacts(self, centre_x, centre_y, left_x, top_y, right_x, bottom_y):
+        # Returns whether each ball (with its centre at the coordinates passed in) touches each
+        # rectangle and the x and y components of the contact normals, in the same way as
+        # collision.circle_rectangle_contact(). The arguments are broadcast against each other.
+
+        # Finds the point on each rectangle that is closest to each ball's centre, and the
+        # distance from it to the centre.
+        radius = self.__radius
+        x_distance = centre_x - np.clip(centre_x, left_x, right_x)
+        y_distance = centre_y - np.clip(centre_y, top_y, bottom_y)
+        distance_squared = x_distance * x_distance + y_distance * y_distance
+        touching = distance_squared <= radius * radius
+
+        # If a ball's centre is outside a rectangle, then the normal points from the closest
+        # point to the centre.
+        distance = np.sqrt(distance_squared)
+        outside = distance_squared > 0
+        safe_distance = np.where(outside, distance, 1.0)
+        normal_x = x_distance / safe_distance
+        normal_y = y_distance / safe_distance
+
+        # Otherwise, the normal points out of whichever edge the centre is closest to, with
+        # ties going to the left, right, top and bottom edges in that order. The gaps to the
+        # edges are only worked out for the centres that are inside, as there are usually few.
+        inside = ~outside
+        if inside.any():
+            normal_x = np.broadcast_to(normal_x, inside.shape).copy()
+            normal_y = np.broadcast_to(normal_y, inside.shape).copy()
+            centre_x, centre_y, left_x, top_y, right_x, bottom_y = (
+                np.broadcast_to(values, inside.shape)[inside]
+                for values in (centre_x, centre_y, left_x, top_y, right_x, bottom_y))
+            nearest_edge = np.argmin(np.stack((centre_x - left_x, right_x - centre_x,
+                                               centre_y - top_y, bottom_y - centre_y)), axis=0)
+            normal_x[inside] = np.array([-1.0, 1.0, 0.0, 0.0])[nearest_edge]
+            normal_y[inside] = np.array([0.0, 0.0, -1.0, 1.0])[nearest_edge]
+
+        return touching, normal_x, normal_y
+
+    @property
+    def games(self):
+        """(int): How many games are being simulated"""
+
+        return self.__games
+
+    @property
+    def lives(self):
+        """(ndarray): The number of lives each game has"""
+
+        return self.__lives
+
+    @property
+    def score(self):
+        """(ndarray): The score of each game"""
+
+        return self.__score
+
+    @property
+    def level(self):
+        """(ndarray): The level that each game is on"""
+
+        return self.__level
+
+    @property
+    def game_over(self):
+        """(ndarray): Whether each game is over"""
+
+        return self.__game_over
+
+    @property
+    def ticks(self):
+        """(ndarray): How many ticks each game has been played for"""
+
+        return self.__ticks
+
+    @property
+    def bricks_alive(self):
+        """(ndarray): Which bricks are alive in each game (one row per game)"""
+
+        return self.__bricks_alive
+
+if __name__ == "__main__":
+    print("Please run main.py")
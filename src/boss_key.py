@@ -1,6 +1,131 @@
 import os
-from PIL import Image, ImageTk
+import threading
 from tkinter import Canvas
+from startup_profile import STARTUP_PROFILE
+from tracer import TRACER
+
+# The boss key image.
+# Taken and modified from
+# https://commons.wikimedia.org/wiki/File:Simple_budgeting_spreadsheet_eg.jpg
+BOSS_KEY_IMAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                   "boss_key.jpg")
+
+def get_cover_size(image_width, image_height, canvas_width, canvas_height):
+    """Returns the size an image needs to be scaled to so that it covers the whole canvas
+    whilst keeping the same aspect ratio
+
+    Parameters:
+        image_width (int): The width of the image
+        image_height (int): The height of the image
+        canvas_width (int): The width of the canvas
+        canvas_height (int): The height of the canvas
+
+    Returns:
+        size (tuple[int, int]): The width and height of the scaled image
+    """
+
+    # Calculates how much the height of the image needs to be multiplied by to make the
+    # image fit the canvas's width.
+    height_scaling_factor = canvas_width / image_width
+
+    # Calculates how much the width of the image needs to be multiplied by to make the image
+    # fit the canvas's height.
+    width_scaling_factor = canvas_height / image_height
+
+    # Scales the image whilst keeping the same aspect ratio in the direction where the most
+    # scaling needs to be applied in the other direction.
+    # This is to make sure that the image covers the whole canvas whilst keeping the
+    # same aspect ratio.
+    if height_scaling_factor > width_scaling_factor:
+        return canvas_width, int(height_scaling_factor * image_height)
+    return int(width_scaling_factor * image_width), canvas_height
+
+def get_cache_path(file_path, canvas_width, canvas_height):
+    """Returns the path of the cached copy of an image resized to cover a canvas
+
+    The cached copy is stored next to the image, and its name includes the time the image was
+    last modified and the canvas's size, so changing either of them uses a new copy.
+
+    Parameters:
+        file_path (str): The path of the image
+        canvas_width (int): The width of the canvas
+        canvas_height (int): The height of the canvas
+
+    Returns:
+        cache_path (str): The path of the cached copy
+    """
+
+    modified_time = os.stat(file_path).st_mtime_ns
+    return (os.path.splitext(file_path)[0]
+            + f".{canvas_width}x{canvas_height}.{modified_time}.cache.ppm")
+
+def load_boss_key_image(canvas_width, canvas_height, file_path=BOSS_KEY_IMAGE_PATH):
+    """Returns the boss key image resized to cover a canvas
+
+    The resized image is cached on disk, so the full-size image only needs to be decoded the
+    first time. When it does, JPEG draft mode is used so that the image is decoded at a smaller
+    size if it is much bigger than the canvas. Nothing in this function uses Tkinter, so it can
+    be run on a background thread.
+
+    Parameters:
+        canvas_width (int): The width of the canvas
+        canvas_height (int): The height of the canvas
+        file_path (str) (default assets/boss_key.jpg): The path of the boss key image
+
+    Returns:
+        image (Image): The resized PIL image, or a black image if the image can't be found or
+                       can't be decoded
+    """
+
+    # Pillow takes a while to import, so it is imported here (usually on the background thread)
+    # rather than when the program starts.
+    from PIL import Image
+
+    # If the file can't be found then just create a black screen for the boss key image.
+    try:
+        cache_path = get_cache_path(file_path, canvas_width, canvas_height)
+    except FileNotFoundError:
+        return Image.new("RGB", (canvas_width, canvas_height), (0, 0, 0))
+
+    # If the image has already been resized for this canvas, then load the cached copy.
+    try:
+        image = Image.open(cache_path)
+        image.load()
+        return image
+    except OSError:
+        pass
+
+    # Otherwise, open the image and work out the size it needs to be to cover the whole canvas.
+    # If the image is corrupt or can't be read then just create a black screen for the boss
+    # key image instead, in the same way as when the file can't be found.
+    try:
+        image = Image.open(file_path)
+        size = get_cover_size(image.width, image.height, canvas_width, canvas_height)
+
+        # Asks the JPEG decoder to decode a smaller version of the image if it can without
+        # going below the size needed, which is much faster than decoding the whole image.
+        image.draft("RGB", size)
+        image = image.resize(size)
+    except OSError:
+        return Image.new("RGB", (canvas_width, canvas_height), (0, 0, 0))
+
+    # Caches the resized image, removing any copies cached for older versions of the image
+    # or other canvas sizes. The image is written to a temporary file first so that another
+    # instance of the game never reads a half-written file.
+    # If the cache can't be written, then the image is still returned.
+    try:
+        directory, file_name = os.path.split(file_path)
+        prefix = os.path.splitext(file_name)[0] + "."
+        for other_file_name in os.listdir(directory):
+            if other_file_name.startswith(prefix) and other_file_name.endswith(".cache.ppm"):
+                os.remove(os.path.join(directory, other_file_name))
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        image.save(temporary_path, "PPM")
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        pass
+
+    return image
 
 class BossKey:
     """A class that represents when the program is in the boss key state"""
@@ -15,9 +140,21 @@ class BossKey:
         self.__canvas = Canvas(window, background="#000000", width=window_width,
                                height=window_height)
 
-        # Stores a reference to the boss image.
+        # Stores a reference to the boss image once it has been created, and the PIL image that
+        # it is created from once it has been decoded.
         self.__boss_key_image = None
-        self.__load_boss_key_image()
+        self.__decoded_image = None
+
+        # Decodes the boss key image on a background thread so that it doesn't delay the
+        # main menu appearing. It is drawn by load_image(), which the main menu calls once it is
+        # idle, or when the boss key is first shown, so nothing needs to keep checking whether
+        # the thread has finished.
+        # Tkinter can only be used from the main thread, so the canvas's size is passed in.
+        self.__decoder = threading.Thread(target=self.__decode_boss_key_image,
+                                          args=(self.__canvas.winfo_reqwidth(),
+                                                self.__canvas.winfo_reqheight()),
+                                          name="BossKeyDecoder", daemon=True)
+        self.__decoder.start()
 
         # Stores the previous canvas that was being shown before the boss key was activated.
         self.__previous_canvas = None
@@ -26,49 +163,34 @@ class BossKey:
         self.__canvas.bind("<KeyPress-" + key_bindings["Boss Key"] + ">",
                            lambda event : self.hide_boss_key())
 
-    def __load_boss_key_image(self):
-        # Loads the boss key image.
+    def __decode_boss_key_image(self, canvas_width, canvas_height):
+        # Loads the boss key image resized to cover the canvas.
+        # This runs on the background thread.
 
-        # Gets the canvas's width and height.
-        canvas_width = self.__canvas.winfo_reqwidth()
-        canvas_height = self.__canvas.winfo_reqheight()
+        with TRACER.span("BossKey.decode", "startup"):
+            self.__decoded_image = load_boss_key_image(canvas_width, canvas_height)
+        STARTUP_PROFILE.mark("boss key image decoded")
 
-        # Tries to open the boss key image
-        try:
+    def load_image(self):
+        """Draws the boss key image onto the canvas if it hasn't been already, waiting for the
+        background thread to finish decoding it if necessary"""
 
-            # Taken and modified from
-            # https://commons.wikimedia.org/wiki/File:Simple_budgeting_spreadsheet_eg.jpg
-            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
-                                     "boss_key.jpg")
-            image = Image.open(file_path)
+        if self.__boss_key_image is not None:
+            return
 
-        # If the file can't be found or opened then just create a black screen for the
-        # boss key image.
-        except FileNotFoundError:
-            image = Image.new("RGB", (canvas_width, canvas_height), (0, 0, 0))
+        self.__decoder.join()
 
-        # If the image was opened successfully, then resize it to fit the whole canvas.
-        else:
-
-            # Calculates how much the height of the image needs to be multiplied by to make the
-            # image fit the canvas's width.
-            height_scaling_factor = canvas_width / image.width
-
-            # Calculates how much the width of the image needs to be multiplied by to make the image
-            # fit the canvas's height.
-            width_scaling_factor = canvas_height / image.height
-
-            # Scales the image whilst keeping the same aspect ratio in the direction where the most
-            # scaling needs to be applied in the other direction.
-            # This is to make sure that the image covers the whole canvas whilst keeping the
-            # same aspect ratio.
-            if height_scaling_factor > width_scaling_factor:
-                image = image.resize((canvas_width, int(height_scaling_factor * image.height)))
-            else:
-                image = image.resize((int(width_scaling_factor * image.width), canvas_height))
+        # If the background thread failed without decoding an image, then just use a black
+        # screen for the boss key image.
+        from PIL import Image, ImageTk
+        if self.__decoded_image is None:
+            self.__decoded_image = Image.new("RGB", (self.__canvas.winfo_reqwidth(),
+                                                     self.__canvas.winfo_reqheight()), (0, 0, 0))
 
         # Converts the PIL image into a Tkinter PhotoImage and stores a reference to this image.
-        self.__boss_key_image = ImageTk.PhotoImage(image)
+        # The background thread has usually already imported Pillow, so importing it is quick.
+        self.__boss_key_image = ImageTk.PhotoImage(self.__decoded_image)
+        self.__decoded_image = None
 
         # Creates the image onto the BossKey's canvas.
         self.__canvas.create_image(0, 0, image=self.__boss_key_image, anchor="nw")
@@ -92,6 +214,9 @@ class BossKey:
                                       was activated.
         """
 
+        # Makes sure that the boss key image has been drawn.
+        self.load_image()
+
         # Stores the canvas that was being shown before the boss key was activated.
         self.__previous_canvas = previous_canvas
 
@@ -1,92 +1,83 @@
-import constants
-
 class Brick:
-    """A class that represents the bricks in the game"""
+    """A class that represents one of the bricks in the game
+
+    A Brick is a view of one brick stored in a BrickField, so it doesn't store any of the brick's
+    attributes itself.
+    """
 
-    def __init__(self, canvas, x, y, score, colour, width, height=constants.DEFAULT_BRICK_HEIGHT):
-        """Initialises Brick and creates a rectangle on the canvas to represent the brick
+    def __init__(self, field, index):
+        """Initialises Brick as a view of a brick in a BrickField
 
         Parameters:
-            canvas (Canvas): The canvas that the brick will be drawn on
-            x (int): The x coordinate of the top left corner of the brick
-            y (int): The y coordinate of the top left corner of the brick
-            score (int): How much score the brick is worth when destroyed
-            colour (str): The colour of the brick.
-                          This can be in the form "#RRGGBB"
-                          or any locally defined standard colour name.
-            width (int): The width of the brick
-            height (int): The height of the brick
+            field (BrickField): The BrickField that the brick is stored in
+            index (int): The index of the brick in the BrickField
         """
 
         # Assigns values to the object's attributes based on the arguments to the initialiser.
-        self.__canvas = canvas
-        self.__score = score
+        self.__field = field
+        self.__index = index
 
-        # Calculates the x and y coordinates for the top, bottom, left
-        # and right edges of the paddle.
-        self.__left_x = x
-        self.__top_y = y
-        self.__right_x = x + width
-        self.__bottom_y = y + height
+    @property
+    def index(self):
+        """(int): The index of the brick in the BrickField it is stored in"""
 
-        # Creates a rectangle at the coordinates calculated that represents the brick
-        # and stores the object ID of the brick.
-        self.__id = canvas.create_rectangle(x, y, self.__right_x, self.__bottom_y, fill=colour)
+        return self.__index
 
     @property
     def id(self):
-        """(int): The object ID of the brick when it is created on the canvas"""
+        """(int): The object ID of the brick when it is created on the canvas,
+        or 0 if it hasn't been drawn"""
 
-        return self.__id
+        return self.__field.canvas_id(self.__index)
 
     @property
     def score(self):
         """(int): How much score the brick is worth when destroyed"""
 
-        return self.__score
+        return self.__field.score(self.__index)
 
     @property
     def left_x(self):
         """(int): The x coordinate of the left edge of the brick"""
 
-        return self.__left_x
+        return self.__field.left_x(self.__index)
 
     @property
     def top_y(self):
         """(int): The y coordinate of the top edge of the brick"""
 
-        return self.__top_y
+        return self.__field.top_y(self.__index)
 
     @property
     def right_x(self):
         """(int): The x coordinate of the right edge of the brick"""
 
-        return self.__right_x
+        return self.__field.right_x(self.__index)
 
     @property
     def bottom_y(self):
         """(int): The y coordinate of the bottom edge of the brick"""
 
-        return self.__bottom_y
+        return self.__field.bottom_y(self.__index)
 
     @property
     def colour(self):
         """(str): The colour of the brick in the form #RRGGBB
         or any locally defined standard colour name"""
 
-        return self.__canvas.itemcget(self.__id, "fill")
+        return self.__field.colour(self.__index)
 
     @property
     def width(self):
         """(int): The width of the brick"""
 
-        return int(self.__right_x - self.__left_x)
+        return int(self.right_x - self.left_x)
 
     @property
     def height(self):
         """(int): The height of the brick"""
 
-        return int(self.__bottom_y - self.__top_y)
+        return int(self.bottom_y - self.top_y)
 
 if __name__ == "__main__":
     print("Please run main.py")
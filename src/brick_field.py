@@ -0,0 +1,326 @@
+from array import array
+from brick import Brick
+from brick_grid import BrickGrid
+import constants
+
+class BrickField:
+    """A class that stores all of the bricks of the game in compact parallel arrays
+
+    Each brick is identified by its index in the arrays. Bricks that are destroyed are marked as
+    not alive instead of being removed, so indices never change. A BrickGrid is used to find
+    the bricks near a position without checking every brick.
+    Iterating over a BrickField gives a Brick view of each brick that is still alive.
+
+    Methods:
+        add(x, y, score, colour, width, height): Adds a brick to the field
+        remove(index): Destroys a brick
+        overlapping(left_x, top_y, right_x, bottom_y): Returns the bricks that overlap a box
+        overlapping_indices(left_x, top_y, right_x, bottom_y, indices): Returns overlapping() as indices
+        is_alive(index): Returns whether a brick hasn't been destroyed
+        alive_indices(): Returns the indices of the bricks that haven't been destroyed
+        pop_removed_canvas_ids(): Returns the canvas object IDs of drawn bricks that were destroyed
+    """
+
+    def __init__(self, cell_width=constants.WINDOW_WIDTH // constants.DEFAULT_BRICKS_PER_ROW,
+                 cell_height=constants.DEFAULT_BRICK_HEIGHT):
+        """Initialises BrickField with no bricks in it
+
+        Parameters:
+            cell_width (int) (default 80): The width of each cell of the grid used to find bricks.
+                                           This is fastest when it is the width of the bricks.
+            cell_height (int) (default 20): The height of each cell of the grid used to find
+                                            bricks. This is fastest when it is the height of
+                                            the bricks.
+        """
+
+        # Stores the x and y coordinates of the top, bottom, left and right edges of each brick.
+        self.__left_x = array("d")
+        self.__top_y = array("d")
+        self.__right_x = array("d")
+        self.__bottom_y = array("d")
+
+        # Stores how much score each brick is worth when destroyed.
+        self.__score = array("l")
+
+        # Stores the colour of each brick as an index into a list of the different colours used,
+        # as there are usually only a few different colours.
+        self.__colour_index = array("H")
+        self.__colours = []
+
+        # Stores whether each brick is alive (1) or has been destroyed (0).
+        self.__alive = bytearray()
+
+        # Stores the object ID of the rectangle that represents each brick on the canvas,
+        # or 0 if the brick hasn't been drawn.
+        self.__canvas_id = array("l")
+
+        # Stores the canvas object IDs of bricks that were destroyed after being drawn
+        # so that the renderer can remove them from the canvas.
+        self.__removed_canvas_ids = []
+
+        # Stores how many bricks are alive and how much score they are worth in total.
+        self.__alive_count = 0
+        self.__remaining_score = 0
+
+        # Creates the grid used to find the bricks near a position.
+        self.__grid = BrickGrid(cell_width, cell_height)
+
+    def add(self, x, y, score, colour, width, height=constants.DEFAULT_BRICK_HEIGHT):
+        """Adds a brick to the field
+
+        Parameters:
+            x (int): The x coordinate of the top left corner of the brick
+            y (int): The y coordinate of the top left corner of the brick
+            score (int): How much score the brick is worth when destroyed
+            colour (str): The colour of the brick.
+                          This can be in the form "#RRGGBB"
+                          or any locally defined standard colour name.
+            width (int): The width of the brick
+            height (int) (default 20): The height of the brick
+
+        Returns:
+            index (int): The index of the brick that was added
+        """
+
+        # Gets the index that the brick will have.
+        index = len(self.__alive)
+
+        # Gets the index of the brick's colour, adding it to the list of colours if it is new.
+        if colour not in self.__colours:
+            self.__colours.append(colour)
+        colour_index = self.__colours.index(colour)
+
+        # Appends the brick's attributes to the end of each array.
+        self.__left_x.append(x)
+        self.__top_y.append(y)
+        self.__right_x.append(x + width)
+        self.__bottom_y.append(y + height)
+        self.__score.append(score)
+        self.__colour_index.append(colour_index)
+        self.__alive.append(1)
+        self.__canvas_id.append(0)
+
+        # Updates the number of alive bricks and the score they are worth in total.
+        self.__alive_count += 1
+        self.__remaining_score += score
+
+        # Adds the brick to the grid used to find the bricks near a position.
+        self.__grid.add(index, x, y, x + width, y + height)
+
+        return index
+
+    def remove(self, index):
+        """Destroys a brick so that it is no longer alive
+
+        Parameters:
+            index (int): The index of the brick to destroy
+        """
+
+        # Marks the brick as not alive and updates the number of alive bricks and the score
+        # they are worth in total.
+        self.__alive[index] = 0
+        self.__alive_count -= 1
+        self.__remaining_score -= self.__score[index]
+
+        # Removes the brick from the grid used to find the bricks near a position.
+        self.__grid.remove(index, self.__left_x[index], self.__top_y[index],
+                           self.__right_x[index], self.__bottom_y[index])
+
+        # If the brick was drawn on a canvas, then remember its object ID so that the renderer
+        # can remove it from the canvas.
+        if self.__canvas_id[index]:
+            self.__removed_canvas_ids.append(self.__canvas_id[index])
+            self.__canvas_id[index] = 0
+
+    def overlapping(self, left_x, top_y, right_x, bottom_y):
+        """Returns the alive bricks that overlap with a box
+
+        Touching edges count as overlapping, which matches the canvas's find_overlapping().
+
+        Parameters:
+            left_x (float): The x coordinate of the left edge of the box
+            top_y (float): The y coordinate of the top edge of the box
+            right_x (float): The x coordinate of the right edge of the box
+            bottom_y (float): The y coordinate of the bottom edge of the box
+
+        Returns:
+            bricks (List[Brick]): A Brick view of each brick that overlaps with the box
+        """
+
+        # Only creates Brick views for the bricks that do overlap.
+        return [Brick(self, index) for index in self.overlapping_indices(left_x, top_y, right_x,
+                                                                         bottom_y)]
+
+    def overlapping_indices(self, left_x, top_y, right_x, bottom_y, indices=None):
+        """Returns the indices of the alive bricks that overlap with a box
+
+        This doesn't create any Brick views, and can fill a list passed in instead of creating
+        a new one, so the ball can look for bricks every substep without allocating anything.
+        Touching edges count as overlapping.
+
+        Parameters:
+            left_x (float): The x coordinate of the left edge of the box
+            top_y (float): The y coordinate of the top edge of the box
+            right_x (float): The x coordinate of the right edge of the box
+            bottom_y (float): The y coordinate of the bottom edge of the box
+            indices (List[int]) (default None): A list to clear and fill with the indices.
+                                                If None, a new list is created.
+
+        Returns:
+            indices (List[int]): The index of each brick that overlaps with the box
+        """
+
+        # Gets the bricks near the box from the grid.
+        indices = self.__grid.query(left_x, top_y, right_x, bottom_y, indices)
+
+        # Checks each of the bricks near the box for overlap using the arrays, moving the ones
+        # that do overlap to the start of the list and then removing the rest, so that no other
+        # list is needed. The list is indexed instead of iterated over so that no iterator is
+        # allocated.
+        count = 0
+        position = 0
+        while position < len(indices):
+            index = indices[position]
+            if (left_x <= self.__right_x[index] and right_x >= self.__left_x[index]
+                    and top_y <= self.__bottom_y[index] and bottom_y >= self.__top_y[index]):
+                indices[count] = index
+                count += 1
+            position += 1
+        del indices[count:]
+
+        return indices
+
+    def is_alive(self, index):
+        """Returns whether a brick hasn't been destroyed
+
+        Parameters:
+            index (int): The index of the brick
+
+        Returns:
+            alive (bool): Whether the brick is still alive
+        """
+
+        return self.__alive[index] == 1
+
+    def alive_indices(self):
+        """Returns the indices of the bricks that haven't been destroyed
+
+        Returns:
+            indices (List[int]): The indices of the alive bricks in the order they were added
+        """
+
+        return [index for index, alive in enumerate(self.__alive) if alive]
+
+    def pop_removed_canvas_ids(self):
+        """Returns the canvas object IDs of the bricks that have been destroyed since this was
+        last called (and had been drawn), and forgets them
+
+        Returns:
+            canvas_ids (List[int]): The object IDs of the destroyed bricks on the canvas
+        """
+
+        canvas_ids = self.__removed_canvas_ids
+        self.__removed_canvas_ids = []
+        return canvas_ids
+
+    def left_x(self, index):
+        """Returns the x coordinate of the left edge of a brick
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__left_x[index]
+
+    def top_y(self, index):
+        """Returns the y coordinate of the top edge of a brick
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__top_y[index]
+
+    def right_x(self, index):
+        """Returns the x coordinate of the right edge of a brick
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__right_x[index]
+
+    def bottom_y(self, index):
+        """Returns the y coordinate of the bottom edge of a brick
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__bottom_y[index]
+
+    def score(self, index):
+        """Returns how much score a brick is worth when destroyed
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__score[index]
+
+    def colour(self, index):
+        """Returns the colour of a brick
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__colours[self.__colour_index[index]]
+
+    def canvas_id(self, index):
+        """Returns the object ID of the rectangle that represents a brick on the canvas,
+        or 0 if the brick hasn't been drawn
+
+        Parameters:
+            index (int): The index of the brick
+        """
+
+        return self.__canvas_id[index]
+
+    def set_canvas_id(self, index, canvas_id):
+        """Stores the object ID of the rectangle that represents a brick on the canvas
+
+        Parameters:
+            index (int): The index of the brick
+            canvas_id (int): The object ID of the brick's rectangle on the canvas
+        """
+
+        self.__canvas_id[index] = canvas_id
+
+    def __getitem__(self, index):
+
+        return Brick(self, index)
+
+    def __iter__(self):
+
+        for index in self.alive_indices():
+            yield Brick(self, index)
+
+    def __len__(self):
+
+        return self.__alive_count
+
+    @property
+    def alive_count(self):
+        """(int): How many bricks haven't been destroyed"""
+
+        return self.__alive_count
+
+    @property
+    def remaining_score(self):
+        """(int): How much score all of the bricks that haven't been destroyed are worth in total"""
+
+        return self.__remaining_score
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,141 @@
+import math
+import constants
+
+class BrickGrid:
+    """A class that indexes the bricks of the game in a uniform grid so that the bricks near
+    a position can be found without checking every brick
+
+    The grid stores brick indices (positions in a BrickField) rather than the bricks themselves.
+    Each brick is stored in every grid cell (row, column) that it covers, so bricks don't
+    have to line up with the grid (e.g. for custom levels), although it is fastest when
+    the cells are the same size as the bricks.
+
+    Methods:
+        add(index, left_x, top_y, right_x, bottom_y): Adds a brick to the grid
+        remove(index, left_x, top_y, right_x, bottom_y): Removes a brick from the grid
+        query(left_x, top_y, right_x, bottom_y, indices): Returns the bricks near a box
+    """
+
+    def __init__(self, cell_width=constants.WINDOW_WIDTH // constants.DEFAULT_BRICKS_PER_ROW,
+                 cell_height=constants.DEFAULT_BRICK_HEIGHT):
+        """Initialises BrickGrid with no bricks in it
+
+        Parameters:
+            cell_width (int) (default 80): The width of each grid cell
+            cell_height (int) (default 20): The height of each grid cell
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__cell_width = cell_width
+        self.__cell_height = cell_height
+
+        # Maps each (row, column) grid cell to a list of the indices of the bricks that cover it.
+        # Cells that no bricks cover aren't stored.
+        self.__cells = {}
+
+    def __cell_range(self, left_x, top_y, right_x, bottom_y):
+        # Returns the ranges of rows and columns of the grid cells that the box touches.
+        # Touching edges count as touching, which matches how the ball checks for overlap.
+
+        first_column = math.floor(left_x / self.__cell_width)
+        last_column = math.floor(right_x / self.__cell_width)
+        first_row = math.floor(top_y / self.__cell_height)
+        last_row = math.floor(bottom_y / self.__cell_height)
+
+        return range(first_row, last_row + 1), range(first_column, last_column + 1)
+
+    def add(self, index, left_x, top_y, right_x, bottom_y):
+        """Adds a brick to the grid
+
+        Parameters:
+            index (int): The index of the brick
+            left_x (float): The x coordinate of the left edge of the brick
+            top_y (float): The y coordinate of the top edge of the brick
+            right_x (float): The x coordinate of the right edge of the brick
+            bottom_y (float): The y coordinate of the bottom edge of the brick
+        """
+
+        # Adds the brick to the list of bricks for every cell that it covers.
+        rows, columns = self.__cell_range(left_x, top_y, right_x, bottom_y)
+        for row in rows:
+            for column in columns:
+                self.__cells.setdefault((row, column), []).append(index)
+
+    def remove(self, index, left_x, top_y, right_x, bottom_y):
+        """Removes a brick from the grid
+
+        Parameters:
+            index (int): The index of the brick
+            left_x (float): The x coordinate of the left edge of the brick
+            top_y (float): The y coordinate of the top edge of the brick
+            right_x (float): The x coordinate of the right edge of the brick
+            bottom_y (float): The y coordinate of the bottom edge of the brick
+        """
+
+        # Removes the brick from every cell that it covers, and removes any cells that
+        # no longer have any bricks in them.
+        rows, columns = self.__cell_range(left_x, top_y, right_x, bottom_y)
+        for row in rows:
+            for column in columns:
+                cell = self.__cells[(row, column)]
+                cell.remove(index)
+                if not cell:
+                    del self.__cells[(row, column)]
+
+    def query(self, left_x, top_y, right_x, bottom_y, indices=None):
+        """Returns the indices of the bricks in the grid cells that a box touches
+
+        This can include bricks that are close to the box without touching it,
+        so the caller still needs to check for overlap exactly.
+
+        Parameters:
+            left_x (float): The x coordinate of the left edge of the box
+            top_y (float): The y coordinate of the top edge of the box
+            right_x (float): The x coordinate of the right edge of the box
+            bottom_y (float): The y coordinate of the bottom edge of the box
+            indices (List[int]) (default None): A list to clear and fill with the indices,
+                                                so that callers that query every frame can
+                                                reuse the same list.
+                                                If None, a new list is created.
+
+        Returns:
+            indices (List[int]): The indices of the bricks near the box, each included once
+        """
+
+        # Stores the indices of the bricks found near the box.
+        if indices is None:
+            indices = []
+        else:
+            indices.clear()
+
+        # Gets the first and last rows and columns of the cells that the box touches, in the
+        # same way as __cell_range().
+        first_column = math.floor(left_x / self.__cell_width)
+        last_column = math.floor(right_x / self.__cell_width)
+        row = math.floor(top_y / self.__cell_height)
+        last_row = math.floor(bottom_y / self.__cell_height)
+
+        # Iterates over the cells that the box touches and collects the bricks in them.
+        # While loops are used instead of for loops so that the ball can query the grid every
+        # substep without allocating any ranges or iterators.
+        cells = self.__cells
+        while row <= last_row:
+            column = first_column
+            while column <= last_column:
+                cell = cells.get((row, column))
+                if cell is not None:
+                    position = 0
+                    while position < len(cell):
+                        index = cell[position]
+
+                        # Bricks that cover more than one cell are only included once.
+                        if index not in indices:
+                            indices.append(index)
+                        position += 1
+                column += 1
+            row += 1
+
+        return indices
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,386 @@
+class CanvasProxy:
+    """A class that wraps a canvas, keeps a copy of its items' coordinates and options
+    in Python, and sends changes to the canvas in one batch per frame
+
+    Every call to Tkinter goes through Tcl, so reading an item's coordinates or setting an
+    option that hasn't changed still costs a round trip. The proxy answers coords() and
+    itemcget() from its copy, drops changes that don't change anything, and only sends the
+    latest value of each changed property when it is flushed. Items are still created straight
+    away so that their IDs can be returned, and any other method is passed straight to the canvas.
+
+    Changes are flushed when flush() is called (once per frame by the game loop). If auto_flush
+    is True, changes are also flushed when Tkinter is next idle in case flush() isn't called.
+
+    Methods:
+        create_arc/image/line/oval/polygon/rectangle/text/window(*coordinates, **options):
+            Creates an item on the canvas and returns its ID
+        coords(item, *coordinates): Returns or changes the coordinates of an item
+        itemconfigure(item, **options): Changes the options of an item
+        itemcget(item, option): Returns the value of an item's option
+        addtag_withtag(new_tag, item): Adds a tag to an item
+        delete(*items): Deletes items from the canvas
+        flush(): Sends all of the changes since the last flush to the canvas
+    """
+
+    # The canvas methods that read the state of the items on the canvas, so any changes need to
+    # be flushed before they are called.
+    __READ_METHODS = {"bbox", "find_above", "find_all", "find_below", "find_closest",
+                      "find_enclosed", "find_overlapping", "find_withtag", "gettags", "type",
+                      "update", "update_idletasks"}
+
+    def __init__(self, canvas, auto_flush=True):
+        """Initialises CanvasProxy
+
+        Parameters:
+            canvas (Canvas): The canvas that the changes are sent to
+            auto_flush (bool) (default True): Whether changes are flushed when Tkinter is next
+                                              idle. This can be turned off whilst something
+                                              else calls flush() every frame, which saves
+                                              scheduling a flush every frame.
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__canvas = canvas
+        self.__auto_flush = auto_flush
+
+        # Maps the ID of each item created through the proxy to its coordinates (as a tuple)
+        # and its options that have been set.
+        self.__coordinates = {}
+        self.__options = {}
+
+        # Maps each tag given to an item created through the proxy to the IDs of its items,
+        # so that tags can be used without asking the canvas which items have them.
+        self.__tag_to_items = {}
+
+        # Stores the changes that haven't been sent to the canvas yet.
+        self.__pending_coordinates = {}
+        self.__pending_options = {}
+        self.__pending_deletes = []
+
+        # Stores whether a flush has been scheduled for when Tkinter is next idle.
+        self.__flush_scheduled = False
+
+        # Counts the calls made to the canvas in total and since the last flush,
+        # and stores how many calls were made between the last two flushes.
+        self.__calls = 0
+        self.__calls_since_flush = 0
+        self.__frame_calls = 0
+
+    def __count_call(self):
+        # Counts a call to the canvas.
+
+        self.__calls += 1
+        self.__calls_since_flush += 1
+
+    def __schedule_flush(self):
+        # Makes it so that the pending changes are sent to the canvas when Tkinter is next idle,
+        # in case flush() isn't called before then (e.g. when the game loop isn't running).
+
+        if self.__auto_flush and not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            self.__count_call()
+            self.__canvas.after_idle(self.__idle_flush)
+
+    def __idle_flush(self):
+        # Flushes the pending changes when Tkinter is idle if they haven't already been flushed.
+
+        if self.__flush_scheduled:
+            self.flush()
+
+    def __resolve(self, item):
+        # Returns the IDs of the items created through the proxy that an ID or tag refers to,
+        # or None if the proxy doesn't know about it.
+
+        if item in self.__coordinates:
+            return (item,)
+        return self.__tag_to_items.get(item)
+
+    def __create(self, item_type, coordinates, options):
+        # Creates an item on the canvas straight away and stores a copy of its state.
+
+        self.__count_call()
+        item = getattr(self.__canvas, "create_" + item_type)(*coordinates, **options)
+
+        # Flattens the coordinates so that they are stored in the same way whether they were
+        # passed as separate numbers or as a list.
+        if len(coordinates) == 1 and isinstance(coordinates[0], (list, tuple)):
+            coordinates = coordinates[0]
+        self.__coordinates[item] = tuple(coordinates)
+        self.__options[item] = {name: value for name, value in options.items() if name != "tags"}
+
+        # Stores which tags the item has.
+        tags = options.get("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        for tag in tags:
+            self.__tag_to_items.setdefault(tag, set()).add(item)
+
+        return item
+
+    def create_arc(self, *coordinates, **options):
+        """Creates an arc on the canvas and returns its ID"""
+
+        return self.__create("arc", coordinates, options)
+
+    def create_image(self, *coordinates, **options):
+        """Creates an image on the canvas and returns its ID"""
+
+        return self.__create("image", coordinates, options)
+
+    def create_line(self, *coordinates, **options):
+        """Creates a line on the canvas and returns its ID"""
+
+        return self.__create("line", coordinates, options)
+
+    def create_oval(self, *coordinates, **options):
+        """Creates an oval on the canvas and returns its ID"""
+
+        return self.__create("oval", coordinates, options)
+
+    def create_polygon(self, *coordinates, **options):
+        """Creates a polygon on the canvas and returns its ID"""
+
+        return self.__create("polygon", coordinates, options)
+
+    def create_rectangle(self, *coordinates, **options):
+        """Creates a rectangle on the canvas and returns its ID"""
+
+        return self.__create("rectangle", coordinates, options)
+
+    def create_text(self, *coordinates, **options):
+        """Creates text on the canvas and returns its ID"""
+
+        return self.__create("text", coordinates, options)
+
+    def create_window(self, *coordinates, **options):
+        """Creates a window (e.g. an Entry) on the canvas and returns its ID"""
+
+        return self.__create("window", coordinates, options)
+
+    def coords(self, item, *coordinates):
+        """Returns the coordinates of an item, or changes them if coordinates are passed in
+
+        Parameters:
+            item (int/str): The ID of the item (or a tag)
+            *coordinates (float): The new coordinates of the item
+
+        Returns:
+            coordinates (List[float]): The coordinates of the item if no coordinates were
+                                       passed in
+        """
+
+        # Items that weren't created through the proxy are passed straight to the canvas.
+        if item not in self.__coordinates:
+            if not coordinates:
+                self.flush()
+            self.__count_call()
+            return self.__canvas.coords(item, *coordinates)
+
+        # Reads the coordinates from the copy.
+        if not coordinates:
+            return list(self.__coordinates[item])
+
+        # Stores the new coordinates to send when the proxy is flushed if they have changed.
+        if len(coordinates) == 1 and isinstance(coordinates[0], (list, tuple)):
+            coordinates = coordinates[0]
+        coordinates = tuple(coordinates)
+        if coordinates != self.__coordinates[item]:
+            self.__coordinates[item] = coordinates
+            self.__pending_coordinates[item] = coordinates
+            self.__schedule_flush()
+
+    def itemconfigure(self, item, **options):
+        """Changes the options of an item (or of every item with a tag)
+
+        Parameters:
+            item (int/str): The ID of the item (or a tag)
+            **options: The options to change
+        """
+
+        # Items that the proxy doesn't know about, and calls that read every option, are passed
+        # straight to the canvas.
+        items = self.__resolve(item)
+        if items is None or not options:
+            self.flush()
+            self.__count_call()
+            return self.__canvas.itemconfigure(item, **options)
+
+        # Stores the options that have changed to send when the proxy is flushed.
+        for item in items:
+            item_options = self.__options[item]
+            for name, value in options.items():
+                if name not in item_options or item_options[name] != value:
+                    item_options[name] = value
+                    self.__pending_options.setdefault(item, {})[name] = value
+                    self.__schedule_flush()
+
+    # Matches the canvas, which has itemconfig() as another name for itemconfigure().
+    itemconfig = itemconfigure
+
+    def itemcget(self, item, option):
+        """Returns the value of an item's option
+
+        Parameters:
+            item (int/str): The ID of the item (or a tag)
+            option (str): The name of the option
+
+        Returns:
+            value: The value of the option
+        """
+
+        # Reads the option from the copy if it has been set through the proxy.
+        if item in self.__options and option in self.__options[item]:
+            return self.__options[item][option]
+
+        self.flush()
+        self.__count_call()
+        return self.__canvas.itemcget(item, option)
+
+    def addtag_withtag(self, new_tag, item):
+        """Adds a tag to an item (or to every item with a tag)
+
+        Parameters:
+            new_tag (str): The tag to add
+            item (int/str): The ID of the item (or a tag)
+        """
+
+        # Stores that the items have the new tag if the proxy knows about all of them.
+        # Otherwise, the proxy no longer knows every item with the new tag, so it stops using it.
+        items = self.__resolve(item)
+        if items is not None:
+            self.__tag_to_items.setdefault(new_tag, set()).update(items)
+        else:
+            self.__tag_to_items.pop(new_tag, None)
+
+        self.__count_call()
+        self.__canvas.addtag_withtag(new_tag, item)
+
+    def delete(self, *items):
+        """Deletes items from the canvas
+
+        Items created through the proxy (and tags that only they have) are deleted when the proxy
+        is flushed, in one call. Anything else is deleted straight away.
+
+        Parameters:
+            *items (int/str): The IDs of the items (or tags)
+        """
+
+        for item in items:
+            resolved_items = self.__resolve(item)
+
+            # Deletes items that the proxy doesn't know about straight away.
+            if resolved_items is None:
+                self.flush()
+                self.__count_call()
+                self.__canvas.delete(item)
+                continue
+
+            # Forgets the items and any changes to them that haven't been sent yet,
+            # and deletes them when the proxy is flushed.
+            for resolved_item in tuple(resolved_items):
+                self.__forget(resolved_item)
+                self.__pending_deletes.append(resolved_item)
+                self.__schedule_flush()
+
+    def __forget(self, item):
+        # Removes the copy of an item's state and any of its changes that haven't been sent.
+
+        del self.__coordinates[item]
+        del self.__options[item]
+        self.__pending_coordinates.pop(item, None)
+        self.__pending_options.pop(item, None)
+
+        # Removes the item from its tags, and removes any tags that no longer have any items.
+        for tag in [tag for tag, tag_items in self.__tag_to_items.items() if item in tag_items]:
+            self.__tag_to_items[tag].discard(item)
+            if not self.__tag_to_items[tag]:
+                del self.__tag_to_items[tag]
+
+    def flush(self):
+        """Sends all of the changes since the last flush to the canvas
+
+        Returns:
+            calls (int): The number of calls made to the canvas since the last flush,
+                         including the calls made by this flush
+        """
+
+        self.__flush_scheduled = False
+
+        # Deletes all of the items that were deleted in one call.
+        if self.__pending_deletes:
+            self.__count_call()
+            self.__canvas.delete(*self.__pending_deletes)
+            self.__pending_deletes = []
+
+        # Sends the latest coordinates of each item that moved.
+        for item, coordinates in self.__pending_coordinates.items():
+            self.__count_call()
+            self.__canvas.coords(item, *coordinates)
+        self.__pending_coordinates = {}
+
+        # Sends all of the changed options of each item in one call.
+        for item, options in self.__pending_options.items():
+            self.__count_call()
+            self.__canvas.itemconfigure(item, **options)
+        self.__pending_options = {}
+
+        # Stores how many calls were made since the last flush and starts counting again.
+        self.__frame_calls = self.__calls_since_flush
+        self.__calls_since_flush = 0
+
+        return self.__frame_calls
+
+    def __getattr__(self, name):
+        # Passes any other attribute straight to the canvas, counting calls to its methods.
+        # Methods that read the state of the items flush the pending changes first.
+
+        attribute = getattr(self.__canvas, name)
+        if not callable(attribute):
+            return attribute
+
+        flush_first = name in CanvasProxy.__READ_METHODS
+
+        def call(*args, **kwargs):
+            if flush_first:
+                self.flush()
+            self.__count_call()
+            return attribute(*args, **kwargs)
+
+        return call
+
+    @property
+    def canvas(self):
+        """(Canvas): The canvas that the changes are sent to"""
+
+        return self.__canvas
+
+    @property
+    def auto_flush(self):
+        """(bool): Whether changes are flushed when Tkinter is next idle"""
+
+        return self.__auto_flush
+
+    @auto_flush.setter
+    def auto_flush(self, value):
+
+        self.__auto_flush = value
+
+        # If there are changes waiting, then make sure that they get flushed.
+        if value and (self.__pending_coordinates or self.__pending_options
+                      or self.__pending_deletes):
+            self.__schedule_flush()
+
+    @property
+    def calls(self):
+        """(int): The total number of calls made to the canvas through the proxy"""
+
+        return self.__calls
+
+    @property
+    def frame_calls(self):
+        """(int): The number of calls made to the canvas between the last two flushes"""
+
+        return self.__frame_calls
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,216 @@
+from math import sqrt
+
+def circle_rectangle_contact(centre_x, centre_y, radius, left_x, top_y, right_x, bottom_y):
+    """Returns whether and how a circle touches a rectangle whose sides are parallel to the axes
+
+    The point on the rectangle closest to the circle's centre is found, and the circle touches
+    the rectangle if that point is within the radius, so the corners of the circle's bounding
+    box don't count as touching. Rectangles that the circle's bounding box doesn't reach are
+    rejected whilst finding that point, so rectangles that are nowhere near the circle only
+    take a few comparisons. Touching edges count as touching.
+
+    Parameters:
+        centre_x (float): The x coordinate of the circle's centre
+        centre_y (float): The y coordinate of the circle's centre
+        radius (float): The radius of the circle
+        left_x (float): The x coordinate of the left edge of the rectangle
+        top_y (float): The y coordinate of the top edge of the rectangle
+        right_x (float): The x coordinate of the right edge of the rectangle
+        bottom_y (float): The y coordinate of the bottom edge of the rectangle
+
+    Returns:
+        contact (tuple[float, float, float]): The x and y components of the contact normal (a
+                                              unit vector pointing out of the rectangle towards
+                                              the circle) and how far the circle overlaps the
+                                              rectangle along it, or None if they don't touch
+    """
+
+    # Finds how far the circle's centre is from the rectangle in the x direction, rejecting the
+    # rectangle straight away if the circle's bounding box doesn't reach it.
+    # Comparisons are used instead of min() and max() as they are faster.
+    if centre_x < left_x:
+        x_distance = centre_x - left_x
+        if x_distance < -radius:
+            return None
+    elif centre_x > right_x:
+        x_distance = centre_x - right_x
+        if x_distance > radius:
+            return None
+    else:
+        x_distance = 0.0
+
+    # Does the same in the y direction.
+    if centre_y < top_y:
+        y_distance = centre_y - top_y
+        if y_distance < -radius:
+            return None
+    elif centre_y > bottom_y:
+        y_distance = centre_y - bottom_y
+        if y_distance > radius:
+            return None
+    else:
+        y_distance = 0.0
+
+    # Rejects the rectangle if the point on it closest to the circle's centre is further away
+    # than the radius, which happens when the circle is near one of its corners.
+    distance_squared = x_distance * x_distance + y_distance * y_distance
+    if distance_squared > radius * radius:
+        return None
+
+    # If the circle's centre is outside the rectangle, then the normal points from the
+    # closest point to the centre.
+    if distance_squared > 0:
+        distance = sqrt(distance_squared)
+        return x_distance / distance, y_distance / distance, radius - distance
+
+    # Otherwise, the circle's centre is inside the rectangle, so the normal points out of
+    # whichever edge the centre is closest to. Ties go to the left and right edges first.
+    left_gap = centre_x - left_x
+    right_gap = right_x - centre_x
+    top_gap = centre_y - top_y
+    bottom_gap = bottom_y - centre_y
+    x_gap = left_gap if left_gap <= right_gap else right_gap
+    y_gap = top_gap if top_gap <= bottom_gap else bottom_gap
+    if x_gap <= y_gap:
+        return (-1.0 if left_gap <= right_gap else 1.0), 0.0, radius + x_gap
+    return 0.0, (-1.0 if top_gap <= bottom_gap else 1.0), radius + y_gap
+
+def circle_rectangle_time_of_impact(centre_x, centre_y, radius, x_distance, y_distance,
+                                    left_x, top_y, right_x, bottom_y):
+    """Returns when a moving circle first hits a rectangle whose sides are parallel to the axes
+
+    This is the same as finding when the circle's centre first enters the rectangle grown by
+    the radius with rounded corners. The grown rectangle is checked first without its rounded
+    corners, so movements that miss it completely are rejected with a few divisions. If the
+    centre enters it at a corner, then the circle around that corner is checked as well.
+    A circle that already touches the rectangle hits it straight away if it is moving into
+    it, and doesn't hit it if it is moving away from (or along) it.
+
+    Parameters:
+        centre_x (float): The x coordinate of the circle's centre before it moves
+        centre_y (float): The y coordinate of the circle's centre before it moves
+        radius (float): The radius of the circle
+        x_distance (float): How far the circle moves in the x direction
+        y_distance (float): How far the circle moves in the y direction
+        left_x (float): The x coordinate of the left edge of the rectangle
+        top_y (float): The y coordinate of the top edge of the rectangle
+        right_x (float): The x coordinate of the right edge of the rectangle
+        bottom_y (float): The y coordinate of the bottom edge of the rectangle
+
+    Returns:
+        impact (tuple[float, float, float]): The fraction of the movement (from 0 to 1) that
+                                             happens before the circle hits the rectangle and
+                                             the x and y components of the contact normal,
+                                             or None if the circle doesn't hit the rectangle
+    """
+
+    # If the circle already touches the rectangle, then it only hits it if it is moving into it.
+    contact = circle_rectangle_contact(centre_x, centre_y, radius, left_x, top_y, right_x,
+                                       bottom_y)
+    if contact is not None:
+        if contact[0] * x_distance + contact[1] * y_distance < 0:
+            return 0.0, contact[0], contact[1]
+        return None
+
+    # A circle that doesn't move and doesn't already touch the rectangle never hits it.
+    if x_distance == 0 and y_distance == 0:
+        return None
+
+    # Finds the fractions of the movement at which the centre enters and leaves the grown
+    # rectangle between its left and right edges, and the normal of the edge it enters through.
+    # If it doesn't move in the x direction, then it has to already be between them.
+    enter_time = 0.0
+    exit_time = 1.0
+    normal_x = 0.0
+    normal_y = 0.0
+    if x_distance > 0:
+        edge_time = (left_x - radius - centre_x) / x_distance
+        if edge_time > enter_time:
+            enter_time = edge_time
+            normal_x = -1.0
+        exit_time = min(exit_time, (right_x + radius - centre_x) / x_distance)
+    elif x_distance < 0:
+        edge_time = (right_x + radius - centre_x) / x_distance
+        if edge_time > enter_time:
+            enter_time = edge_time
+            normal_x = 1.0
+        exit_time = min(exit_time, (left_x - radius - centre_x) / x_distance)
+    elif not left_x - radius <= centre_x <= right_x + radius:
+        return None
+
+    # Does the same between its top and bottom edges.
+    if y_distance > 0:
+        edge_time = (top_y - radius - centre_y) / y_distance
+        if edge_time > enter_time:
+            enter_time = edge_time
+            normal_x = 0.0
+            normal_y = -1.0
+        exit_time = min(exit_time, (bottom_y + radius - centre_y) / y_distance)
+    elif y_distance < 0:
+        edge_time = (bottom_y + radius - centre_y) / y_distance
+        if edge_time > enter_time:
+            enter_time = edge_time
+            normal_x = 0.0
+            normal_y = 1.0
+        exit_time = min(exit_time, (top_y - radius - centre_y) / y_distance)
+    elif not top_y - radius <= centre_y <= bottom_y + radius:
+        return None
+
+    # If the centre is never between both pairs of edges at the same time during the movement,
+    # then the circle misses the rectangle.
+    if enter_time > exit_time:
+        return None
+
+    # If the centre enters the grown rectangle alongside one of the rectangle's edges, then
+    # the circle hits that edge.
+    hit_x = centre_x + x_distance * enter_time
+    hit_y = centre_y + y_distance * enter_time
+    if left_x <= hit_x <= right_x or top_y <= hit_y <= bottom_y:
+        return enter_time, normal_x, normal_y
+
+    # Otherwise, it enters near one of the rectangle's corners, so finds when the circle
+    # first touches that corner (if it does) by solving for when the distance between the
+    # centre and the corner equals the radius.
+    corner_x = left_x if hit_x < left_x else right_x
+    corner_y = top_y if hit_y < top_y else bottom_y
+    offset_x = centre_x - corner_x
+    offset_y = centre_y - corner_y
+    a = x_distance * x_distance + y_distance * y_distance
+    b = offset_x * x_distance + offset_y * y_distance
+    c = offset_x * offset_x + offset_y * offset_y - radius * radius
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    time = (-b - sqrt(discriminant)) / a
+    if not 0 <= time <= 1:
+        return None
+    return (time, (offset_x + x_distance * time) / radius,
+            (offset_y + y_distance * time) / radius)
+
+def reflect(x_velocity, y_velocity, normal_x, normal_y):
+    """Returns a velocity reflected off a surface, if it is moving into the surface
+
+    Parameters:
+        x_velocity (float): The velocity in the x direction
+        y_velocity (float): The velocity in the y direction
+        normal_x (float): The x component of the surface's unit normal
+        normal_y (float): The y component of the surface's unit normal
+
+    Returns:
+        x_velocity (float): The reflected velocity in the x direction
+        y_velocity (float): The reflected velocity in the y direction
+    """
+
+    # Gets how fast the velocity is moving out of the surface.
+    # If it is already moving out of (or along) the surface, then it isn't changed.
+    speed_along_normal = x_velocity * normal_x + y_velocity * normal_y
+    if speed_along_normal >= 0:
+        return x_velocity, y_velocity
+
+    # Removes the part of the velocity moving into the surface twice, which reverses it
+    # and keeps the speed the same.
+    return (x_velocity - 2 * speed_along_normal * normal_x,
+            y_velocity - 2 * speed_along_normal * normal_y)
+
+if __name__ == "__main__":
+    print("Please run main.py")
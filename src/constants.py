@@ -5,13 +5,16 @@ DEFAULT_PADDLE_WIDTH = 150
 DEFAULT_PADDLE_HEIGHT = 10
 DEFAULT_CANVAS_GAP = 40
 DEFAULT_PADDLE_COLOUR = "#FFFFFF"
-DEFAULT_PADDLE_SPEED = 15
+DEFAULT_PADDLE_SPEED = 900
 DEFAULT_BALL_RADIUS = 8
 DEFAULT_PADDLE_GAP = 200
 DEFAULT_BOUNCES_UNTIL_SPEED_UP = 3
-DEFAULT_SPEED_UP_AMOUNT = 1.0
+DEFAULT_SPEED_UP_AMOUNT = 60.0
 DEFAULT_BALL_COLOUR = "#FFFFFF"
-DEFAULT_BALL_SPEED = 8.0
+DEFAULT_BALL_SPEED = 480.0
+DEFAULT_LEVEL_SCALING = 1.2
+MAX_BALL_SUBSTEP_DISTANCE = 8.0
+MAX_BALLS = 256
 DEFAULT_BRICK_HEIGHT = 20
 DEFAULT_BRICKS_PER_ROW = 10
 DEFAULT_ROW_GAP_FROM_TOP = 4
@@ -19,6 +22,11 @@ DEFAULT_BRICK_COLOURS = ["#FF0000", "#FFA500", "#FFFF00", "#008000"]
 DEFAULT_BRICK_SCORE = 10
 DEFAULT_STARTING_LIVES = 3
 DEFAULT_STARTING_LEVEL = 1
+PHYSICS_STEPS_PER_SECOND = 60
+MAX_PHYSICS_STEPS_PER_FRAME = 5
+FRAME_RATES = [60, 120, 144]
+DEFAULT_FRAME_RATE = 60
+CANVAS_LAYERS = ["world", "hud", "overlay", "menu", "modal"]
 KEY_BINDINGS_COMMANDS_ORDER = ["Move Paddle Left",
                                "Move Paddle Right",
                                "Move Menu Pointer Up",
@@ -27,7 +35,9 @@ KEY_BINDINGS_COMMANDS_ORDER = ["Move Paddle Left",
                                "Pause Game",
                                "Reset Ball Speed",
                                "Set Lives to 10",
-                               "Boss Key"
+                               "Boss Key",
+                               "Toggle Performance Overlay",
+                               "Dump Trace"
                               ]
 DEFAULT_KEY_BINDINGS = {"Move Paddle Left": "Left",
                         "Move Paddle Right": "Right",
@@ -37,7 +47,9 @@ DEFAULT_KEY_BINDINGS = {"Move Paddle Left": "Left",
                         "Pause Game": "Escape",
                         "Reset Ball Speed": "F11",
                         "Set Lives to 10": "F12",
-                        "Boss Key": "F1"
+                        "Boss Key": "F1",
+                        "Toggle Performance Overlay": "F3",
+                        "Dump Trace": "F4"
                        }
 SHIFT_CHARACTERS_TO_NON_SHIFT = {"!": "1", '"': "2", "£": "3", "$": "4", "%": "5", "^": "6",
                                  "&": "7", "*": "8", "(": "9", ")": "0", "_": "-", "+": "=",
@@ -1,13 +1,18 @@
-import csv
 import json
-import math
 import os
-from PIL import Image, ImageTk
+import time
 from tkinter import Canvas, Entry, StringVar
-from ball import Ball
-from brick import Brick
+from canvas_proxy import CanvasProxy
 import constants
-from paddle import Paddle
+from layers import LayerManager
+from leaderboard import store_on_leaderboard
+from overlay_image_cache import OVERLAY_IMAGE_CACHE
+from performance_overlay import PerformanceOverlay
+from renderer import Renderer
+from replay import ReplayRecorder
+from scheduler import Scheduler
+from tracer import TRACER
+from world import World
 
 class Game:
     """A class that represents when the program is in the game state
@@ -17,8 +22,10 @@ class Game:
     """
 
     def __init__(self, window, key_bindings, boss_key, lives=constants.DEFAULT_STARTING_LIVES,
-                 level=constants.DEFAULT_STARTING_LEVEL):
-        """Initialises Game and creates the paddle, ball and bricks for the game
+                 level=constants.DEFAULT_STARTING_LEVEL, multi_ball=False, on_finish=None,
+                 scheduler=None, frame_rate=constants.DEFAULT_FRAME_RATE):
+        """Initialises Game and creates the world (paddle, ball and bricks) for the game
+        and the renderer that draws it
 
         Parameters:
             window (Tk): The window that the game will be drawn on
@@ -27,14 +34,25 @@ class Game:
             boss_key (BossKey): A BossKey object that holds the boss key image and key bindings
             lives (int) (default 3): The number of lives the user has
             level (int) (default 1): The level the game is on
+            multi_ball (bool) (default False): Whether balls split when they destroy a brick
+            on_finish (Callable[[], None]) (default None): Called when the game finishes and
+                                                           the program should switch back to
+                                                           the main menu state
+            scheduler (Scheduler) (default None): The scheduler that runs the game loop and
+                                                  the countdown. If None, the game creates
+                                                  its own.
+            frame_rate (int) (default 60): How many times per second the game is drawn.
+                                           This doesn't change how fast the game plays, as
+                                           the world is always stepped
+                                           constants.PHYSICS_STEPS_PER_SECOND times per second.
         """
 
         # Assigns values to the object's attributes based on the arguments to the initialiser.
         self.__window = window
         self.__key_bindings = key_bindings
-        self.__lives = lives
-        self.__level = level
         self.__boss_key = boss_key
+        self.__on_finish = on_finish
+        self.__scheduler = scheduler if scheduler is not None else Scheduler(window)
 
         # Gets the window's width and height.
         window_width = window.winfo_reqwidth()
@@ -42,32 +60,29 @@ class Game:
 
         # Creates a canvas for the whole window where the game's basic shapes and text
         # will be drawn onto.
-        self.__canvas = Canvas(window, background="#000000", width=window_width,
-                               height=window_height)
+        # The canvas is wrapped in a CanvasProxy so that the changes made to it during a frame
+        # are sent to Tkinter together, and only if they actually change something.
+        # The game loop flushes the changes every frame, so they don't need to be flushed when
+        # Tkinter is idle until the game loop stops.
+        self.__canvas = CanvasProxy(Canvas(window, background="#000000", width=window_width,
+                                           height=window_height), auto_flush=False)
         self.__canvas.pack()
 
-        # Creates text in the top left corner of the canvas that tells the user
-        # how many lives they have left.
-        self.__lives_text = self.__canvas.create_text(10, 10, text=f"Lives: {self.__lives}",
-                                                      fill="#FFFFFF", font=("TkDefaultFont", 20),
-                                                      anchor="nw")
+        # Creates a LayerManager object that keeps the game's objects in layers, so that the menus
+        # are always drawn in front of the bricks without having to raise them.
+        self.__layers = LayerManager(self.__canvas)
 
         # Gets the canvas's width and height.
         canvas_width = self.__canvas.winfo_reqwidth()
         canvas_height = self.__canvas.winfo_reqheight()
 
-        # Creates text in the top middle of the canvas that tells the user the level they are on.
-        self.__level_text = self.__canvas.create_text(canvas_width/2, 10, text=f"Level {level}",
-                                                      fill="#FFFFFF", font=("TkDefaultFont", 20),
-                                                      anchor="n")
+        # Creates a World object that holds the paddle, ball, bricks, score, lives and level
+        # of the game independently of the canvas.
+        self.__world = World(canvas_width, canvas_height, lives, level, multi_ball)
 
-        # Stores the user's score.
-        self.__score = 0
-
-        # Creates text in the top right corner of the canvas that tells the user their score.
-        self.__score_text = self.__canvas.create_text(canvas_width - 10, 10,
-                                                      text=f"Score: {self.__score}", fill="#FFFFFF",
-                                                      font=("TkDefaultFont", 20), anchor="ne")
+        # Creates a ReplayRecorder object that records the user's inputs so that the game can be
+        # played back exactly from its seed. The replay is saved when the game finishes.
+        self.__recorder = ReplayRecorder(self.__world)
 
         # Stores whether or not the game is finished and should return back to the main menu state.
         self.__game_finished = False
@@ -76,27 +91,64 @@ class Game:
         # or not.
         self.__game_over = False
 
-        # Stores the ID of the game loop (when the game loop starts).
-        self.__game_loop_id = None
+        # Stores the length of one physics step and the time between frames in seconds.
+        self.__timestep = self.__world.timestep
+        self.__frame_interval = 1 / frame_rate
+
+        # Stores how much real time (in seconds) has passed that hasn't been simulated yet.
+        self.__accumulator = 0.0
+
+        # Stores the time (from time.perf_counter()) that the last frame started at
+        # and the time that the next frame should start at.
+        self.__last_frame_time = None
+        self.__next_frame_deadline = None
+
+        # Stores the time (from time.perf_counter()) that the last frame finished its work at,
+        # so that the time spent waiting for Tkinter before the next frame can be measured.
+        self.__last_frame_end_time = None
+
+        # Stores how many physics steps were dropped because the game fell too far behind,
+        # and how many physics steps were merged into a frame that had to catch up.
+        self.__dropped_steps = 0
+        self.__merged_steps = 0
 
         # Stores whether or not the game is in the paused state or not.
         self.__paused = False
 
+        # Stores whether the game loop has been stopped because the game can't be played
+        # (e.g. it is paused or the boss key is being shown).
+        self.__suspended = False
+
         # Stores whether or not the game was paused or not before the boss key was called.
         self.__paused_before_boss_key = False
 
-        # Stores a reference to the transparent background for the game's paused state.
-        self.__transparent_image = None
+        # Stores the transparent background images that the game is using from the overlay image
+        # cache so that they can be released when the game finishes.
+        self.__transparent_images = []
 
         # Stores the object IDs of all objects used in the game's paused state in the stacking order
         # that they should be displayed in.
         self.__paused_object_ids = []
 
-        # Stores the object ID of the transparent background for the game's paused state
-        # and assigns the reference to the transparent background into self.__transparent_image.
-        self.__paused_background = self.__create_transparent_background()
+        # Stores the object ID of the transparent background for the game's paused state.
+        self.__paused_background = self.__layers.add(self.__create_transparent_background(),
+                                                     "menu")
         self.__paused_object_ids.append(self.__paused_background)
 
+        # Stores a timer counter that is used to give the user time to prepare for the ball moving.
+        self.__timer = 3
+
+        # Stores whether or not a countdown is occuring or not.
+        self.__countdown_occuring = False
+
+        # Stores the object ID of the text that displays the timer to the user.
+        # This is created before the pause menu so that the pause menu covers it.
+        self.__timer_text = self.__layers.add(
+            self.__canvas.create_text(canvas_width/2, canvas_height/2, text=self.__timer,
+                                      fill="#FFFFFF", font=("TkDefualtFont", 50),
+                                      state="hidden"),
+            "menu")
+
         # Stores what the user is currently selecting on the pause menu.
         self.__pause_menu_selection = "Resume"
 
@@ -112,6 +164,7 @@ class Game:
                                                                                  100,
                                                                                  fill="#696969",
                                                                                  state="hidden")
+        self.__layers.add(self.__pause_menu_background, "menu")
         self.__paused_object_ids.append(self.__pause_menu_background)
 
         # Creates the different options for the game's pause menu
@@ -126,30 +179,20 @@ class Game:
         # Stores the Entry object for the game over screen when generated.
         self.__initials_entry = None
 
-        # Stores a timer counter that is used to give the user time to prepare for the ball moving.
-        self.__timer = 3
-
-        # Stores whether or not a countdown is occuring or not.
-        self.__countdown_occuring = False
-
-        # Stores the countdowns after ID.
-        self.__countdown_id = None
-
-        # Stores the object ID of the text that displays the timer to the user.
-        self.__timer_text = self.__canvas.create_text(canvas_width/2, canvas_height/2,
-                                                      text=self.__timer, fill="#FFFFFF",
-                                                      font=("TkDefualtFont", 50), state="hidden")
-
-        # Creates a Paddle object to represent the paddle in the game.
-        self.__paddle = Paddle(self.__canvas)
-
-        # Creates multiple Brick objects to represent the bricks in the game
-        # and then stores a list of those Brick objects.
-        self.__bricks = self.__create_initial_bricks()
-
-        # Creates a Ball object to represent the ball in the game.
-        self.__ball = None
-        self.__create_new_ball()
+        # Creates a Renderer object that draws the world (and the lives, level and score text)
+        # onto the canvas.
+        # If the game is drawn at a different rate to the world being stepped, then the ball and
+        # paddle are drawn in between physics steps so that they move smoothly.
+        self.__renderer = Renderer(self.__canvas, self.__world, self.__layers,
+                                   interpolate=frame_rate != constants.PHYSICS_STEPS_PER_SECOND)
+
+        # Creates a PerformanceOverlay object that shows how long each frame takes (and which of
+        # the scheduler's tasks are using the time) and moves it into the "overlay" layer.
+        # It is hidden until the user toggles it.
+        self.__performance_overlay = PerformanceOverlay(self.__canvas,
+                                                        scheduler=self.__scheduler,
+                                                        frame_rate=frame_rate)
+        self.__layers.place("overlay")
 
         # Assigns key bindings for the game
         self.__canvas.bind("<KeyPress-" + key_bindings["Move Paddle Left"] + ">",
@@ -171,6 +214,14 @@ class Game:
         self.__canvas.bind("<KeyPress-" + key_bindings["Set Lives to 10"] + ">",
                            lambda event : self.__set_lives(10))
         self.__canvas.bind("<KeyPress-" + key_bindings["Boss Key"] + ">", self.__show_boss_key)
+        self.__canvas.bind("<KeyPress-" + key_bindings["Toggle Performance Overlay"] + ">",
+                           self.__performance_overlay.toggle)
+        self.__canvas.bind("<KeyPress-" + key_bindings["Dump Trace"] + ">", self.__dump_trace)
+
+        # Pauses the game when the window is minimised or stops looking for key inputs
+        # (e.g. when the user switches to another window).
+        self.__canvas.bind("<FocusOut>", self.__pause_when_inactive)
+        self.__window.bind("<Unmap>", self.__window_unmapped)
 
         # Causes the canvas to start looking for key inputs.
         self.__canvas.focus_set()
@@ -181,7 +232,8 @@ class Game:
         # would have to be rebound everytime the Paddle object instance changes.
 
         # Calls the Paddle object's method to move left.
-        self.__paddle.move_left()
+        self.__world.paddle.move_left()
+        self.__record("left")
 
     def __move_paddle_right(self, event=None):
         # Causes the paddle to move right.
@@ -189,7 +241,8 @@ class Game:
         # would have to be rebound everytime the Paddle object instance changes.
 
         # Calls the Paddle object's method to move right.
-        self.__paddle.move_right()
+        self.__world.paddle.move_right()
+        self.__record("right")
 
     def __stop_paddle(self, event=None):
         # Causes the paddle to stop moving.
@@ -197,73 +250,53 @@ class Game:
         # would have to be rebound everytime the Paddle object instance changes.
 
         # Calls the Paddle object's method to stop moving.
-        self.__paddle.stop()
+        self.__world.paddle.stop()
+        self.__record("stop")
 
-    def __create_initial_bricks(self, brick_height=constants.DEFAULT_BRICK_HEIGHT,
-                      bricks_per_row=constants.DEFAULT_BRICKS_PER_ROW,
-                      row_gap_from_top=constants.DEFAULT_ROW_GAP_FROM_TOP, colours=None):
-        # Creates all of the initial bricks for the game and returns a list of the Brick objects.
+    def __record(self, command, value=None):
+        # Records an input in the game's replay if the game is being recorded.
 
-        # Assigns the default value to the argument if one wasn't already given.
-        if colours is None:
-            colours = constants.DEFAULT_BRICK_COLOURS
+        if self.__recorder is not None:
+            self.__recorder.record(command, value)
 
-        # A list that holds all of the bricks created.
-        bricks = []
+    def __dump_trace(self, event=None):
+        # Writes the spans that have been traced so far to a file if the game is being traced.
 
-        # Gets the canvas's width.
-        canvas_width = self.__canvas.winfo_reqwidth()
+        if TRACER.enabled:
+            TRACER.dump()
 
-        # Calculates the width of each brick so that a row of bricks
-        # takes up the whole canvas width.
-        brick_width = int(canvas_width / bricks_per_row)
+    def __save_replay(self):
+        # Saves the game's replay into replay.json if the game is being recorded.
 
-        # Iterates over the number of rows of bricks.
-        for row, colour in enumerate(colours):
-
-            # Iterates over the x coordinate of the top left corner of each brick.
-            for x in range(0, bricks_per_row * brick_width, brick_width):
-
-                # Calculates the x and y coordinates for the top left corner of the brick.
-                # The coordinates are calculated so that a row of bricks takes up the
-                # whole canvas width, and so that there is a space at the top of the canvas
-                # for the ball to bounce in.
-                brick_left_x = x
-                brick_top_y = row * brick_height + row_gap_from_top * brick_height
-
-                # Calculates the score that the brick will be worth based on which row it's in
-                # (brick's in the top row will be worth more than bricks in the bottom row)
-                brick_score = (len(colours) - row) * constants.DEFAULT_BRICK_SCORE
-
-                # Creates a rectangle at the calculated coordinates in the right colour
-                # for the row that the brick is in.
-                # Appends the Brick object created to the bricks list.
-                bricks.append(Brick(self.__canvas, brick_left_x, brick_top_y, brick_score, colour,
-                                    brick_width, brick_height))
-
-        # Returns the list of Brick objects.
-        return bricks
+        if self.__recorder is not None:
+            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                     "replay.json")
+            self.__recorder.save(file_path)
 
     def __create_transparent_background(self, alpha=100, state="hidden"):
-        # Creates the transparent background image for the game's paused state and stores the
-        # reference to this image in the __transparent_image attribute, and then returns the
-        # object ID for the transparent background image.
+        # Creates a transparent background image for the game's paused state or game over screen
+        # and returns the object ID for the transparent background image.
 
         # Gets the canvas's width and height.
         canvas_width = self.__canvas.winfo_reqwidth()
         canvas_height = self.__canvas.winfo_reqheight()
 
-        # Creates a PIL image that is a mono-colour semi-transparent black image that takes
-        # up the whole canvas with its size.
-        # This is created through the Pillow module to allow alpha transparency.
-        image = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, alpha))
-
-        # Converts the PIL image into a Tkinter PhotoImage and stores a reference to this image.
-        self.__transparent_image = ImageTk.PhotoImage(image)
+        # Gets a mono-colour semi-transparent black image that takes up the whole canvas from the
+        # overlay image cache (which only creates it if no other screen has already)
+        # and stores a reference to this image.
+        image = OVERLAY_IMAGE_CACHE.acquire(canvas_width, canvas_height, alpha=alpha)
+        self.__transparent_images.append(image)
 
         # Returns the object ID of the transparent background image.
-        return self.__canvas.create_image(0, 0, image=self.__transparent_image, anchor="nw",
-                                          state=state)
+        return self.__canvas.create_image(0, 0, image=image, anchor="nw", state=state)
+
+    def __release_transparent_images(self):
+        # Tells the overlay image cache that the game has finished with its transparent
+        # background images so that they can be reused or removed.
+
+        for image in self.__transparent_images:
+            OVERLAY_IMAGE_CACHE.release(image)
+        self.__transparent_images = []
 
     def __create_curved_rectangle_background(self, left_x, top_y, right_x, bottom_y, radius,
                                              **kwargs):
@@ -294,8 +327,10 @@ class Game:
     def __create_menu_option(self, x, y, text, colour="#FFFFFF", font=("TkDefaultFont", 20)):
         # Creates a new pause menu option.
 
-        # Stores the object ID for the new option.
-        text_object_id = self.__canvas.create_text(x, y, text=text, fill=colour, font=font)
+        # Stores the object ID for the new option, which is in the "menu" layer.
+        text_object_id = self.__layers.add(self.__canvas.create_text(x, y, text=text, fill=colour,
+                                                                     font=font),
+                                           "menu")
         self.__paused_object_ids.append(text_object_id)
         self.__pause_menu_selections.append(text)
         self.__selection_to_object_id[text] = text_object_id
@@ -314,40 +349,11 @@ class Game:
         self.__canvas.coords(text_object_id, option_x + option_width/2, option_y)
         self.__canvas.itemconfigure(text_object_id, anchor="e", state="hidden")
 
-    def __move_to_top(self, object_id):
-        # Moves the object with the object ID passed in to the top of the stacking order.
-
-        # Gets the object ID of the object above the object ID passed into the method
-        # in the stacking order.
-        object_above = self.__canvas.find_above(object_id)
-
-        # Iterates whilst the object with the object ID passed into the method
-        # isn't at the top the stacking order (isn't in the foreground).
-        while object_above:
-
-            # Moves the object with the object ID passed into the method above the object above it
-            # in the stacking order.
-            self.__canvas.tag_raise(object_id, object_above)
-
-            # Gets the object ID of the next object above the object ID passed into the method
-            # in the stacking order.
-            object_above = self.__canvas.find_above(object_id)
-
     def __lose_life(self):
-        # Makes the user lose 1 life and displays a game over message if neccessary.
-
-        # Makes the player lose a life and updates the lives text in the game.
-        self.__lives -= 1
-        self.__canvas.itemconfigure(self.__lives_text, text=f"Lives: {self.__lives}")
-
-        # Resets the paddle back to the middle of the game.
-        self.__reset_paddle()
-
-        # Resets the ball back to the middle of the game.
-        self.__create_new_ball()
+        # Displays a game over message if neccessary after the user has lost a life.
 
         # If the player has no more lives then display the game over menu.
-        if self.__lives == 0:
+        if self.__world.lives == 0:
             self.__show_game_over()
 
         # If the game isn't over, then start a 1.5 second countdown.
@@ -355,63 +361,24 @@ class Game:
             self.__timer = 3
             self.countdown()
 
-    def __reset_paddle(self):
-        # Resets the paddle back to the starting position.
-
-        # Removes the old paddle from the game.
-        self.__canvas.delete(self.__paddle.id)
-
-        # Creates a new paddle with the default arguments
-        # so that it's created at the default starting position.
-        new_paddle = Paddle(self.__canvas)
-
-        # Copies all of the relevant attributes of the new paddle to the current paddle
-        # so that the current instance of the paddle acts as the new instance of the paddle.
-        # This is done so that the instance of the Paddle object stored in the Ball object
-        # won't have to change.
-        self.__paddle.id = new_paddle.id
-        self.__paddle.left_x = new_paddle.left_x
-        self.__paddle.top_y = new_paddle.top_y
-        self.__paddle.right_x = new_paddle.right_x
-        self.__paddle.bottom_y = new_paddle.bottom_y
-        self.__paddle.width = new_paddle.width
-
-    def __create_new_ball(self):
-        # Resets the ball back to the starting position and applies level scaling.
-
-        # Removes the old ball from the game if there was a ball previously.
-        if self.__ball is not None:
-            self.__canvas.delete(self.__ball.id)
-
-        # Adjusts some of the default arguments for the Ball object to make further levels harder.
-        ball_bounces_until_speed_up = max(1, constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP
-                                             - self.__level + 1)
-        ball_speed_up_amount = constants.DEFAULT_SPEED_UP_AMOUNT * 1.2**(self.__level - 1)
-        ball_y_velocity = constants.DEFAULT_BALL_SPEED * 1.2**(self.__level - 1)
-
-        # Creates a new ball with the default arguments so that it's created at the default
-        # starting position.
-        self.__ball = Ball(self.__canvas, self.__paddle, self.__bricks, self.__level,
-                           y_velocity=ball_y_velocity,
-                           bounces_until_speed_up=ball_bounces_until_speed_up,
-                           speed_up_amount=ball_speed_up_amount)
-
-        # Adjusts some of the ball's attributes to make the game exponentially more difficult
-        # in further levels.
-        self.__ball.speed = constants.DEFAULT_BALL_SPEED *  1.2 ** (self.__level - 1)
-
     def __show_game_over(self):
         # Shows the game over menu, prompts the user to enter their initials
         # and then returns to the main menu.
 
         # Causes the main game loop to stop.
+        # As the game loop won't flush the canvas any more, the canvas is flushed when
+        # Tkinter is idle instead.
         self.__game_over = True
+        self.__canvas.auto_flush = True
 
         # Covers the screen in a semi-transparent black background.
-        self.__create_transparent_background(210, "normal")
+        # The game over screen is in the "modal" layer so that it covers everything else.
+        self.__layers.add(self.__create_transparent_background(210, "normal"), "modal")
 
         # Creates a grey curved rectangle background for the game over screen.
-        self.__create_curved_rectangle_background(250, 100, 550, 400, 100, fill="#696969")
+        self.__layers.add(self.__create_curved_rectangle_background(250, 100, 550, 400, 100,
+                                                                    fill="#696969"),
+                          "modal")
 
         # Creates a Tkinter string variable which will store what the user inputs.
         initials = StringVar()
@@ -422,20 +389,24 @@ class Game:
 
         # Creates the text and input box for the game over screen.
         self.__canvas.create_text(400, 150, fill="#FFFFFF", font=("TkDefaultFont", 20),
-                                  text="Game Over")
+                                  text="Game Over", tags="modal")
         self.__canvas.create_text(400, 200, fill="#FFFFFF", font=("TkDefaultFont", 20),
-                                  text=f"Score: {self.__score}")
+                                  text=f"Score: {self.__world.score}", tags="modal")
         self.__canvas.create_text(400, 250, fill="#FFFFFF", font=("TkDefaultFont", 20),
-                                  text="Enter your initials:")
+                                  text="Enter your initials:", tags="modal")
         self.__initials_entry = Entry(self.__window, background="#000000", foreground="#FFFFFF",
                                     insertbackground="#FFFFFF", font=("TkDefaultFont", 20),
                                     textvariable=initials, width=3, justify="center")
-        self.__canvas.create_window(400, 300, window=self.__initials_entry)
+        self.__canvas.create_window(400, 300, window=self.__initials_entry, tags="modal")
 
         # Configures the "> Done" text so that the "Done" is centred
         # and the "> " is to the left of it.
         done_text_id = self.__canvas.create_text(400, 350, fill="#FFFFFF",
-                                                 font=("TkDefaultFont", 20), text="Done")
+                                                 font=("TkDefaultFont", 20), text="Done",
+                                                 tags="modal")
+
+        # Moves the text into the "modal" layer.
+        self.__layers.place("modal")
         done_text_x = self.__canvas.coords(done_text_id)[0]
         done_text_y = self.__canvas.coords(done_text_id)[1]
         done_text_width = self.__canvas.bbox(done_text_id)[2] - self.__canvas.bbox(done_text_id)[0]
@@ -482,78 +453,68 @@ class Game:
         # If the user entered some initials, then store their score on the leaderboard
         # if their score is within the top 10.
         if initials:
-            self.__store_on_leaderboard(initials)
+            store_on_leaderboard(initials, self.__world.score)
+
+        # Saves the replay of the game so that it can be played back.
+        self.__save_replay()
 
-        # Causes the game's canvas to not be drawn to the window.
+        # Causes the game's canvas to not be drawn to the window and releases its images.
         self.__canvas.pack_forget()
+        self.__release_transparent_images()
 
         # Tells the program that the game has finished and to switch back to
         # the main menu state.
-        self.__game_finished = True
+        self.__signal_finished()
 
-    def __store_on_leaderboard(self, initials):
-        # Stores the user's score on the leaderboard with their initials
-        # if their score is within the top 10.
+    def __signal_finished(self):
+        # Marks the game as finished and tells whatever is waiting for it to finish.
 
-        # Open the leaderboard.csv file to check that the user is in the top 10.
-        try:
+        self.__window.unbind("<Unmap>")
+        self.__game_finished = True
+        if self.__on_finish is not None:
+            self.__on_finish()
 
-            # Opens leaderboard.csv and appends the data into a list.
-            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
-                                     "leaderboard.csv")
-            with open(file_path, "rt", encoding="utf-8") as f:
-                csv_reader = csv.reader(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
-                scores = []
-                for row in csv_reader:
-                    scores.append(row)
+    def __suspend(self):
+        # Stops the game loop whilst the game can't be played, so that the game uses no CPU time
+        # until it is resumed. Whilst the game loop isn't running, the canvas sends changes
+        # (e.g. to the pause menu) to Tkinter by itself when Tkinter is idle.
 
-        # If the leaderboard file doesn't exist then create a new file.
-        except FileNotFoundError:
+        if self.__suspended:
+            return
 
-            # Writes the user's inputted initials and score to the csv file.
-            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
-                                     "leaderboard.csv")
-            with open(file_path, "wt", encoding="utf-8", newline="") as f:
-                csv_writer = csv.writer(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
-                csv_writer.writerow([initials, self.__score])
+        self.__suspended = True
+        self.__scheduler.cancel("game loop")
+        self.__canvas.auto_flush = True
 
-        # If the file did exist, then check if the user's score should be added to the leaderboard
-        else:
+    def __resume(self):
+        # Starts the game loop again after it has been suspended.
 
-            # If there are less than 10 scores in the leaderboard, or the user's score is greater
-            # than or equal to the 10th score on the leaderboard, then add the user's score
-            # to the leaderboard.
-            if len(scores) < 10 or self.__score >= scores[9][1]:
-                self.__insert_into_list(scores, [initials, self.__score])
+        if not self.__suspended or self.__game_over:
+            return
 
-                # Makes it so that only the top 10 scores are stored on the leaderboard.
-                scores = scores[:10]
+        self.__suspended = False
+        self.__canvas.auto_flush = False
 
-                # Writes the new top 10 scores to the leaderboard.
-                file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
-                                         "leaderboard.csv")
-                with open(file_path, "wt", encoding="utf-8", newline="") as f:
-                    csv_writer = csv.writer(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
-                    for row in scores:
-                        csv_writer.writerow(row)
+        # Forgets when the last frame was, so that the time the game was suspended for isn't
+        # counted as one very long frame.
+        self.__last_frame_time = None
+        self.__last_frame_end_time = None
+        self.game_loop()
 
-    def __insert_into_list(self, two_d_list, list_to_insert):
-        # Inserts a list into the 2d list based on the second index of each element.
+    def __window_unmapped(self, event=None):
+        # Pauses the game when the window is minimised.
+        # Unmap events from the canvases inside the window are also sent here, and are ignored
+        # as the window is still shown.
 
-        # i holds the end index of the sorted part of the list.
-        i = len(two_d_list) - 1
+        if event is None or event.widget is self.__window:
+            self.__pause_when_inactive()
 
-        # Increase the 2d list's size to allow the list to be inserted.
-        two_d_list.append([])
+    def __pause_when_inactive(self, event=None):
+        # Shows the pause menu when the window is minimised or the canvas loses the focus,
+        # unless the game is already paused (which includes the boss key being shown) or over.
 
-        # Moves all elements in the sorted part of the 2d list that have a lower second
-        # index value than the list argument's second index to the right.
-        while i >= 0 and list_to_insert[1] >= two_d_list[i][1]:
-            two_d_list[i + 1] = two_d_list[i]
-            i -= 1
-
-        # Inserts the list argument where the last element that moved originally was.
-        two_d_list[i + 1] = list_to_insert
+        if not self.__paused and not self.__game_over and not self.__game_finished:
+            self.__toggle_pause()
 
     def __toggle_pause(self, event=None):
         # Toggles whether the game is in the paused state or not.
@@ -562,14 +523,13 @@ class Game:
         # and show the relevant paused state objects in the foreground.
         if not self.__paused:
             self.__paused = True
+            self.__record("pause")
             for object_id in self.__paused_object_ids:
                 self.__canvas.itemconfigure(object_id, state="normal")
-                self.__move_to_top(object_id)
 
-            # If there is a countdown, then stop it.
-            if self.__countdown_occuring:
-                self.__canvas.after_cancel(self.__countdown_id)
-                self.__countdown_occuring = False
+            # If there is a countdown, then pause it so that it carries on from where it stopped
+            # when the game is unpaused.
+            self.__scheduler.pause("countdown")
 
             # Binds the user pressing the relevant key binding to selecting the pause menu option
             # they have selected.
@@ -585,10 +545,14 @@ class Game:
                 self.__canvas.itemconfigure(self.__selection_to_object_id[self.__pause_menu_selection],
                                             text=f"> {self.__pause_menu_selection}")
 
+            # Stops the game loop until the game is unpaused.
+            self.__suspend()
+
         # If the game was in the paused state then set it out of the paused state
         # and hide the relevant paused state objects.
         else:
             self.__paused = False
+            self.__record("resume")
             for object_id in self.__paused_object_ids:
                 self.__canvas.itemconfigure(object_id, state="hidden")
 
@@ -596,9 +560,10 @@ class Game:
             # they have selected so that the user can't select options when the game is unpaused.
             self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">")
 
-            # Starts a 1.5 second countdown.
-            self.__timer = 3
-            self.countdown()
+            # Carries on with the countdown if one was paused, or otherwise starts a 1.5 second
+            # countdown, and starts the game loop again.
+            self.__continue_countdown()
+            self.__resume()
 
     def __toggle_selection_up(self, event=None):
         # Changes the user's selection in the pause menu to the one
@@ -648,72 +613,25 @@ class Game:
         # If the user's currently selected option is Return to Main Menu then
         # return to the main menu by ending the game loop.
         elif self.__pause_menu_selection == "Return to Main Menu":
-            self.__canvas.after_cancel(self.__game_loop_id)
+            self.__scheduler.cancel("game loop")
+            self.__scheduler.cancel("countdown")
+
+            # Saves the replay of the game so that it can be played back.
+            self.__save_replay()
 
-            # Causes the game's canvas to not be drawn to the window.
+            # Causes the game's canvas to not be drawn to the window and releases its images.
             self.__canvas.pack_forget()
+            self.__release_transparent_images()
 
             # Tells the program that the game has finished and to switch back to
             # the main menu state.
-            self.__game_finished = True
+            self.__signal_finished()
 
     def __save_game(self):
         # Saves all of the relevant game information into data.json.
 
-        # Data structures that will store all of the data necessary to save the game.
-        data = {}
-        game_data = {}
-        paddle_data = {}
-        ball_data = {}
-        bricks_data = []
-
-        # Stores all of the relevant game data into the data dictionary.
-        game_data["lives"] = self.__lives
-        game_data["score"] = self.__score
-        game_data["level"] = self.__level
-        data["game"] = game_data
-
-        # Stores all of the relevant paddle data into the data dictionary.
-        paddle_data["left_x"] = self.__paddle.left_x
-        paddle_data["top_y"] = self.__paddle.top_y
-        paddle_data["right_x"] = self.__paddle.right_x
-        paddle_data["bottom_y"] = self.__paddle.bottom_y
-        paddle_data["width"] = self.__paddle.width
-        paddle_data["height"] = self.__paddle.height
-        paddle_data["colour"] = self.__paddle.colour
-        paddle_data["canvas_gap"] = self.__paddle.canvas_gap
-        data["paddle"] = paddle_data
-
-        # Stores all of the relevant ball data into the data dictionary.
-        ball_data["x_velocity"] = self.__ball.x_velocity
-        ball_data["y_velocity"] = self.__ball.y_velocity
-        ball_data["speed"] = self.__ball.speed
-        ball_data["bounces_until_speed_up"] = self.__ball.bounces_until_speed_up
-        ball_data["speed_up_amount"] = self.__ball.speed_up_amount
-        ball_data["radius"] = self.__ball.radius
-        ball_data["left_x"] = self.__ball.left_x
-        ball_data["top_y"] = self.__ball.top_y
-        ball_data["right_x"] = self.__ball.right_x
-        ball_data["bottom_y"] = self.__ball.bottom_y
-        ball_data["colour"] = self.__ball.colour
-        ball_data["paddle_gap"] = self.__ball.paddle_gap
-        data["ball"] = ball_data
-
-        # Iterates over each Brick object in the game.
-        for brick in self.__bricks:
-
-            # Stores all of the relevant brick data into the bricks_data list.
-            brick_data = {}
-            brick_data["x"] = brick.left_x
-            brick_data["y"] = brick.top_y
-            brick_data["width"] = brick.width
-            brick_data["height"] = brick.height
-            brick_data["score"] = brick.score
-            brick_data["colour"] = brick.colour
-            bricks_data.append(brick_data)
-
-        # Stores the bricks data into the data dictionary.
-        data["bricks"] = bricks_data
+        # Gets all of the data necessary to save the game from the world.
+        data = self.__world.to_save_data()
 
         # Writes the data necessary to save the game into a JSON file.
         file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
@@ -722,20 +640,7 @@ class Game:
             json.dump(data, f)
 
     def __next_level(self):
-        # Causes the game to go onto the next level.
-
-        # Increases the game's level.
-        self.__level += 1
-        self.__canvas.itemconfigure(self.__level_text, text=f"Level {self.__level}")
-
-        # Creates a new set of bricks for the game.
-        self.__bricks = self.__create_initial_bricks()
-
-        # Resets the paddle back to the middle of the game.
-        self.__reset_paddle()
-
-        # Resets the ball back to the middle of the game and applies level scaling.
-        self.__create_new_ball()
+        # Gives the user time to prepare after the game has gone onto the next level.
 
         # Starts a 1.5 second countdown.
         self.__timer = 3
@@ -744,23 +649,16 @@ class Game:
     def __reset_ball_speed(self, event=None):
         # Resets the ball's speed back to the default value.
 
-        # Sets the ball's speed back to the default value.
-        self.__ball.speed = constants.DEFAULT_BALL_SPEED
-
-        # Calculates the angle that the ball is travelling at.
-        # The angle is taken anti-clockwise from the positive x-axis.
-        angle = math.atan2(self.__ball.y_velocity, self.__ball.x_velocity)
-
-        # Updates the ball's velocities so that it still travels in the same direction but
-        # with the updated speed.
-        self.__ball.x_velocity = self.__ball.speed * math.cos(angle)
-        self.__ball.y_velocity = self.__ball.speed * math.sin(angle)
+        # Calls the World object's method to reset the ball's speed.
+        self.__world.reset_ball_speed()
+        self.__record("reset_ball_speed")
 
     def __set_lives(self, value):
         # Sets the number of lives the user has to the argument.
+        # The lives text is updated the next time the renderer is synced.
 
-        self.__lives = value
-        self.__canvas.itemconfigure(self.__lives_text, text=f"Lives: {self.__lives}")
+        self.__world.lives = value
+        self.__record("set_lives", value)
 
     def __show_boss_key(self, event=None):
         # Shows the boss key on the screen and pauses the game processes.
@@ -770,10 +668,12 @@ class Game:
         self.__paused_before_boss_key = self.__paused
         self.__paused = True
 
-        # If there is a countdown, then stop it.
-        if self.__countdown_occuring:
-            self.__canvas.after_cancel(self.__countdown_id)
-            self.__countdown_occuring = False
+        # If there is a countdown, then pause it so that it carries on from where it stopped
+        # when the boss key is hidden.
+        self.__scheduler.pause("countdown")
+
+        # Stops the game loop whilst the boss key is being shown.
+        self.__suspend()
 
         # When the game's canvas gets the focus again (which will happen when the boss
         # key image is hidden), call a method that causes the game to resume as normal.
@@ -796,7 +696,19 @@ class Game:
         if self.__game_over:
             self.__initials_entry.focus_set()
 
-        # Otherwise, start a 1.5 second countdown.
+        # Otherwise, if the game wasn't paused, then carry on with the countdown or start a new
+        # one, and start the game loop again. If it was paused, then the pause menu is shown
+        # (with any countdown still paused) until the user resumes the game.
+        elif not self.__paused:
+            self.__continue_countdown()
+            self.__resume()
+
+    def __continue_countdown(self):
+        # Resumes the countdown if it was paused part of the way through, or otherwise starts
+        # a 1.5 second countdown so that the user has time to get ready.
+
+        if self.__scheduler.is_paused("countdown"):
+            self.__scheduler.resume("countdown")
         else:
             self.__timer = 3
             self.countdown()
@@ -814,6 +726,9 @@ class Game:
                                           using Tkinter key bindings.
         """
 
+        # Stores the time that the countdown step started at so that it can be traced.
+        start = time.perf_counter()
+
         # The countdown only appears if the game isn't paused.
         if not self.__paused:
 
@@ -822,10 +737,9 @@ class Game:
             self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Move Paddle Right"] + ">")
 
             # Shows the timer in the middle of the screen with a transparent background.
+            # Both are in the "menu" layer, so they are already in front of the bricks.
             self.__canvas.itemconfigure(self.__paused_background, state="normal")
-            self.__move_to_top(self.__paused_background)
             self.__canvas.itemconfigure(self.__timer_text, state="normal", text=self.__timer)
-            self.__move_to_top(self.__timer_text)
 
             # Decrements the timer.
             self.__timer -= 1
@@ -847,49 +761,133 @@ class Game:
             # If the timer is greater than or equal to 0, then call this method again
             # in 1 second to update the timer on screen.
             else:
-                self.__countdown_id = self.__canvas.after(500, self.countdown)
+                self.__scheduler.schedule("countdown", self.countdown, 0.5)
+
+        TRACER.add_span("Game.countdown", start)
 
     def game_loop(self):
         """Continuously calls methods that move the ball and paddle,
         and displays the pause menu when the game is paused
 
-        This only needs to be called once as it repeatedly calls itself until the program ends.
+        This only needs to be called once as it repeatedly calls itself until the game is over.
+        It stops whilst the game is paused or the boss key is being shown, and is called again
+        when the game is resumed.
+        The world is stepped at a fixed rate of constants.PHYSICS_STEPS_PER_SECOND based on how
+        much real time has passed, so slow frames don't slow the game down, and the game plays
+        out the same whatever the frame rate is.
         """
 
-        # If the game isn't paused and a countdown isn't occuring, then move the ball and
-        # paddle and update lives and score accordingly.
-        if not self.__paused and not self.__countdown_occuring:
-
-            # Causes the paddle to move based on its speed.
-            self.__paddle.move()
-
-            # Causes the ball to move based on its velocity,
-            # and then return whether the user should lose lives or not
-            # and any score the user gained from destroying bricks.
-            lose_life, score = self.__ball.move()
-
-            # Add the score that the player gained from destroying bricks to their total score
-            # with higher level bricks being worth a higher score.
-            self.__score += self.__level * score
+        # Gets the time that this frame started at and how long it has been since the last frame.
+        now = time.perf_counter()
+        if self.__last_frame_time is None:
+            self.__last_frame_time = now
+            self.__next_frame_deadline = now
+        elapsed = now - self.__last_frame_time
+        self.__last_frame_time = now
+
+        # Gets how long the game was waiting for Tkinter between the last frame and this one.
+        if self.__last_frame_end_time is None:
+            idle_time = 0.0
+        else:
+            idle_time = now - self.__last_frame_end_time
 
-            # Updates the score text in the game.
-            self.__canvas.itemconfigure(self.__score_text, text=f"Score: {self.__score}")
+        # Stores whether the user lost a life or cleared the level during this frame.
+        lost_life = False
+        level_cleared = False
 
-            # If the user should lose lives then call the method for that to happen.
-            if lose_life:
+        # If the game isn't paused and a countdown isn't occuring, then step the world as many
+        # times as are owed for the time that has passed so that the ball and paddle move
+        # and the lives, score and level are updated accordingly.
+        if not self.__paused and not self.__countdown_occuring:
+            self.__accumulator += elapsed
+
+            # Stores how many steps have been taken this frame.
+            steps = 0
+
+            # Steps the world until it has caught up with real time, up to a maximum number of
+            # steps so that a very slow frame can't cause the game to spiral further behind.
+            while (self.__accumulator >= self.__timestep
+                   and steps < constants.MAX_PHYSICS_STEPS_PER_FRAME):
+                with TRACER.span("World.step"):
+                    lost_life, level_cleared = self.__world.step()
+                if self.__recorder is not None:
+                    self.__recorder.advance()
+                self.__accumulator -= self.__timestep
+                steps += 1
+
+                # If the user lost a life or cleared the level, then stop stepping
+                # as a countdown or the game over menu is about to be shown.
+                if lost_life or level_cleared:
+                    self.__accumulator = 0.0
+                    break
+
+            # Counts any steps beyond the first in this frame as merged steps.
+            if steps > 1:
+                self.__merged_steps += steps - 1
+
+            # If the world is still more than a step behind after the maximum number of steps,
+            # then drop the steps that are owed so that the game slows down instead of
+            # trying to catch up forever.
+            if self.__accumulator >= self.__timestep:
+                dropped_steps = int(self.__accumulator // self.__timestep)
+                self.__dropped_steps += dropped_steps
+                self.__accumulator -= dropped_steps * self.__timestep
+
+            # Gets how far through the next physics step the game is, which is how far between
+            # their last two positions the ball and paddle are drawn.
+            alpha = self.__accumulator / self.__timestep
+
+        # If the game is paused or a countdown is occuring, then don't owe any steps for the time
+        # that has passed, and draw the ball and paddle where they are.
+        else:
+            self.__accumulator = 0.0
+            alpha = 1.0
+
+        # Updates the canvas once so that it matches the state of the world and sends all of
+        # this frame's changes to Tkinter, and times how long the physics and rendering took
+        # for the performance overlay.
+        render_start_time = time.perf_counter()
+        with TRACER.span("Renderer.sync"):
+            self.__renderer.sync(alpha)
+        with TRACER.span("CanvasProxy.flush"):
+            self.__canvas.flush()
+        render_end_time = time.perf_counter()
+        self.__performance_overlay.record_frame(elapsed, render_start_time - now,
+                                                render_end_time - render_start_time, idle_time,
+                                                self.__canvas.frame_calls)
+
+        # If the user lost a life, then show the game over menu or a countdown.
+        if lost_life:
+            with TRACER.span("Game.lose_life"):
                 self.__lose_life()
 
-            # If there are no more bricks left, then go onto the next level
-            # and fill the screen with bricks again.
-            if not self.__bricks:
+        # If the user destroyed all of the bricks, then show a countdown before the next level.
+        if level_cleared:
+            with TRACER.span("Game.next_level"):
                 self.__next_level()
 
         # If the game isn't over, then repeatedly call the game loop.
         if not self.__game_over:
 
-            # Makes it so that the paddle and ball are moved every 17ms
-            # (approximately 60 times per second).
-            self.__game_loop_id = self.__canvas.after(17, self.game_loop)
+            # Moves the deadline for the next frame on by one frame at a time so that the frames
+            # stay in time with each other even if one of them starts late.
+            # If the game has fallen more than a frame behind, then start again from now
+            # instead of running lots of frames back to back.
+            while self.__next_frame_deadline <= now:
+                self.__next_frame_deadline += self.__frame_interval
+            if self.__next_frame_deadline - now > self.__frame_interval:
+                self.__next_frame_deadline = now + self.__frame_interval
+
+            # Makes it so that the game loop is called again at the next frame's deadline.
+            # It has a higher priority than the countdown so that if they are due together,
+            # the frame is drawn before the countdown changes.
+            self.__scheduler.schedule("game loop", self.game_loop,
+                                      max(0.0, self.__next_frame_deadline - time.perf_counter()),
+                                      priority=1)
+
+        # Stores when this frame's work finished so that the next frame can measure the idle time.
+        self.__last_frame_end_time = time.perf_counter()
+        TRACER.add_span("Game.game_loop", now, self.__last_frame_end_time)
 
     @property
     def game_finished(self):
@@ -898,60 +896,98 @@ class Game:
 
         return self.__game_finished
 
+    @property
+    def dropped_steps(self):
+        """(int): How many physics steps have been dropped because the game fell too far behind"""
+
+        return self.__dropped_steps
+
+    @property
+    def merged_steps(self):
+        """(int): How many extra physics steps have been run in frames that had to catch up"""
+
+        return self.__merged_steps
+
+    @property
+    def performance_overlay(self):
+        """(PerformanceOverlay): The PerformanceOverlay object that shows how long each
+        frame takes"""
+
+        return self.__performance_overlay
+
+    @property
+    def world(self):
+        """(World): The World object that holds the state of the game"""
+
+        return self.__world
+
+    @property
+    def recorder(self):
+        """(ReplayRecorder): The ReplayRecorder object that records the game's inputs,
+        or None if the game isn't being recorded"""
+
+        return self.__recorder
+
+    @recorder.setter
+    def recorder(self, value):
+
+        self.__recorder = value
+
     @property
     def lives(self):
         """(int): The number of lives the user has"""
 
-        return self.__lives
+        return self.__world.lives
 
     @lives.setter
     def lives(self, value):
 
-        self.__lives = value
+        self.__world.lives = value
 
     @property
     def lives_text(self):
         """(int): The object ID for the text displaying the user's lives in the game"""
 
-        return self.__lives_text
+        return self.__renderer.lives_text
 
     @property
     def score(self):
         """(int): The score the user has"""
 
-        return self.__score
+        return self.__world.score
 
     @score.setter
     def score(self, value):
 
-        self.__score = value
+        self.__world.score = value
 
     @property
     def score_text(self):
         """(int): The object ID for the text displaying the user's score in the game"""
 
-        return self.__score_text
+        return self.__renderer.score_text
 
     @property
     def level(self):
         """(int): The level that the game is on."""
 
-        return self.__level
+        return self.__world.level
 
     @property
     def level_text(self):
         """(int): The object ID for the text displaying the game's level"""
 
-        return self.__level_text
+        return self.__renderer.level_text
 
     @level.setter
     def level(self, value):
 
-        self.__level = value
+        self.__world.level = value
 
     @property
     def canvas(self):
-        """(Canvas): The Canvas object that the game's objects are drawn on"""
+        """(CanvasProxy): The CanvasProxy object that wraps the canvas the game's objects are
+        drawn on"""
 
         return self.__canvas
 
@@ -959,34 +995,57 @@ class Game:
     def paddle(self):
         """(Paddle): The Paddle object that represents the game's paddle"""
 
-        return self.__paddle
+        return self.__world.paddle
 
     @paddle.setter
     def paddle(self, value):
 
-        self.__paddle = value
+        self.__world.paddle = value
 
     @property
     def bricks(self):
-        """(List[Brick]): A list of Brick objects that represents the game's bricks"""
+        """(BrickField): The brick field that stores the game's bricks"""
 
-        return self.__bricks
+        return self.__world.bricks
 
     @bricks.setter
     def bricks(self, value):
 
-        self.__bricks = value
+        self.__world.bricks = value
 
     @property
     def ball(self):
-        """(Ball): The Ball object that represets the game's ball"""
+        """(Ball): The Ball object that represets the game's first ball.
+        Setting this replaces all of the balls in the game with the new ball."""
 
-        return self.__ball
+        return self.__world.ball
 
     @ball.setter
     def ball(self, value):
 
-        self.__ball = value
+        self.__world.ball = value
+
+    @property
+    def balls(self):
+        """(List[Ball]): The Ball objects that represent all of the balls in the game"""
+
+        return self.__world.balls
+
+    @balls.setter
+    def balls(self, value):
+
+        self.__world.balls = value
+
+    @property
+    def multi_ball(self):
+        """(bool): Whether balls split when they destroy a brick"""
+
+        return self.__world.multi_ball
+
+    @multi_ball.setter
+    def multi_ball(self, value):
+
+        self.__world.multi_ball = value
 
     @property
     def timer(self):
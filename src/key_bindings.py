@@ -1,13 +1,14 @@
 import json
 import os
-from PIL import Image, ImageTk
 from tkinter import Canvas
 import constants
+from layers import LayerManager
+from overlay_image_cache import OVERLAY_IMAGE_CACHE
 
 class KeyBindings:
     """A class that represents when the program is in the edit key bindings state"""
 
-    def __init__(self, window, key_bindings, boss_key):
+    def __init__(self, window, key_bindings, boss_key, on_finish=None):
         """Initialises KeyBindings and creates text on the screen to represent the key bindings
         the user can edit
 
@@ -16,10 +17,15 @@ class KeyBindings:
             key_bindings (dict[str: str]): A dictionary that maps the commands for the key
                                            bindings screen to the key binding
             boss_key (BossKey): A BossKey object that holds the boss key image and key bindings
+            on_finish (Callable[[], None]) (default None): Called when the user exits the key
+                                                           bindings screen and the program
+                                                           should switch back to the main
+                                                           menu state
         """
 
         # Assigns values to the object's attributes based on the arguments to the initialiser.
         self.__boss_key = boss_key
+        self.__on_finish = on_finish
 
         # Loads the key bindings and stores them in a dictionary.
         self.__key_bindings = key_bindings
@@ -54,22 +60,33 @@ class KeyBindings:
         # Creates the text objects on the canvas
         self.__create_text_objects()
 
+        # Creates a LayerManager object for the canvas. The text objects were created first,
+        # so they are behind every layer.
+        layers = LayerManager(self.__canvas)
+
         # Stores the object ID of the transparent background for the edit key binding state.
-        self.__edit_key_binding_background = self.__create_transparent_background()
+        # The edit key binding state's objects are in the "modal" layer so that they cover the
+        # text objects.
+        self.__edit_key_binding_background = layers.add(self.__create_transparent_background(),
+                                                        "modal")
 
         # Stores the object ID for the text that tells the user to input their key binding.
         self.__user_prompt_message = self.__canvas.create_text(canvas_width/2, canvas_height/2 - 15,
                                                                text="Input your key binding",
                                                                fill="#FFFFFF",
                                                                font=("TkDefaultFont", 20),
-                                                               state="hidden", anchor="s")
+                                                               state="hidden", anchor="s",
+                                                               tags="modal")
 
         # Stores the object ID for the error message text when the user inputs an invalid
         # key binding.
         self.__error_message = self.__canvas.create_text(canvas_width/2, canvas_height/2 + 15,
                                                          text="", fill="#FFFFFF",
                                                          font=("TkDefaultFont", 20), state="hidden",
-                                                         anchor="n")
+                                                         anchor="n", tags="modal")
+
+        # Moves the messages into the "modal" layer in front of the background.
+        layers.place("modal")
 
         # Binds the keybinds for the key bindings canvas.
         self.__canvas.bind("<KeyPress-" + key_bindings["Move Menu Pointer Up"] + ">",
@@ -242,9 +259,7 @@ class KeyBindings:
 
             # Greys out the rest of the screen and tells the user to input their key binding.
             self.__canvas.itemconfigure(self.__edit_key_binding_background, state="normal")
-            self.__move_to_top(self.__edit_key_binding_background)
             self.__canvas.itemconfigure(self.__user_prompt_message, state="normal")
-            self.__move_to_top(self.__user_prompt_message)
 
             # Binds the next key that the user presses to be the new key binding for the selected
             # command if valid.
@@ -277,7 +292,6 @@ class KeyBindings:
         if key_bind in key_bindings_without_selection.values():
             self.__canvas.itemconfigure(self.__error_message, state="normal",
                                         text="ERROR: That key is already bound to another command")
-            self.__move_to_top(self.__error_message)
             key_bind = None
 
         # If the key bind the user inputted is valid then save it and reset the window to show the
@@ -314,25 +328,6 @@ class KeyBindings:
             self.__canvas.bind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">",
                                lambda event : self.__boss_key.show_boss_key(self.__canvas))
 
-    def __move_to_top(self, object_id):
-        # Moves the object with the object ID passed in to the top of the stacking order.
-
-        # Gets the object ID of the object above the object ID passed into the method
-        # in the stacking order.
-        object_above = self.__canvas.find_above(object_id)
-
-        # Iterates whilst the object with the object ID passed into the method
-        # isn't at the top the stacking order (isn't in the foreground).
-        while object_above:
-
-            # Moves the object with the object ID passed into the method above the object above it
-            # in the stacking order.
-            self.__canvas.tag_raise(object_id, object_above)
-
-            # Gets the object ID of the next object above the object ID passed into the method
-            # in the stacking order.
-            object_above = self.__canvas.find_above(object_id)
-
     def __create_transparent_background(self, alpha=220):
         # Creates the transparent background image for the game's edit key binding state
         # and stores the reference to this image in the __transparent_image attribute,
@@ -342,13 +337,10 @@ class KeyBindings:
         canvas_width = self.__canvas.winfo_reqwidth()
         canvas_height = self.__canvas.winfo_reqheight()
 
-        # Creates a PIL image that is a mono-colour semi-transparent black image that takes
-        # up the whole canvas with its size.
-        # This is created through the Pillow module to allow alpha transparency.
-        image = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, alpha))
-
-        # Converts the PIL image into a Tkinter PhotoImage and stores a reference to this image.
-        self.__transparent_image = ImageTk.PhotoImage(image)
+        # Gets a mono-colour semi-transparent black image that takes up the whole canvas from the
+        # overlay image cache, which reuses the image from the last visit to this screen.
+        self.__transparent_image = OVERLAY_IMAGE_CACHE.acquire(canvas_width, canvas_height,
+                                                               alpha=alpha)
 
         # Returns the object ID of the transparent background image.
         return self.__canvas.create_image(0, 0, image=self.__transparent_image, anchor="nw",
@@ -357,11 +349,15 @@ class KeyBindings:
     def __exit_key_bindings(self):
         # Exits the key binding editing screen and tells the program to go back to the main menu.
 
-        # Causes the key binding canvas to not be drawn to the window.
+        # Causes the key binding canvas to not be drawn to the window and releases its
+        # transparent background image.
         self.__canvas.pack_forget()
+        OVERLAY_IMAGE_CACHE.release(self.__transparent_image)
 
         # Tells the program that it should switch back to the main menu state.
         self.__finished = True
+        if self.__on_finish is not None:
+            self.__on_finish()
 
     @property
     def finished(self):
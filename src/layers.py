@@ -0,0 +1,70 @@
+import constants
+
+class LayerManager:
+    """A class that keeps the items on a canvas in named layers, so that every item in a layer
+    is drawn in front of every item in the layers below it
+
+    Each layer has a hidden marker item at its top, and the items in a layer are tagged with the
+    layer's name. An item is put into a layer by lowering it to just below the layer's marker,
+    which is one call to the canvas no matter how many items there are, so items never need
+    to be raised one step at a time. Items created before the LayerManager stay below every layer.
+
+    Methods:
+        add(item, layer): Puts an item at the top of a layer
+        place(layer): Moves every item tagged with a layer's name to the top of that layer
+    """
+
+    def __init__(self, canvas, layers=constants.CANVAS_LAYERS):
+        """Initialises LayerManager and creates the marker for each layer
+
+        Parameters:
+            canvas (Canvas): The canvas that the layers are on
+            layers (List[str]) (default constants.CANVAS_LAYERS): The names of the layers
+                                                                  from back to front
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__canvas = canvas
+        self.__layers = list(layers)
+
+        # Creates a hidden marker for the top of each layer from back to front, so that the
+        # markers are in the same order as the layers.
+        self.__markers = {}
+        for layer in self.__layers:
+            self.__markers[layer] = canvas.create_line(0, 0, 0, 0, state="hidden")
+
+    def add(self, item, layer):
+        """Puts an item at the top of a layer, in front of the items already in the layer
+
+        Parameters:
+            item (int): The ID of the item
+            layer (str): The name of the layer
+
+        Returns:
+            item (int): The ID of the item, so that this can wrap the call that creates it
+        """
+
+        # Tags the item with the layer's name and moves it to just below the layer's marker.
+        self.__canvas.addtag_withtag(layer, item)
+        self.__canvas.tag_lower(item, self.__markers[layer])
+
+        return item
+
+    def place(self, layer):
+        """Moves every item tagged with a layer's name to the top of that layer, keeping their
+        order, which is useful after creating items with the layer's name as a tag
+
+        Parameters:
+            layer (str): The name of the layer
+        """
+
+        self.__canvas.tag_lower(layer, self.__markers[layer])
+
+    @property
+    def layers(self):
+        """(List[str]): The names of the layers from back to front"""
+
+        return self.__layers
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -5,7 +5,7 @@ from tkinter import Canvas
 class Leaderboard:
     """A class that represents when the program is in the leaderboard state"""
 
-    def __init__(self, window, key_bindings, boss_key):
+    def __init__(self, window, key_bindings, boss_key, on_finish=None):
         """Initialises Leaderboard and creates text on the screen to represent the data
         in the leaderboard
 
@@ -14,8 +14,14 @@ class Leaderboard:
             key_bindings (dict[str: str]): A dictionary that maps the commands for the
                                            leaderboard to the key binding
             boss_key (BossKey): A BossKey object that holds the boss key image and key bindings
+            on_finish (Callable[[], None]) (default None): Called when the user exits the
+                                                           leaderboard and the program should
+                                                           switch back to the main menu state
         """
 
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__on_finish = on_finish
+
         # Gets the window's width and height.
         window_width = window.winfo_reqwidth()
         window_height = window.winfo_reqheight()
@@ -140,6 +146,8 @@ class Leaderboard:
 
         # Tells the program that it should switch back to the main menu state.
         self.__finished = True
+        if self.__on_finish is not None:
+            self.__on_finish()
 
     @property
     def finished(self):
@@ -147,5 +155,81 @@ class Leaderboard:
 
         return self.__finished
 
+def store_on_leaderboard(initials, score, file_path=None):
+    """Stores a score on the leaderboard with the user's initials if the score is within
+    the top 10
+
+    Parameters:
+        initials (str): The user's initials
+        score (int): The user's score
+        file_path (str) (default None): The path of the leaderboard file.
+                                        If None, assets/leaderboard.csv is used.
+    """
+
+    # Assigns the default value to the argument if one wasn't already given.
+    if file_path is None:
+        file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                 "leaderboard.csv")
+
+    # Open the leaderboard file to check that the user is in the top 10.
+    try:
+
+        # Opens the leaderboard file and appends the data into a list.
+        with open(file_path, "rt", encoding="utf-8") as f:
+            csv_reader = csv.reader(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+            scores = []
+            for row in csv_reader:
+                scores.append(row)
+
+    # If the leaderboard file doesn't exist then create a new file.
+    except FileNotFoundError:
+
+        # Writes the user's inputted initials and score to the csv file.
+        with open(file_path, "wt", encoding="utf-8", newline="") as f:
+            csv_writer = csv.writer(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+            csv_writer.writerow([initials, score])
+
+    # If the file did exist, then check if the user's score should be added to the leaderboard
+    else:
+
+        # If there are less than 10 scores in the leaderboard, or the user's score is greater
+        # than or equal to the 10th score on the leaderboard, then add the user's score
+        # to the leaderboard.
+        if len(scores) < 10 or score >= scores[9][1]:
+            insert_into_list(scores, [initials, score])
+
+            # Makes it so that only the top 10 scores are stored on the leaderboard.
+            scores = scores[:10]
+
+            # Writes the new top 10 scores to the leaderboard.
+            with open(file_path, "wt", encoding="utf-8", newline="") as f:
+                csv_writer = csv.writer(f, delimiter=",", quoting=csv.QUOTE_NONNUMERIC)
+                for row in scores:
+                    csv_writer.writerow(row)
+
+def insert_into_list(two_d_list, list_to_insert):
+    """Inserts a list into a 2d list that is sorted in descending order of the second index
+    of each element, keeping it sorted
+
+    Parameters:
+        two_d_list (List[list]): The sorted 2d list, which is changed in place
+        list_to_insert (list): The list to insert
+    """
+
+    # i holds the end index of the sorted part of the list.
+    i = len(two_d_list) - 1
+
+    # Increase the 2d list's size to allow the list to be inserted.
+    two_d_list.append([])
+
+    # Moves all elements in the sorted part of the 2d list that have a lower second
+    # index value than the list argument's second index to the right.
+    while i >= 0 and list_to_insert[1] >= two_d_list[i][1]:
+        two_d_list[i + 1] = two_d_list[i]
+        i -= 1
+
+    # Inserts the list argument where the last element that moved originally was.
+    two_d_list[i + 1] = list_to_insert
+
 if __name__ == "__main__":
     print("Please run main.py")
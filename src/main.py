@@ -1,6 +1,12 @@
+# The startup profile is imported first so that it includes the time the other imports take.
+from startup_profile import STARTUP_PROFILE
+import argparse
 from tkinter import Tk
 import constants as constants
 from main_menu import MainMenu
+from tracer import TRACER
+
+STARTUP_PROFILE.mark("imports")
 
 def create_window(width, height):
     """Returns a window with dimensions width x height centred on the screen
@@ -31,17 +37,46 @@ def create_window(width, height):
 
     return window
 
-def main():
-    """Starts the Breakout game"""
+def main(arguments=None):
+    """Starts the Breakout game
+
+    Parameters:
+        arguments (List[str]) (default None): The command line arguments.
+                                              If None, sys.argv is used.
+    """
+
+    parser = argparse.ArgumentParser(description="Plays Breakout.")
+    parser.add_argument("--trace", action="store_true",
+                        help="record how long each part of the game takes and write it to "
+                             "assets/trace.json on exit (or when the Dump Trace key is pressed) "
+                             "so it can be opened in a trace viewer")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long each phase of starting the game takes, from the "
+                             "imports to the main menu first being drawn and ready to use")
+    arguments = parser.parse_args(arguments)
+
+    # Starts recording spans if the game is being traced.
+    if arguments.trace:
+        TRACER.enable()
+
+    # Prints the startup timeline once the main menu is ready if it was asked for.
+    if arguments.startup_profile:
+        STARTUP_PROFILE.enable()
 
     # Creates a new window with dimensions 800x600 in the centre of the screen.
     window = create_window(constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
+    STARTUP_PROFILE.mark("window created")
 
     # Creates a MainMenu object that represents when the program is in the main menu state.
     MainMenu(window)
 
     # Starts the window's game loop.
-    window.mainloop()
+    # The trace is written when the window closes, even if the program exits with an error.
+    try:
+        window.mainloop()
+    finally:
+        if TRACER.enabled:
+            TRACER.dump()
 
 if __name__ == "__main__":
     main()
@@ -1,19 +1,22 @@
+import importlib
 import json
 import os
 from tkinter import Canvas
 import sys
-from ball import Ball
-from brick import Brick
 from boss_key import BossKey
 import constants
-from game import Game
-from key_bindings import KeyBindings
-from leaderboard import Leaderboard
-from paddle import Paddle
+from scene_manager import SceneManager
+from scheduler import Scheduler
+from startup_profile import STARTUP_PROFILE
 
 class MainMenu:
     """A class that represents when the program is in the main menu state"""
 
+    # The modules for the other screens (and Pillow, which they use), which aren't imported
+    # until the main menu has been drawn so that they don't delay it appearing. They are then
+    # imported one at a time whilst Tkinter is idle so that they are ready when they're needed.
+    __WARM_UP_MODULES = ["PIL.ImageTk", "leaderboard", "key_bindings", "game"]
+
     def __init__(self, window):
         """Initialises MainMenu and creates text on the screen to represent the
         different options of the main menu
@@ -36,21 +39,22 @@ class MainMenu:
 
         # Stores the key bindings for the program.
         self.__key_bindings = self.__load_key_bindings()
+        STARTUP_PROFILE.mark("key bindings loaded")
+
+        # Stores the number of times per second that games are drawn.
+        self.__frame_rate = self.__load_frame_rate()
 
         # Stores a BossKey object that holds the information for the boss key.
         self.__boss_key = BossKey(window, self.__key_bindings)
+        STARTUP_PROFILE.mark("boss key created")
 
-        # Stores the Game object (when the game starts).
-        self.__game = None
-
-        # Stores the Leaderboard object (when the leaderboard starts).
-        self.__leaderboard = None
-
-        # Stores the key bindings object (when the key bindings window is shown).
-        self.__key_binding_object = None
+        # Creates a Scheduler object that runs all of the program's timed work (e.g. the game loop)
+        # from a single Tkinter timer.
+        self.__scheduler = Scheduler(window)
 
-        # Stores the ID of the main menu's game loop (when the game loop starts).
-        self.__game_loop_id = None
+        # Creates a SceneManager object that shows the game, leaderboard and key bindings
+        # screens in place of the main menu, and shows the main menu again when they finish.
+        self.__scenes = SceneManager(self.__canvas, self.__return_to_main_menu)
 
         # Stores what the user is currently selecting on the main menu.
         self.__selection = "New Game"
@@ -63,34 +67,71 @@ class MainMenu:
         self.__selection_to_object_id = {}
 
         # Creates the different options for the main menu.
-        self.__create_menu_option(400, 150, "New Game")
+        self.__create_menu_option(400, 100, "New Game")
+        self.__create_menu_option(400, 150, "New Multi-Ball Game")
         self.__create_menu_option(400, 200, "Load Game")
         self.__create_menu_option(400, 250, "Leaderboard")
         self.__create_menu_option(400, 300, "Change Key Bindings")
-        self.__create_menu_option(400, 350, "Quit")
+        self.__create_menu_option(400, 350, "Frame Rate")
+        self.__create_menu_option(400, 400, "Quit")
 
         # Change the new game option for the main menu to > New Game as it is the first
         # option that should be selected.
         self.__canvas.itemconfigure(self.__selection_to_object_id["New Game"], text="> New Game")
 
         # Assigns key bindings for the main menu.
-        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Up"] + ">",
-                           self.__toggle_selection_up)
-        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Down"] + ">",
-                           self.__toggle_selection_down)
-        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">",
-                           self.__confirm_selection)
-        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">",
-                           lambda event : self.__boss_key.show_boss_key(self.__canvas))
+        self.__bind_keys()
 
         # Causes the canvas to start looking for key inputs.
         self.__canvas.focus_set()
 
+        # Stores the modules that still need to be warmed up, and starts warming them up once
+        # the main menu has been drawn for the first time.
+        self.__modules_to_warm_up = list(MainMenu.__WARM_UP_MODULES)
+        self.__canvas.bind("<Expose>", self.__first_draw)
+        STARTUP_PROFILE.mark("main menu created")
+
+    def __first_draw(self, event=None):
+        # Records that the main menu has been drawn for the first time, and waits until Tkinter
+        # is next idle, which is when the main menu can first be used.
+
+        self.__canvas.unbind("<Expose>")
+        STARTUP_PROFILE.mark("first paint")
+        self.__canvas.after_idle(self.__main_menu_ready)
+
+    def __main_menu_ready(self):
+        # Prints the startup profile now that the main menu can be used, then starts warming up.
+
+        STARTUP_PROFILE.mark("main menu ready")
+        STARTUP_PROFILE.report()
+        self.__canvas.after_idle(self.__warm_up)
+
+    def __warm_up(self):
+        # Imports the next module that needs to be warmed up, then waits until Tkinter is idle
+        # again (after any key presses have been handled) before importing the one after it.
+        # Once every module has been imported, the background that greys out the game when
+        # it's paused is created so that it can be reused when the first game starts, and the
+        # boss key image (which has been decoded on a background thread by then) is drawn.
+
+        if self.__modules_to_warm_up:
+            module_name = self.__modules_to_warm_up.pop(0)
+            importlib.import_module(module_name)
+            STARTUP_PROFILE.mark(f"warmed up {module_name}")
+            self.__canvas.after_idle(self.__warm_up)
+        else:
+            from overlay_image_cache import OVERLAY_IMAGE_CACHE
+            OVERLAY_IMAGE_CACHE.release(OVERLAY_IMAGE_CACHE.acquire(
+                self.__canvas.winfo_reqwidth(), self.__canvas.winfo_reqheight()))
+            STARTUP_PROFILE.mark("warmed up the paused background")
+            self.__boss_key.load_image()
+            STARTUP_PROFILE.mark("warmed up the boss key image")
+
     def __create_menu_option(self, x, y, text, colour="#FFFFFF", font=("TkDefaultFont", 20)):
         # Creates a new menu option.
 
         # Stores the object ID for the new option.
-        text_object_id = self.__canvas.create_text(x, y, text=text, fill=colour, font=font)
+        text_object_id = self.__canvas.create_text(x, y, text=self.__option_text(text),
+                                                   fill=colour, font=font)
         self.__selections.append(text)
         self.__selection_to_object_id[text] = text_object_id
 
@@ -108,6 +149,14 @@ class MainMenu:
         self.__canvas.coords(text_object_id, option_x + option_width/2, option_y)
         self.__canvas.itemconfigure(text_object_id, anchor="e")
 
+    def __option_text(self, selection):
+        # Returns the text shown for a main menu option, which includes the current setting
+        # for options that change a setting.
+
+        if selection == "Frame Rate":
+            return f"Frame Rate: {self.__frame_rate} Hz"
+        return selection
+
     def __toggle_selection_up(self, event=None):
         # Changes the user's selection in the main menu to the one
         # above they have currently selected.
@@ -120,10 +169,10 @@ class MainMenu:
         # change to the option above the one they have selected.
         if selection_index != 0:
             self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=self.__selection)
+                                        text=self.__option_text(self.__selection))
             self.__selection = self.__selections[selection_index - 1]
             self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=f"> {self.__selection}")
+                                        text=f"> {self.__option_text(self.__selection)}")
 
     def __toggle_selection_down(self, event=None):
         # Changes the user's selection in the main menu to the one
@@ -137,10 +186,10 @@ class MainMenu:
         # change to the option below the one they have selected.
         if selection_index != len(self.__selections) - 1:
             self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=self.__selection)
+                                        text=self.__option_text(self.__selection))
             self.__selection = self.__selections[selection_index + 1]
             self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=f"> {self.__selection}")
+                                        text=f"> {self.__option_text(self.__selection)}")
 
     def __confirm_selection(self, event=None):
         # Calls methods to execute the main menu option that the user currently has selected.
@@ -149,6 +198,11 @@ class MainMenu:
         if self.__selection == "New Game":
             self.__new_game()
 
+        # If the user's currently selected option is New Multi-Ball Game then start a new game
+        # where balls split when they destroy a brick.
+        elif self.__selection == "New Multi-Ball Game":
+            self.__new_game(multi_ball=True)
+
         # If the user's currently selected option is Load Game the load the saved game.
         # If there isn't a saved game then just start a new game.
         elif self.__selection == "Load Game":
@@ -163,65 +217,43 @@ class MainMenu:
         elif self.__selection == "Change Key Bindings":
             self.__show_key_bindings()
 
+        # If the user's currently selected option is Frame Rate then change to the next
+        # frame rate.
+        elif self.__selection == "Frame Rate":
+            self.__change_frame_rate()
+
         # If the user's currently selected option is Quit then quit the game.
         elif self.__selection == "Quit":
             self.__quit()
 
-    def __new_game(self, load=False):
-        # Creates a new game and blocks further MainMenu processes until the game is finished.
-
-        # If there isn't a currently running game, then start a new game.
-        if self.__game is None:
-
-            # Causes the main menu's canvas to not be drawn to the window.
-            self.__canvas.pack_forget()
+    def __new_game(self, load=False, multi_ball=False):
+        # Creates a new game. The main menu is shown again when the game finishes.
 
-            # Creates a new game.
-            self.__game = Game(self.__window, self.__key_bindings, self.__boss_key)
+        # Imports the game if it hasn't been warmed up yet.
+        from game import Game
 
-            # If the game should be loaded then load the saved game data into the Game object.
-            if load:
-                self.__load_game()
+        # Creates a new game in place of the main menu.
+        game = self.__scenes.show("game", lambda on_finish : Game(
+            self.__window, self.__key_bindings, self.__boss_key, multi_ball=multi_ball,
+            on_finish=on_finish, scheduler=self.__scheduler, frame_rate=self.__frame_rate))
 
-            # Start a 1.5 second countdown in the game.
-            self.__game.timer = 3
-            self.__game.countdown()
+        # If the game should be loaded then load the saved game data into the Game object.
+        if load:
+            self.__load_game(game)
 
-            # Start the game's game loop.
-            self.__game.game_loop()
+        # Start a 1.5 second countdown in the game.
+        game.timer = 3
+        game.countdown()
 
-            # Makes it so that the main menu checks if the game has finished every 17ms
-            # (approximately 60 times per second).
-            self.__game_loop_id = self.__canvas.after(17, self.__new_game)
+        # Start the game's game loop.
+        game.game_loop()
 
-        # If there is a currently running game and the game is finished,
-        # then end the main menu's game loop, show the main menu,
-        # and start looking for key inputs again.
-        elif self.__game.game_finished:
-            self.__canvas.after_cancel(self.__game_loop_id)
-            self.__game = None
-            self.__canvas.pack()
-            self.__canvas.focus_set()
+    def __load_game(self, game):
+        # Changes the attributes of a Game object to match the saved game data.
 
-            # Changes the user's selected option to the New Game option.
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=self.__selection)
-            self.__selection = "New Game"
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=f"> {self.__selection}")
-
-        # If there is a currently running game and the game hasn't finished,
-        # then check again later to see if the game has finished then.
-        else:
-
-            # Makes it so that the main menu checks if the game has finished every 17ms
-            # (approximately 60 times per second).
-            self.__game_loop_id = self.__canvas.after(17, self.__new_game)
-
-    def __load_game(self):
-        # Changes the attributes of the Game object in self.__game to match the saved game data.
-
-        # Try to read the saved game data.
+        # Try to read the saved game data and load it into the game's world.
+        # The world reads all of the data before changing anything, so if the data isn't
+        # correctly formatted then the game is left as a new game.
         try:
 
             # Read the saved game data into the data variable.
@@ -230,239 +262,105 @@ class MainMenu:
             with open(file_path, "rt", encoding="utf-8") as f:
                 data = json.load(f)
 
-            # Split the saved game data into various different data dictionaries.
-            game_data = data["game"]
-            paddle_data = data["paddle"]
-            ball_data = data["ball"]
-            bricks_data = data["bricks"]
-
-            # Gets the score and number of lives the user has.
-            lives = game_data["lives"]
-            score = game_data["score"]
-            level = game_data["level"]
-
-            # Gets the saved paddle data.
-            paddle_width = paddle_data["width"]
-            paddle_height = paddle_data["height"]
-            paddle_canvas_gap = paddle_data["canvas_gap"]
-            paddle_colour = paddle_data["colour"]
-            paddle_left_x = paddle_data["left_x"]
-            paddle_top_y = paddle_data["top_y"]
-            paddle_right_x = paddle_data["right_x"]
-            paddle_bottom_y = paddle_data["bottom_y"]
-
-            # Gets the saved ball data.
-            ball_x_velocity = ball_data["x_velocity"]
-            ball_y_velocity = ball_data["y_velocity"]
-            ball_bounces_until_speed_up = ball_data["bounces_until_speed_up"]
-            ball_speed_up_amount = ball_data["speed_up_amount"]
-            ball_radius = ball_data["radius"]
-            ball_paddle_gap = ball_data["paddle_gap"]
-            ball_colour = ball_data["colour"]
-            ball_left_x = ball_data["left_x"]
-            ball_top_y = ball_data["top_y"]
-            ball_right_x = ball_data["right_x"]
-            ball_bottom_y = ball_data["bottom_y"]
-            ball_speed = ball_data["speed"]
-
-            # Stores lists of the different attribute values for the bricks.
-            bricks_attribute_values = []
-
-            # Gets the saved data for each brick and stores it in a list.
-            for brick_data in bricks_data:
-
-                # Stores the different attribute values for the brick.
-                brick_attribute_values = []
-
-                # Gets the saved brick data and appends it to the list.
-                brick_attribute_values.append(brick_data["x"])
-                brick_attribute_values.append(brick_data["y"])
-                brick_attribute_values.append(brick_data["score"])
-                brick_attribute_values.append(brick_data["colour"])
-                brick_attribute_values.append(brick_data["width"])
-                brick_attribute_values.append(brick_data["height"])
-
-                # Appends the list of saved brick data to the list of all saved brick datas.
-                bricks_attribute_values.append(brick_attribute_values)
+            # Changes the game's world to match the saved game data.
+            # The canvas is updated the next time the game's renderer is synced.
+            game.world.load_save_data(data)
 
         # If the file can't be read or the data in the file isn't correctly formatted,
         # then stop trying to load the game.
         except (FileNotFoundError, KeyError):
             pass
 
-        # If there were no errors, then change the values of the Game object's
-        # attributes to the data in the saved file.
+        # If there were no errors, then stop recording the game.
+        # A loaded game can't be played back from its seed as it didn't start from a new
+        # world, so it isn't recorded.
         else:
-
-            # Changes the Game object attributes to the saved attribute values.
-            self.__game.lives = lives
-            self.__game.canvas.itemconfigure(self.__game.lives_text, text=f"Lives: {lives}")
-            self.__game.score = score
-            self.__game.canvas.itemconfigure(self.__game.score_text, text=f"Score: {score}")
-            self.__game.level = level
-            self.__game.canvas.itemconfigure(self.__game.level_text, text=f"Level {level}")
-
-            # Creates a new Paddle with the saved attribute values.
-            paddle = Paddle(self.__game.canvas, paddle_width, paddle_height, paddle_canvas_gap,
-                            paddle_colour)
-
-            # Changes the new Paddle object's attributes to the saved attribute values.
-            paddle.left_x = paddle_left_x
-            paddle.top_y = paddle_top_y
-            paddle.right_x = paddle_right_x
-            paddle.bottom_y = paddle_bottom_y
-            self.__game.canvas.coords(paddle.id, paddle_left_x, paddle_top_y, paddle_right_x,
-                                      paddle_bottom_y)
-
-            # Removes the game's old paddle and replaces it with this new paddle.
-            self.__game.canvas.delete(self.__game.paddle.id)
-            self.__game.paddle = paddle
-
-            # Holds all of the saved Brick objects.
-            bricks = []
-
-            # Iterates over all of the saved Brick object datas.
-            for brick_attribute_values in bricks_attribute_values:
-
-                # Creates a new Brick with the saved attributes and appends it to the list of
-                # saved Bricks.
-                brick = Brick(self.__game.canvas, brick_attribute_values[0],
-                              brick_attribute_values[1], brick_attribute_values[2],
-                              brick_attribute_values[3], brick_attribute_values[4],
-                              brick_attribute_values[5])
-                bricks.append(brick)
-
-            # Iterates over all of the old bricks and deletes them
-            for brick in self.__game.bricks:
-                self.__game.canvas.delete(brick.id)
-
-            # Replaces the old bricks list with the new bricks list.
-            self.__game.bricks = bricks
-
-            # Creates a new Ball with the saved attribute values.
-            ball = Ball(self.__game.canvas, self.__game.paddle, self.__game.bricks,
-                        self.__game.level, ball_x_velocity, ball_y_velocity,
-                        ball_bounces_until_speed_up, ball_speed_up_amount, ball_radius,
-                        ball_paddle_gap, ball_colour)
-
-            # Changes the new Ball object's attributes to the saved attribute values.
-            ball.left_x = ball_left_x
-            ball.top_y = ball_top_y
-            ball.right_x = ball_right_x
-            ball.bottom_y = ball_bottom_y
-            ball.speed = ball_speed
-            self.__game.canvas.coords(ball.id, ball_left_x, ball_top_y, ball_right_x, ball_bottom_y)
-
-            # Removes the game's old ball and replaces it with this new ball.
-            self.__game.canvas.delete(self.__game.ball.id)
-            self.__game.ball = ball
+            game.recorder = None
 
     def __show_leaderboard(self):
-        # Shows the leaderboard on the screen and blocks further MainMenu processes
-        # until the user exits the leaderboard.
+        # Shows the leaderboard on the screen. The main menu is shown again when the user
+        # exits the leaderboard.
 
-        # If there isn't currently a leaderboard being shown, then show the leaderboard.
-        if self.__leaderboard is None:
+        # Imports the leaderboard if it hasn't been warmed up yet.
+        from leaderboard import Leaderboard
 
-            # Causes the main menu's canvas to not be drawn to the window.
-            self.__canvas.pack_forget()
+        # Shows the leaderboard in place of the main menu.
+        self.__scenes.show("leaderboard", lambda on_finish : Leaderboard(
+            self.__window, self.__key_bindings, self.__boss_key, on_finish=on_finish))
 
-            # Shows the leaderboard on the window.
-            self.__leaderboard = Leaderboard(self.__window, self.__key_bindings, self.__boss_key)
-
-            # Makes it so that the main menu checks if the user has exited
-            # the leaderboard every 17ms
-            # (approximately 60 times per second).
-            self.__game_loop_id = self.__window.after(17, self.__show_leaderboard)
+    def __show_key_bindings(self):
+        # Shows the key bindings on the screen. The main menu is shown again when the user
+        # exits the key bindings screen.
 
-        # If there is a leaderboard being shown and the user has exited the leaderboard,
-        # then end the main menu's game loop, show the main menu, and start looking
-        # for key inputs again.
-        elif self.__leaderboard.finished:
-            self.__canvas.after_cancel(self.__game_loop_id)
-            self.__leaderboard = None
-            self.__canvas.pack()
-            self.__canvas.focus_set()
+        # Imports the key bindings screen if it hasn't been warmed up yet.
+        from key_bindings import KeyBindings
 
-            # Changes the user's selected option to the New Game option.
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=self.__selection)
-            self.__selection = "New Game"
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=f"> {self.__selection}")
+        # Unbinds the old key bindings for the main menu in case they are changed.
+        self.__unbind_keys()
 
-        # If there is a leaderboard being shown and the user hasn't exited the leaderboard,
-        # then check again later to see if the user has exited the leaderboard then.
-        else:
+        # Shows the key bindings in place of the main menu.
+        self.__scenes.show("key bindings", lambda on_finish : KeyBindings(
+            self.__window, self.__key_bindings, self.__boss_key, on_finish=on_finish))
 
-            # Makes it so that the main menu checks if the user has exited the leaderboard
-            # every 17ms (approximately 60 times per second).
-            self.__game_loop_id = self.__canvas.after(17, self.__show_leaderboard)
+    def __return_to_main_menu(self, scene_name):
+        # Updates the main menu after a scene has finished and the main menu is shown again.
 
-    def __show_key_bindings(self):
-        # Shows the key bindings on the screen and blocks further MainMenu processes
-        # until the user exits the key bindings screen.
-
-        # If there isn't currently a key binding screen being shown, then show the
-        # key binding screen.
-        if self.__key_binding_object is None:
-
-            # Unbinds the old key bindings for the main menu in case they are changed.
-            self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Up"] + ">")
-            self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Down"] + ">")
-            self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">")
-            self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">")
-
-            # Causes the main menu's canvas to not be drawn to the window.
-            self.__canvas.pack_forget()
-
-            # Shows the leaderboard on the window.
-            self.__key_binding_object = KeyBindings(self.__window, self.__key_bindings,
-                                                    self.__boss_key)
-
-            # Makes it so that the main menu checks if the user has exited
-            # the key binding screen every 17ms
-            # (approximately 60 times per second).
-            self.__game_loop_id = self.__window.after(17, self.__show_key_bindings)
-
-        # If there is a key binding screen being shown and the user has exited
-        # the key binding screen, then end the main menu's game loop, show the main menu,
-        # and start looking for key inputs again.
-        elif self.__key_binding_object.finished:
-            self.__canvas.after_cancel(self.__game_loop_id)
-            self.__key_binding_object = None
-            self.__canvas.pack()
-            self.__canvas.focus_set()
-
-            # Rebinds the main menu's key bindings in case they were changed.
-            self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Up"] + ">",
-                               self.__toggle_selection_up)
-            self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Down"] + ">",
-                               self.__toggle_selection_down)
-            self.__canvas.bind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">",
-                               self.__confirm_selection)
-            self.__canvas.bind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">",
-                               lambda event : self.__boss_key.show_boss_key(self.__canvas))
-
-            # Also rebinds the boss key object's key bindings in case they were changed.
+        # Rebinds the main menu's key bindings and the boss key object's key bindings in
+        # case they were changed.
+        if scene_name == "key bindings":
+            self.__bind_keys()
             self.__boss_key.canvas.bind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">",
                                         lambda event : self.__boss_key.hide_boss_key())
 
-            # Changes the user's selected option to the New Game option.
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=self.__selection)
-            self.__selection = "New Game"
-            self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
-                                        text=f"> {self.__selection}")
+        # Changes the user's selected option to the New Game option.
+        self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
+                                    text=self.__option_text(self.__selection))
+        self.__selection = "New Game"
+        self.__canvas.itemconfigure(self.__selection_to_object_id[self.__selection],
+                                    text=f"> {self.__selection}")
 
-        # If there is a key binding screen being shown and the user hasn't exited the key
-        # binding screen, then check again later to see if the user has exited the key binding
-        # screen then.
-        else:
+    def __change_frame_rate(self):
+        # Changes the frame rate that games are drawn at to the next one in
+        # constants.FRAME_RATES and saves it to settings.json.
+
+        # Gets the next frame rate, going back to the first one after the last one.
+        frame_rate_index = constants.FRAME_RATES.index(self.__frame_rate)
+        self.__frame_rate = constants.FRAME_RATES[(frame_rate_index + 1)
+                                                  % len(constants.FRAME_RATES)]
 
-            # Makes it so that the main menu checks if the user has exited the key binding screen
-            # every 17ms (approximately 60 times per second).
-            self.__game_loop_id = self.__canvas.after(17, self.__show_key_bindings)
+        # Shows the new frame rate in the menu option.
+        self.__canvas.itemconfigure(self.__selection_to_object_id["Frame Rate"],
+                                    text=f"> {self.__option_text('Frame Rate')}")
+
+        # Saves the frame rate so that it is used the next time the program is run.
+        # If it can't be saved, then it is still used until the program closes.
+        try:
+            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                     "settings.json")
+            with open(file_path, "wt", encoding="utf-8") as f:
+                json.dump({"frame_rate": self.__frame_rate}, f)
+        except OSError:
+            pass
+
+    def __bind_keys(self):
+        # Assigns key bindings for the main menu.
+
+        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Up"] + ">",
+                           self.__toggle_selection_up)
+        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Down"] + ">",
+                           self.__toggle_selection_down)
+        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">",
+                           self.__confirm_selection)
+        self.__canvas.bind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">",
+                           lambda event : self.__boss_key.show_boss_key(self.__canvas))
+
+    def __unbind_keys(self):
+        # Removes the key bindings for the main menu.
+
+        self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Up"] + ">")
+        self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Move Menu Pointer Down"] + ">")
+        self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Confirm Option"] + ">")
+        self.__canvas.unbind("<KeyPress-" + self.__key_bindings["Boss Key"] + ">")
 
     def __quit(self):
         # Exits the program.
@@ -471,6 +369,24 @@ class MainMenu:
         self.__window.destroy()
         sys.exit()
 
+    def __load_frame_rate(self):
+        # Loads the frame rate from settings.json and returns it, or returns the default
+        # frame rate if the file can't be read or doesn't hold one of constants.FRAME_RATES.
+
+        # Try to read the frame rate from settings.json.
+        try:
+            file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                     "settings.json")
+            with open(file_path, "rt", encoding="utf-8") as f:
+                frame_rate = json.load(f)["frame_rate"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            return constants.DEFAULT_FRAME_RATE
+
+        # Only frame rates that can be chosen from the main menu are used.
+        if frame_rate not in constants.FRAME_RATES:
+            return constants.DEFAULT_FRAME_RATE
+        return frame_rate
+
     def __load_key_bindings(self):
         # Loads the key bindings from key_bindings.json and returns them,
         # or returns a set of default key bindings if the file can't be accessed.
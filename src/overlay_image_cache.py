@@ -0,0 +1,140 @@
+from collections import OrderedDict
+
+class OverlayImageCache:
+    """A class that shares the semi-transparent images used to grey out the screen behind menus
+
+    Tkinter's canvas can't draw transparent shapes, so a full-window RGBA image is used instead.
+    Creating one and converting it into a PhotoImage is slow and uses a lot of memory, so each
+    image is only created once for each (width, height, colour, alpha) and shared by everything
+    that shows it. Each image counts how many users it has, and images that aren't being used
+    are kept for when they're next needed, up to a maximum number, after which the least
+    recently used image is removed.
+
+    Methods:
+        acquire(width, height, colour, alpha): Returns an image, creating it if necessary
+        release(image): Tells the cache that an image from acquire() is no longer being used
+        clear(): Removes every image that isn't being used
+    """
+
+    def __init__(self, max_unused=4):
+        """Initialises OverlayImageCache
+
+        Parameters:
+            max_unused (int) (default 4): The maximum number of images that are kept when
+                                          they aren't being used
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__max_unused = max_unused
+
+        # Maps each (width, height, colour, alpha) key to its image and how many users it has.
+        # The keys are kept in order from least to most recently used.
+        self.__entries = OrderedDict()
+
+        # Maps the ID of each image to its key so that images can be released.
+        self.__image_keys = {}
+
+        # Counts how many times an image was reused and how many times one had to be created.
+        self.__hits = 0
+        self.__misses = 0
+
+    def acquire(self, width, height, colour="#000000", alpha=100):
+        """Returns a semi-transparent image of a single colour, creating it if it isn't cached
+
+        Every call should be matched by a call to release() when the image isn't needed.
+
+        Parameters:
+            width (int): The width of the image
+            height (int): The height of the image
+            colour (str) (default "#000000"): The colour of the image
+            alpha (int) (default 100): How opaque the image is from 0 to 255
+
+        Returns:
+            image (PhotoImage): The image, which can be drawn with canvas.create_image()
+        """
+
+        key = (width, height, colour, alpha)
+        entry = self.__entries.get(key)
+
+        # If the image has already been created, then reuse it.
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+
+        # Otherwise, create the image through the Pillow module (to allow alpha transparency)
+        # and convert it into a Tkinter PhotoImage. Pillow takes a while to import, so it isn't
+        # imported until the first image is created.
+        else:
+            from PIL import Image, ImageColor, ImageTk
+            self.__misses += 1
+            red, green, blue = ImageColor.getrgb(colour)[:3]
+            image = ImageTk.PhotoImage(Image.new("RGBA", (width, height),
+                                                 (red, green, blue, alpha)))
+            entry = [image, 0]
+            self.__entries[key] = entry
+            self.__image_keys[id(image)] = key
+
+        # Counts the new user of the image.
+        entry[1] += 1
+
+        return entry[0]
+
+    def release(self, image):
+        """Tells the cache that an image from acquire() is no longer being used
+
+        The image is kept so that it can be reused, unless too many images aren't being used.
+
+        Parameters:
+            image (PhotoImage): The image that was returned by acquire()
+        """
+
+        key = self.__image_keys.get(id(image))
+        if key is None:
+            return
+
+        # Counts that the image has one less user.
+        entry = self.__entries[key]
+        entry[1] = max(0, entry[1] - 1)
+
+        self.__evict()
+
+    def __evict(self):
+        # Removes the least recently used images that aren't being used until there are
+        # at most max_unused of them.
+
+        unused_keys = [key for key, entry in self.__entries.items() if entry[1] == 0]
+        for key in unused_keys[:max(0, len(unused_keys) - self.__max_unused)]:
+            image, _ = self.__entries.pop(key)
+            del self.__image_keys[id(image)]
+
+    def clear(self):
+        """Removes every image that isn't being used"""
+
+        max_unused = self.__max_unused
+        self.__max_unused = 0
+        self.__evict()
+        self.__max_unused = max_unused
+
+    @property
+    def hits(self):
+        """(int): How many times an image has been reused"""
+
+        return self.__hits
+
+    @property
+    def misses(self):
+        """(int): How many times an image has had to be created"""
+
+        return self.__misses
+
+    @property
+    def size(self):
+        """(int): The number of images in the cache"""
+
+        return len(self.__entries)
+
+# The cache shared by every screen in the program.
+OVERLAY_IMAGE_CACHE = OverlayImageCache()
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -3,14 +3,17 @@ import constants
 class Paddle:
     """A class that represents the paddle of the game"""
 
-    def __init__(self, canvas, paddle_width=constants.DEFAULT_PADDLE_WIDTH,
+    def __init__(self, canvas_width, canvas_height, paddle_width=constants.DEFAULT_PADDLE_WIDTH,
                  paddle_height=constants.DEFAULT_PADDLE_HEIGHT,
                  canvas_gap=constants.DEFAULT_CANVAS_GAP, colour=constants.DEFAULT_PADDLE_COLOUR):
-        """Initialises Paddle and creates a rectangle on the canvas centred horizontally
-        and slightly above the bottom of the canvas
+        """Initialises Paddle and positions it centred horizontally and slightly above the bottom
+        of the canvas
+
+        The paddle doesn't draw itself, so it can be used without a window.
 
         Parameters:
-            canvas (Canvas): The canvas that the ball will be drawn on
+            canvas_width (int): The width of the canvas that the paddle moves within
+            canvas_height (int): The height of the canvas that the paddle moves within
             paddle_width (int) (default 150): The width of the paddle
             paddle_height (int) (default 10): The height of the paddle
             canvas_gap (int) (default 40): The gap between the bottom of the canvas
@@ -21,12 +24,10 @@ class Paddle:
         """
 
         # Assigns values to the object's attributes based on the arguments to the initialiser.
-        self.__canvas = canvas
+        self.__canvas_width = canvas_width
+        self.__canvas_height = canvas_height
         self.__width = paddle_width
-
-        # Gets the canvas's width and height.
-        canvas_width = canvas.winfo_reqwidth()
-        canvas_height = canvas.winfo_reqheight()
+        self.__colour = colour
 
         # Calculates the x and y coordinates for the top, bottom, left
         # and right edges of the paddle.
@@ -37,33 +38,31 @@ class Paddle:
         self.__right_x = int(canvas_width/2 + paddle_width/2)
         self.__bottom_y = canvas_height - canvas_gap
 
+        # Stores the x coordinate of the left edge of the paddle before it last moved, so that
+        # it can be drawn in between where it was and where it is.
+        self.__previous_left_x = self.__left_x
+
         # Stores the paddle's speed which is based on if the user is pressing a key or not.
         self.__speed = 0
 
-        # Creates a rectangle at the coordinates calculated that represents the paddle
-        # and stores the object ID of the paddle.
-        self.__id = canvas.create_rectangle(self.__left_x, self.__top_y, self.__right_x,
-                                            self.__bottom_y, fill=colour)
-
-    def move(self):
-        """Causes the paddle to move based on its speed attribute
+    def move(self, timestep=1 / constants.PHYSICS_STEPS_PER_SECOND):
+        """Causes the paddle to move based on its speed attribute for a number of seconds
 
         This also checks if the paddle collides with the walls of the canvas
         and makes sure that the paddle doesn't go outside the canvas.
-        """
 
-        # Moves the paddle left or right according to its speed.
-        self.__canvas.move(self.__id, self.__speed, 0)
+        Parameters:
+            timestep (float) (default 1/60): The number of seconds that the paddle moves for
+        """
 
-        # Gets the canvas's width.
-        canvas_width = self.__canvas.winfo_reqwidth()
+        # Stores where the paddle was before it moved.
+        self.__previous_left_x = self.__left_x
 
-        # Updates the x and y coordinates of the top, bottom, left
-        # and right edges of the new position of the paddle.
-        self.__left_x = self.__canvas.coords(self.__id)[0]
-        self.__top_y = self.__canvas.coords(self.__id)[1]
-        self.__right_x = self.__canvas.coords(self.__id)[2]
-        self.__bottom_y = self.__canvas.coords(self.__id)[3]
+        # Moves the paddle left or right according to its speed by updating the x coordinates
+        # of the left and right edges of the paddle.
+        distance = self.__speed * timestep
+        self.__left_x += distance
+        self.__right_x += distance
 
         # If the paddle is outside of the canvas on the left,
         # then move it so that it is on the left inside of the canvas.
@@ -73,20 +72,15 @@ class Paddle:
             # so that it is inside the canvas.
             self.__left_x = 0
             self.__right_x = self.__width
-            self.__canvas.coords(self.__id, self.__left_x, self.__top_y, self.__right_x,
-                                 self.__bottom_y)
 
         # If the paddle is outside of the canvas on the right,
         # then move it so that is is on the right inside of the canvas.
-        elif self.__right_x > canvas_width:
+        elif self.__right_x > self.__canvas_width:
 
             # Updates the x coordinates of the left and right edges of the paddle
             # so that it is inside the canvas.
-            self.__left_x = canvas_width - self.__width
-            self.__right_x = canvas_width
-
-            self.__canvas.coords(self.__id, self.__left_x, self.__top_y, self.__right_x,
-                                 self.__bottom_y)
+            self.__left_x = self.__canvas_width - self.__width
+            self.__right_x = self.__canvas_width
 
     def move_left(self, speed=constants.DEFAULT_PADDLE_SPEED):
         """Moves the paddle left the next time the move() method is called
@@ -97,9 +91,10 @@ class Paddle:
                                           due to Tkinter key bindings.
                                           This can be any value or data type if you aren't
                                           using Tkinter key bindings.
-            speed (int) (default 15): The number of pixels that the paddle should move left by.
-                                      You do not need to make this negative
-                                      as the subroutine does this for you.
+            speed (int) (default 900): The number of pixels per second that the paddle should
+                                       move left by.
+                                       You do not need to make this negative
+                                       as the subroutine does this for you.
         """
 
         # Sets the paddle's speed so that it moves left.
@@ -114,7 +109,8 @@ class Paddle:
                                           due to Tkinter key bindings.
                                           This can be any value or data type if you aren't
                                           using Tkinter key bindings.
-            speed (int) (default 15): The number of pixels that the paddle should move right by
+            speed (int) (default 900): The number of pixels per second that the paddle should
+                                       move right by
         """
 
         # Sets the paddle's speed so that it moves right.
@@ -135,15 +131,11 @@ class Paddle:
         self.__speed = 0
 
     @property
-    def id(self):
-        """(int): The object ID of the paddle when it is created on the canvas"""
-
-        return self.__id
-
-    @id.setter
-    def id(self, value):
+    def speed(self):
+        """(int): How many pixels per second the paddle moves by when the move() method is
+        called (negative when moving left)"""
 
-        self.__id = value
+        return self.__speed
 
     @property
     def left_x(self):
@@ -155,6 +147,14 @@ class Paddle:
     def left_x(self, value):
 
         self.__left_x = value
+        self.__previous_left_x = value
+
+    @property
+    def previous_left_x(self):
+        """(float): The x coordinate of the left edge of the paddle before it last moved
+        (the same as left_x if it was put somewhere by setting left_x)"""
+
+        return self.__previous_left_x
 
     @property
     def top_y(self):
@@ -211,13 +211,13 @@ class Paddle:
         """(str): The colour of the paddle in the form #RRGGBB
         or any locally defined standard colour name"""
 
-        return self.__canvas.itemcget(self.__id, "fill")
+        return self.__colour
 
     @property
     def canvas_gap(self):
         """(int): The gap between the bottom of the canvas and the bottom of the paddle"""
 
-        return int(self.__canvas.winfo_reqheight() - self.__bottom_y)
+        return int(self.__canvas_height - self.__bottom_y)
 
 if __name__ == "__main__":
     print("Please run main.py")
@@ -0,0 +1,233 @@
+from collections import deque
+import time
+
+class PerformanceOverlay:
+    """A class that shows how long each frame of the game takes in a corner of a canvas
+
+    The overlay shows the instantaneous and smoothed frames per second, how many milliseconds
+    each frame spent on physics, rendering and waiting for Tkinter (idle), how many calls each
+    frame made to Tkinter, and a sparkline of the recent frame times. If it is given a scheduler,
+    it also shows the scheduler's busiest tasks. Frames are recorded every frame, but the canvas
+    items are only updated a few times per second so that the overlay barely affects what it
+    measures.
+
+    Methods:
+        toggle(): Shows the overlay if it is hidden, or hides it if it is shown
+        record_frame(frame_time, physics_time, render_time, idle_time, tk_calls):
+            Records a frame's times
+    """
+
+    def __init__(self, canvas, x=10, y=45, width=220, history_length=120, update_interval=0.25,
+                 smoothing=0.1, scheduler=None, frame_rate=60):
+        """Initialises PerformanceOverlay and creates its canvas items, which start hidden
+
+        Parameters:
+            canvas (Canvas): The canvas that the overlay is drawn on
+            x (int) (default 10): The x coordinate of the overlay's top left corner
+            y (int) (default 45): The y coordinate of the overlay's top left corner
+            width (int) (default 220): The width of the overlay
+            history_length (int) (default 120): How many frames the sparkline shows
+            update_interval (float) (default 0.25): The minimum number of seconds between
+                                                    updates of the canvas items
+            smoothing (float) (default 0.1): How much each new frame affects the smoothed
+                                             values (between 0 and 1)
+            scheduler (Scheduler) (default None): The scheduler whose busiest tasks are shown,
+                                                  or None to not show any tasks
+            frame_rate (int) (default 60): The number of frames per second that the game is
+                                           aiming for, which sets the sparkline's scale
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__canvas = canvas
+        self.__update_interval = update_interval
+        self.__smoothing = smoothing
+        self.__scheduler = scheduler
+
+        # Stores the scheduler's statistics when the canvas items were last updated, so that
+        # each update can show what the tasks did since the one before.
+        self.__previous_task_stats = {}
+
+        # Stores whether the overlay is shown.
+        self.__visible = False
+
+        # Stores the frame times (in seconds) of the most recent frames for the sparkline.
+        self.__frame_times = deque(maxlen=history_length)
+
+        # Stores the most recent frame's times and the smoothed times (in seconds).
+        self.__frame_time = 0.0
+        self.__smoothed_frame_time = None
+        self.__smoothed_physics_time = 0.0
+        self.__smoothed_render_time = 0.0
+        self.__smoothed_idle_time = 0.0
+
+        # Stores the number of calls the most recent frame made to Tkinter, if it is known.
+        self.__tk_calls = None
+
+        # Stores the time that the canvas items were last updated.
+        self.__last_update_time = None
+
+        # Calculates the position and size of the sparkline, which is drawn below the text.
+        self.__sparkline_left_x = x + 5
+        self.__sparkline_width = width - 10
+        self.__sparkline_bottom_y = y + 170
+        self.__sparkline_height = 40
+
+        # The sparkline's scale goes up to 2 frames at the target frame rate, so a frame that
+        # takes longer than that reaches the top.
+        self.__sparkline_max_time = 2 / frame_rate
+
+        # Creates a background behind the overlay so that it can be read over the game.
+        self.__background = canvas.create_rectangle(x, y, x + width, self.__sparkline_bottom_y + 5,
+                                                    fill="#000000", outline="#696969",
+                                                    stipple="gray50", state="hidden",
+                                                    tags="overlay")
+
+        # Creates the text that shows the frame times.
+        self.__text = canvas.create_text(x + 5, y + 5, text="", fill="#00FF00",
+                                         font=("TkFixedFont", 10), anchor="nw", state="hidden",
+                                         tags="overlay")
+
+        # Creates a line across the sparkline that shows the time of one frame at the target
+        # frame rate, so frames above it were dropped.
+        budget_y = self.__sparkline_y(1 / frame_rate)
+        self.__budget_line = canvas.create_line(self.__sparkline_left_x, budget_y,
+                                                self.__sparkline_left_x + self.__sparkline_width,
+                                                budget_y, fill="#696969", dash=(2, 2),
+                                                state="hidden", tags="overlay")
+
+        # Creates the sparkline itself, which starts flat.
+        self.__sparkline = canvas.create_line(self.__sparkline_left_x, self.__sparkline_bottom_y,
+                                              self.__sparkline_left_x + self.__sparkline_width,
+                                              self.__sparkline_bottom_y, fill="#00FF00",
+                                              state="hidden", tags="overlay")
+
+    def __sparkline_y(self, frame_time):
+        # Returns the y coordinate of a frame time on the sparkline.
+
+        return (self.__sparkline_bottom_y
+                - min(frame_time, self.__sparkline_max_time) / self.__sparkline_max_time
+                * self.__sparkline_height)
+
+    def toggle(self, event=None):
+        """Shows the overlay if it is hidden, or hides it if it is shown
+
+        Parameters:
+            event (Event) (default None): The Event object that is passed in by default
+                                          due to Tkinter key bindings.
+                                          This can be any value or data type if you aren't
+                                          using Tkinter key bindings.
+        """
+
+        self.__visible = not self.__visible
+
+        # Shows or hides all of the overlay's items.
+        self.__canvas.itemconfigure("overlay", state="normal" if self.__visible else "hidden")
+
+        # When the overlay is shown, update it straight away.
+        if self.__visible:
+            self.__update_items()
+
+    def record_frame(self, frame_time, physics_time, render_time, idle_time, tk_calls=None):
+        """Records the times of a frame, and updates the overlay if it is shown and it hasn't
+        been updated recently
+
+        Parameters:
+            frame_time (float): The time since the previous frame started in seconds
+            physics_time (float): The time spent stepping the world this frame in seconds
+            render_time (float): The time spent updating the canvas this frame in seconds
+            idle_time (float): The time spent waiting for Tkinter between the end of the previous
+                               frame and the start of this frame in seconds
+            tk_calls (int) (default None): The number of calls the frame made to Tkinter,
+                                           or None if it isn't known
+        """
+
+        # Stores the frame's time for the sparkline.
+        self.__frame_time = frame_time
+        self.__tk_calls = tk_calls
+        self.__frame_times.append(frame_time)
+
+        # Smooths the times using an exponential moving average, which starts from the first
+        # frame's time.
+        if self.__smoothed_frame_time is None:
+            self.__smoothed_frame_time = frame_time
+        smoothing = self.__smoothing
+        self.__smoothed_frame_time += (frame_time - self.__smoothed_frame_time) * smoothing
+        self.__smoothed_physics_time += (physics_time - self.__smoothed_physics_time) * smoothing
+        self.__smoothed_render_time += (render_time - self.__smoothed_render_time) * smoothing
+        self.__smoothed_idle_time += (idle_time - self.__smoothed_idle_time) * smoothing
+
+        # Only updates the canvas items if the overlay is shown and enough time has passed
+        # since the last update.
+        if self.__visible:
+            now = time.perf_counter()
+            if (self.__last_update_time is None
+                    or now - self.__last_update_time >= self.__update_interval):
+                self.__update_items()
+
+    def __update_items(self):
+        # Updates the overlay's text and sparkline to show the recorded times.
+
+        now = time.perf_counter()
+        interval = None if self.__last_update_time is None else now - self.__last_update_time
+        self.__last_update_time = now
+
+        # Converts the frame times into frames per second, avoiding dividing by 0.
+        fps = 1 / self.__frame_time if self.__frame_time > 0 else 0.0
+        smoothed_frame_time = self.__smoothed_frame_time or 0.0
+        smoothed_fps = 1 / smoothed_frame_time if smoothed_frame_time > 0 else 0.0
+
+        # Updates the text with the times in milliseconds.
+        self.__canvas.itemconfigure(self.__text, text=(
+            f"FPS     {fps:6.1f} (avg {smoothed_fps:5.1f})\n"
+            f"frame   {self.__frame_time * 1000:6.2f} ms\n"
+            f"physics {self.__smoothed_physics_time * 1000:6.2f} ms\n"
+            f"render  {self.__smoothed_render_time * 1000:6.2f} ms\n"
+            f"idle    {self.__smoothed_idle_time * 1000:6.2f} ms\n"
+            f"tk calls {'?' if self.__tk_calls is None else self.__tk_calls:>5}"
+            f"{self.__task_lines(interval)}"))
+
+        # Updates the sparkline so that the most recent frame is on the right.
+        # A line needs at least 2 points, so the sparkline isn't changed until there are 2 frames.
+        if len(self.__frame_times) >= 2:
+            spacing = self.__sparkline_width / (self.__frame_times.maxlen - 1)
+            start_x = (self.__sparkline_left_x + self.__sparkline_width
+                       - (len(self.__frame_times) - 1) * spacing)
+            coordinates = []
+            for index, frame_time in enumerate(self.__frame_times):
+                coordinates.append(start_x + index * spacing)
+                coordinates.append(self.__sparkline_y(frame_time))
+            self.__canvas.coords(self.__sparkline, *coordinates)
+
+    def __task_lines(self, interval, count=2):
+        # Returns lines of text that show how many times per second the scheduler's busiest
+        # tasks have run since the last update, and how many milliseconds per second they
+        # have spent running, or an empty string if there is no scheduler.
+
+        if self.__scheduler is None:
+            return ""
+
+        # Works out what each task did since the last update.
+        task_stats = self.__scheduler.stats
+        task_rates = []
+        if interval:
+            for name, (runs, seconds) in task_stats.items():
+                previous_runs, previous_seconds = self.__previous_task_stats.get(name, (0, 0.0))
+                task_rates.append(((seconds - previous_seconds) / interval,
+                                   (runs - previous_runs) / interval, name))
+        self.__previous_task_stats = task_stats
+
+        # Shows the tasks that spent the most time running first.
+        task_rates.sort(reverse=True)
+        lines = ""
+        for busy_time, runs, name in task_rates[:count]:
+            lines += f"\n{name[:9]:<9}{runs:4.0f}/s {busy_time * 1000:5.1f}ms/s"
+        return lines
+
+    @property
+    def visible(self):
+        """(bool): Whether the overlay is shown"""
+
+        return self.__visible
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,217 @@
+from layers import LayerManager
+from tracer import TRACER
+
+class Renderer:
+    """A class that draws a World onto a canvas
+
+    The renderer only writes to the canvas (it never reads positions back from it),
+    and only sends the canvas the things that have changed since the last time it was synced.
+
+    If interpolation is turned on, the ball and paddle are drawn part of the way between where
+    they were before the last physics step and where they are now, so that they move smoothly
+    when the game is drawn more (or less) often than the world is stepped.
+
+    Methods:
+        sync(alpha): Updates the canvas so that it matches the current state of the world
+    """
+
+    def __init__(self, canvas, world, layers=None, interpolate=False):
+        """Initialises Renderer and draws the world's text, paddle, bricks and ball on the canvas
+
+        Parameters:
+            canvas (Canvas): The canvas that the world will be drawn on
+            world (World): The World object that will be drawn
+            layers (LayerManager) (default None): The layers of the canvas. The paddle, bricks
+                                                  and balls are drawn in the "world" layer and
+                                                  the text in the "hud" layer.
+                                                  If None, a LayerManager is created.
+            interpolate (bool) (default False): Whether the ball and paddle are drawn in
+                                                between their positions before and after
+                                                the last physics step
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__canvas = canvas
+        self.__world = world
+        self.__layers = layers if layers is not None else LayerManager(canvas)
+        self.__interpolate = interpolate
+
+        # Gets the canvas's width.
+        canvas_width = canvas.winfo_reqwidth()
+
+        # Creates text in the top left corner of the canvas that tells the user
+        # how many lives they have left.
+        self.__lives_text = canvas.create_text(10, 10, text=f"Lives: {world.lives}",
+                                               fill="#FFFFFF", font=("TkDefaultFont", 20),
+                                               anchor="nw", tags="hud")
+
+        # Creates text in the top middle of the canvas that tells the user the level they are on.
+        self.__level_text = canvas.create_text(canvas_width/2, 10, text=f"Level {world.level}",
+                                               fill="#FFFFFF", font=("TkDefaultFont", 20),
+                                               anchor="n", tags="hud")
+
+        # Creates text in the top right corner of the canvas that tells the user their score.
+        self.__score_text = canvas.create_text(canvas_width - 10, 10,
+                                               text=f"Score: {world.score}", fill="#FFFFFF",
+                                               font=("TkDefaultFont", 20), anchor="ne",
+                                               tags="hud")
+
+        # Moves the text into the "hud" layer.
+        self.__layers.place("hud")
+
+        # Stores the values that the text currently shows so that the text is only
+        # updated when they change.
+        self.__drawn_lives = world.lives
+        self.__drawn_level = world.level
+        self.__drawn_score = world.score
+
+        # Stores the Paddle object that is drawn, the object ID of the paddle
+        # and the coordinates that the paddle was last drawn at.
+        self.__drawn_paddle = None
+        self.__paddle_id = None
+        self.__paddle_coordinates = None
+
+        # Maps each Ball object that is drawn to the object ID of the ball
+        # and the coordinates that the ball was last drawn at.
+        self.__drawn_balls = {}
+
+        # Stores the brick field that is drawn.
+        # The object ID of the rectangle that represents each brick is stored in the brick field.
+        self.__drawn_bricks = None
+
+        # Draws the paddle, bricks and balls.
+        self.sync()
+
+    def sync(self, alpha=1.0):
+        """Updates the canvas so that it matches the current state of the world
+
+        This should be called once per frame after the world has been stepped.
+
+        Parameters:
+            alpha (float) (default 1.0): How far (from 0 to 1) between their positions before
+                                         and after the last physics step the ball and paddle
+                                         are drawn, if interpolation is turned on.
+                                         This is the fraction of a physics step that has passed
+                                         but hasn't been simulated yet.
+        """
+
+        # Stores whether any new paddle, ball or brick objects were created on the canvas.
+        created = False
+
+        # Only interpolates if it is turned on and would draw something in between.
+        interpolating = self.__interpolate and alpha < 1.0
+
+        # If the world has a different paddle to the one that is drawn (e.g. after loading a game),
+        # then replace the paddle on the canvas.
+        paddle = self.__world.paddle
+        if paddle is not self.__drawn_paddle:
+            if self.__paddle_id is not None:
+                self.__canvas.delete(self.__paddle_id)
+            self.__paddle_coordinates = (paddle.left_x, paddle.top_y, paddle.right_x,
+                                         paddle.bottom_y)
+            self.__paddle_id = self.__canvas.create_rectangle(*self.__paddle_coordinates,
+                                                              fill=paddle.colour, tags="world")
+            self.__drawn_paddle = paddle
+            created = True
+
+        # Otherwise, move the paddle on the canvas if it has moved.
+        else:
+            if interpolating:
+                left_x = paddle.previous_left_x + (paddle.left_x - paddle.previous_left_x) * alpha
+                coordinates = (left_x, paddle.top_y, left_x + paddle.right_x - paddle.left_x,
+                               paddle.bottom_y)
+            else:
+                coordinates = (paddle.left_x, paddle.top_y, paddle.right_x, paddle.bottom_y)
+            if coordinates != self.__paddle_coordinates:
+                self.__canvas.coords(self.__paddle_id, *coordinates)
+                self.__paddle_coordinates = coordinates
+
+        # If the world has a different brick field to the one that is drawn (e.g. after going
+        # onto the next level), then remove all of the old bricks and draw the new ones.
+        bricks = self.__world.bricks
+        if bricks is not self.__drawn_bricks:
+            if self.__drawn_bricks is not None:
+                self.__canvas.delete("brick")
+            for index in bricks.alive_indices():
+                bricks.set_canvas_id(index, self.__canvas.create_rectangle(
+                    bricks.left_x(index), bricks.top_y(index), bricks.right_x(index),
+                    bricks.bottom_y(index), fill=bricks.colour(index), tags=("world", "brick")))
+            self.__drawn_bricks = bricks
+            created = True
+
+        # Otherwise, remove any bricks that have been destroyed from the canvas.
+        else:
+            for brick_id in bricks.pop_removed_canvas_ids():
+                self.__canvas.delete(brick_id)
+
+        # Stores the balls that are drawn after this sync.
+        drawn_balls = {}
+
+        # Iterates over the balls in the world.
+        for ball in self.__world.balls:
+            if interpolating:
+                left_x = ball.previous_left_x + (ball.left_x - ball.previous_left_x) * alpha
+                top_y = ball.previous_top_y + (ball.top_y - ball.previous_top_y) * alpha
+                coordinates = (left_x, top_y, left_x + ball.right_x - ball.left_x,
+                               top_y + ball.bottom_y - ball.top_y)
+            else:
+                coordinates = (ball.left_x, ball.top_y, ball.right_x, ball.bottom_y)
+            drawn_ball = self.__drawn_balls.pop(ball, None)
+
+            # If the ball isn't drawn yet (e.g. after losing a life or a ball splitting),
+            # then draw it on the canvas.
+            if drawn_ball is None:
+                ball_id = self.__canvas.create_oval(*coordinates, fill=ball.colour, tags="world")
+                created = True
+
+            # Otherwise, move the ball on the canvas if it has moved.
+            else:
+                ball_id, drawn_coordinates = drawn_ball
+                if coordinates != drawn_coordinates:
+                    self.__canvas.coords(ball_id, *coordinates)
+
+            drawn_balls[ball] = (ball_id, coordinates)
+
+        # Any balls left over are no longer in the world, so remove them from the canvas.
+        for ball_id, _ in self.__drawn_balls.values():
+            self.__canvas.delete(ball_id)
+        self.__drawn_balls = drawn_balls
+
+        # If anything new was drawn, then move the paddle, bricks and balls into the "world"
+        # layer so that they don't cover the text, menus or countdowns being shown.
+        if created:
+            self.__layers.place("world")
+
+        # Updates the lives, level and score text if they have changed.
+        with TRACER.span("Renderer.update_text"):
+            if self.__world.lives != self.__drawn_lives:
+                self.__drawn_lives = self.__world.lives
+                self.__canvas.itemconfigure(self.__lives_text, text=f"Lives: {self.__drawn_lives}")
+            if self.__world.level != self.__drawn_level:
+                self.__drawn_level = self.__world.level
+                self.__canvas.itemconfigure(self.__level_text, text=f"Level {self.__drawn_level}")
+            if self.__world.score != self.__drawn_score:
+                self.__drawn_score = self.__world.score
+                self.__canvas.itemconfigure(self.__score_text,
+                                            text=f"Score: {self.__drawn_score}")
+
+    @property
+    def lives_text(self):
+        """(int): The object ID for the text displaying the user's lives in the game"""
+
+        return self.__lives_text
+
+    @property
+    def level_text(self):
+        """(int): The object ID for the text displaying the game's level"""
+
+        return self.__level_text
+
+    @property
+    def score_text(self):
+        """(int): The object ID for the text displaying the user's score in the game"""
+
+        return self.__score_text
+
+if __name__ == "__main__":
+    print("Please run main.py")
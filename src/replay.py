@@ -0,0 +1,267 @@
+import json
+import time
+import constants
+from world import World
+
+# The version of the replay file format. This changes whenever the rules of the game change,
+# as a replay recorded under different rules doesn't play back the same.
+REPLAY_VERSION = 3
+
+# The commands that can be recorded in a replay.
+# The paddle commands and cheats change the world, whereas pausing is only recorded so that
+# it is known when the user paused (the world doesn't step whilst the game is paused).
+PADDLE_COMMANDS = ("left", "right", "stop")
+REPLAY_COMMANDS = PADDLE_COMMANDS + ("pause", "resume", "reset_ball_speed", "set_lives")
+
+class ReplayRecorder:
+    """A class that records the inputs of a game so that the game can be played back exactly
+
+    Only changes to the inputs are recorded, each with the tick (the number of times the world
+    had been stepped) that it happened before, so a replay is much smaller than recording
+    the input state every tick. The game's seed and starting state are recorded too.
+
+    Methods:
+        record(command, value): Records an input before the next tick
+        advance(): Records that the world has been stepped once
+        to_dict(): Returns the replay as a dictionary that can be stored as JSON
+        save(file_path): Writes the replay to a JSON file
+    """
+
+    def __init__(self, world):
+        """Initialises ReplayRecorder with the starting state of a world
+
+        Parameters:
+            world (World): The world whose inputs will be recorded.
+                           This should be a new world that hasn't been stepped.
+        """
+
+        # Stores the state that the world started in so that it can be recreated.
+        self.__start = {"seed": world.seed, "width": world.width, "height": world.height,
+                        "lives": world.lives, "level": world.level,
+                        "multi_ball": world.multi_ball}
+
+        # Stores the number of times the world has been stepped.
+        self.__ticks = 0
+
+        # Stores the recorded inputs as [tick, command] or [tick, command, value].
+        self.__events = []
+
+        # Stores the last paddle command recorded so that held keys (which repeat) are only
+        # recorded once.
+        self.__paddle_command = "stop"
+
+    def record(self, command, value=None):
+        """Records an input that happens before the next tick
+
+        Parameters:
+            command (str): One of REPLAY_COMMANDS
+            value (int) (default None): The value for commands that need one (e.g. set_lives)
+        """
+
+        # Paddle commands that don't change what the paddle is doing aren't recorded.
+        if command in PADDLE_COMMANDS:
+            if command == self.__paddle_command:
+                return
+            self.__paddle_command = command
+
+        # Stores the input with the tick it happened before.
+        if value is None:
+            self.__events.append([self.__ticks, command])
+        else:
+            self.__events.append([self.__ticks, command, value])
+
+    def advance(self):
+        """Records that the world has been stepped once"""
+
+        self.__ticks += 1
+
+    def to_dict(self):
+        """Returns the replay as a dictionary that can be stored as JSON
+
+        Returns:
+            replay (dict): The replay's version, starting state, number of ticks and inputs
+        """
+
+        return {"version": REPLAY_VERSION, **self.__start, "ticks": self.__ticks,
+                "events": self.__events}
+
+    def save(self, file_path):
+        """Writes the replay to a JSON file
+
+        Parameters:
+            file_path (str): The path of the file to write the replay to
+        """
+
+        with open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @property
+    def ticks(self):
+        """(int): The number of times the world has been stepped"""
+
+        return self.__ticks
+
+    @property
+    def events(self):
+        """(List[list]): The recorded inputs as [tick, command] or [tick, command, value]"""
+
+        return self.__events
+
+class ReplayPlayer:
+    """A class that plays back a recorded game by recreating its world and applying the
+    recorded inputs at the same ticks
+
+    Methods:
+        step(): Applies the inputs for the next tick and steps the world
+        play_headless(): Plays the rest of the replay as fast as possible
+        play_real_time(canvas, renderer): Plays the rest of the replay at the normal speed
+    """
+
+    def __init__(self, replay):
+        """Initialises ReplayPlayer and creates the world in the state that the game started in
+
+        Parameters:
+            replay (dict): A replay from ReplayRecorder.to_dict() or load_replay()
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__replay = replay
+
+        # Creates the world in the same state as the recorded game started in.
+        self.__world = World(replay["width"], replay["height"], replay["lives"],
+                             replay["level"], replay["multi_ball"], seed=replay["seed"])
+
+        # Stores the number of times the world has been stepped and the index of the next
+        # input to apply.
+        self.__ticks = 0
+        self.__event_index = 0
+
+        # Stores the ID of the after() call for real time playback.
+        self.__after_id = None
+
+    def __apply(self, command, value=None):
+        # Applies a recorded input to the world.
+
+        if command == "left":
+            self.__world.paddle.move_left()
+        elif command == "right":
+            self.__world.paddle.move_right()
+        elif command == "stop":
+            self.__world.paddle.stop()
+        elif command == "reset_ball_speed":
+            self.__world.reset_ball_speed()
+        elif command == "set_lives":
+            self.__world.lives = value
+
+    def step(self):
+        """Applies the recorded inputs for the next tick and steps the world
+
+        Returns:
+            lost_life (bool): Whether the user lost a life during this tick
+            level_cleared (bool): Whether the user went onto the next level during this tick
+        """
+
+        # Applies every input that was recorded before this tick.
+        events = self.__replay["events"]
+        while (self.__event_index < len(events)
+               and events[self.__event_index][0] <= self.__ticks):
+            self.__apply(*events[self.__event_index][1:])
+            self.__event_index += 1
+
+        # Steps the world.
+        self.__ticks += 1
+        return self.__world.step()
+
+    def play_headless(self):
+        """Plays the rest of the replay as fast as possible without drawing it
+
+        Returns:
+            steps_per_second (float): How many ticks were simulated per second
+        """
+
+        # Steps the world until every recorded tick has been played, and times how long it takes.
+        start = time.perf_counter()
+        start_ticks = self.__ticks
+        while not self.finished:
+            self.step()
+        duration = time.perf_counter() - start
+
+        # Avoids dividing by 0 if there was nothing left to play.
+        if duration == 0:
+            return 0.0
+        return (self.__ticks - start_ticks) / duration
+
+    def play_real_time(self, canvas, renderer, on_finished=None):
+        """Plays the rest of the replay at constants.PHYSICS_STEPS_PER_SECOND ticks per second,
+        drawing each tick with a renderer
+
+        This only schedules the playback, so the Tkinter main loop needs to be running.
+
+        Parameters:
+            canvas (Canvas): The canvas used to schedule the ticks
+            renderer (Renderer): The renderer that draws the world onto the canvas
+            on_finished (function) (default None): A function that is called when the replay
+                                                   has finished
+        """
+
+        # Stores the time that the playback started at so that each tick can be scheduled
+        # against it, which stops the timing drifting.
+        start = time.perf_counter()
+        start_ticks = self.__ticks
+        timestep = 1 / constants.PHYSICS_STEPS_PER_SECOND
+
+        def play_tick():
+            # Steps the world, draws it, and schedules the next tick.
+
+            self.step()
+            renderer.sync()
+            if self.finished:
+                if on_finished is not None:
+                    on_finished()
+                return
+
+            deadline = start + (self.__ticks - start_ticks) * timestep
+            delay = max(0, round((deadline - time.perf_counter()) * 1000))
+            self.__after_id = canvas.after(delay, play_tick)
+
+        self.__after_id = canvas.after(0, play_tick)
+
+    @property
+    def world(self):
+        """(World): The World object that the replay is played back in"""
+
+        return self.__world
+
+    @property
+    def ticks(self):
+        """(int): The number of times the world has been stepped"""
+
+        return self.__ticks
+
+    @property
+    def finished(self):
+        """(bool): Whether every recorded tick has been played"""
+
+        return self.__ticks >= self.__replay["ticks"]
+
+def load_replay(file_path):
+    """Reads a replay from a JSON file written by ReplayRecorder.save()
+
+    Parameters:
+        file_path (str): The path of the replay file
+
+    Returns:
+        replay (dict): The replay, which can be passed to ReplayPlayer
+    """
+
+    with open(file_path, "rt", encoding="utf-8") as f:
+        replay = json.load(f)
+
+    # Replays from a different version of the format can't be played back correctly.
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {replay.get('version')}")
+
+    return replay
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,96 @@
+import time
+from tracer import TRACER
+
+class SceneManager:
+    """A class that shows one screen (a scene, e.g. the game or the leaderboard) at a time in
+    place of a home screen, and switches back to the home screen when the scene finishes
+
+    Each scene is given a callback when it is created, which it calls when it has finished.
+    Nothing needs to check whether the scene has finished, so no timers run whilst a scene
+    is being shown unless the scene itself needs them.
+
+    Methods:
+        show(name, create_scene): Hides the home screen and shows a new scene
+    """
+
+    def __init__(self, home_canvas, on_return=None):
+        """Initialises SceneManager
+
+        Parameters:
+            home_canvas (Canvas): The canvas of the home screen (the main menu)
+            on_return (Callable[[str], None]) (default None): Called with the name of the scene
+                                                              after the home screen is shown
+                                                              again when a scene finishes
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__home_canvas = home_canvas
+        self.__on_return = on_return
+
+        # Stores the scene that is being shown and its name (when a scene is being shown).
+        self.__scene = None
+        self.__scene_name = None
+
+    def show(self, name, create_scene):
+        """Hides the home screen and shows a new scene
+
+        Parameters:
+            name (str): The name of the scene, which is used in traces and passed to on_return
+            create_scene (Callable[[Callable[[], None]], object]): Creates the scene when called
+                                                                   with the callback that the
+                                                                   scene calls when it finishes
+
+        Returns:
+            scene: The scene that was created
+        """
+
+        # Stores the time that the switch started at so that it can be traced.
+        start = time.perf_counter()
+
+        # Causes the home screen's canvas to not be drawn to the window.
+        self.__home_canvas.pack_forget()
+
+        # Creates the scene, which draws itself to the window.
+        self.__scene_name = name
+        self.__scene = create_scene(self.__finish)
+
+        TRACER.add_span(f"SceneManager.show:{name}", start)
+        return self.__scene
+
+    def __finish(self):
+        # Shows the home screen again when the scene finishes, and starts looking for key inputs.
+
+        # Ignores the scene finishing more than once.
+        if self.__scene is None:
+            return
+
+        # Stores the time that the switch started at so that it can be traced.
+        start = time.perf_counter()
+
+        name = self.__scene_name
+        self.__scene = None
+        self.__scene_name = None
+        self.__home_canvas.pack()
+        self.__home_canvas.focus_set()
+
+        # Lets the home screen update itself now that it is being shown again.
+        if self.__on_return is not None:
+            self.__on_return(name)
+
+        TRACER.add_span(f"SceneManager.return:{name}", start)
+
+    @property
+    def scene(self):
+        """(object): The scene that is being shown, or None if the home screen is being shown"""
+
+        return self.__scene
+
+    @property
+    def scene_name(self):
+        """(str): The name of the scene that is being shown, or None if the home screen is
+        being shown"""
+
+        return self.__scene_name
+
+if __name__ == "__main__":
+    print("Please run main.py")
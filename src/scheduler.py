@@ -0,0 +1,213 @@
+import math
+import time
+
+class _Task:
+    """A class that holds a callback that the scheduler will run and when it will run it"""
+
+    __slots__ = ("name", "callback", "due", "priority", "remaining")
+
+    def __init__(self, name, callback, due, priority):
+        """Initialises _Task
+
+        Parameters:
+            name (str): The name of the task
+            callback (Callable[[], None]): The function that is called when the task runs
+            due (float): The time (from time.perf_counter()) that the task should run at
+            priority (int): Tasks with a higher priority run first when they are due together
+        """
+
+        self.name = name
+        self.callback = callback
+        self.due = due
+        self.priority = priority
+
+        # Stores how many seconds were left until the task was due when it was paused,
+        # or None if it isn't paused.
+        self.remaining = None
+
+class Scheduler:
+    """A class that runs all of the program's timed work from a single Tkinter timer
+
+    Each piece of timed work is a task with a name. Scheduling a task with the same name as
+    one that is waiting replaces it, so a task can never be running twice by accident, and
+    tasks are cancelled, paused and resumed by name, so their timer IDs never need to be kept.
+    Only one Tkinter timer is ever waiting, for whichever task is due first, and when nothing
+    is scheduled there is no timer at all. Tasks that are due at the same time run in order of
+    priority. A task only runs once, so a task that repeats schedules itself again.
+
+    The scheduler counts how many times each task has run and how long it has spent running,
+    so that it is always possible to see what is using the time in each frame.
+
+    Methods:
+        schedule(name, callback, delay, priority): Schedules a task to run after a delay
+        cancel(name): Stops a task from running
+        pause(name): Stops a task's timer until it is resumed
+        resume(name): Restarts the timer of a paused task
+        is_scheduled(name): Returns whether a task is waiting to run
+        is_paused(name): Returns whether a task is paused
+    """
+
+    def __init__(self, widget):
+        """Initialises Scheduler
+
+        Parameters:
+            widget (Misc): Any Tkinter widget (e.g. the window), which is used for the timer
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__widget = widget
+
+        # Maps the name of each task that is waiting to run to the task.
+        self.__tasks = {}
+
+        # Stores the ID of the Tkinter timer and the time it was set for (when it is set).
+        self.__timer_id = None
+        self.__timer_due = None
+
+        # Maps the name of each task that has run to how many times it has run and how many
+        # seconds it has spent running in total.
+        self.__stats = {}
+
+    def schedule(self, name, callback, delay=0.0, priority=0):
+        """Schedules a task to run after a delay, replacing any waiting task with the same name
+
+        Parameters:
+            name (str): The name of the task
+            callback (Callable[[], None]): The function that is called when the task runs
+            delay (float) (default 0.0): The number of seconds until the task runs
+            priority (int) (default 0): Tasks with a higher priority run first when they are
+                                        due at the same time
+        """
+
+        self.__tasks[name] = _Task(name, callback, time.perf_counter() + delay, priority)
+        self.__set_timer()
+
+    def cancel(self, name):
+        """Stops a task from running if it is waiting to run (or paused)
+
+        Parameters:
+            name (str): The name of the task
+        """
+
+        if self.__tasks.pop(name, None) is not None:
+            self.__set_timer()
+
+    def pause(self, name):
+        """Stops a task's timer, so that it doesn't run until it is resumed
+
+        Parameters:
+            name (str): The name of the task
+        """
+
+        task = self.__tasks.get(name)
+        if task is not None and task.remaining is None:
+            task.remaining = max(0.0, task.due - time.perf_counter())
+            self.__set_timer()
+
+    def resume(self, name):
+        """Restarts the timer of a paused task, so that it runs after the time that was left
+        when it was paused
+
+        Parameters:
+            name (str): The name of the task
+        """
+
+        task = self.__tasks.get(name)
+        if task is not None and task.remaining is not None:
+            task.due = time.perf_counter() + task.remaining
+            task.remaining = None
+            self.__set_timer()
+
+    def is_scheduled(self, name):
+        """Returns whether a task is waiting to run (including if it is paused)
+
+        Parameters:
+            name (str): The name of the task
+
+        Returns:
+            scheduled (bool): Whether the task is waiting to run
+        """
+
+        return name in self.__tasks
+
+    def is_paused(self, name):
+        """Returns whether a task is paused
+
+        Parameters:
+            name (str): The name of the task
+
+        Returns:
+            paused (bool): Whether the task is waiting to run and is paused
+        """
+
+        task = self.__tasks.get(name)
+        return task is not None and task.remaining is not None
+
+    def __set_timer(self):
+        # Makes sure that the Tkinter timer is set for when the first task that isn't paused is
+        # due, or isn't set if there are no such tasks.
+
+        # Finds when the first task is due.
+        due = None
+        for task in self.__tasks.values():
+            if task.remaining is None and (due is None or task.due < due):
+                due = task.due
+
+        # If the timer is already set for then, then leave it.
+        if due == self.__timer_due:
+            return
+
+        # Otherwise, cancels the old timer and sets a new one.
+        # The delay is rounded up so that the timer doesn't go off before the task is due.
+        if self.__timer_id is not None:
+            self.__widget.after_cancel(self.__timer_id)
+            self.__timer_id = None
+        self.__timer_due = due
+        if due is not None:
+            delay = max(0, math.ceil((due - time.perf_counter()) * 1000))
+            self.__timer_id = self.__widget.after(delay, self.__run_due_tasks)
+
+    def __run_due_tasks(self):
+        # Runs every task that is due in order of priority and then of when they were due,
+        # then sets the timer for the next task.
+
+        self.__timer_id = None
+        self.__timer_due = None
+
+        now = time.perf_counter()
+        due_tasks = [task for task in self.__tasks.values()
+                     if task.remaining is None and task.due <= now]
+        due_tasks.sort(key=lambda task: (-task.priority, task.due))
+
+        # The timer is set again even if a task raises an error, so that the other tasks
+        # keep running.
+        try:
+            for task in due_tasks:
+
+                # Skips tasks that were cancelled, paused or replaced by a task that ran
+                # before them.
+                if self.__tasks.get(task.name) is not task or task.remaining is not None:
+                    continue
+
+                # Removes the task before running it so that it can schedule itself again,
+                # and times how long it takes.
+                del self.__tasks[task.name]
+                start = time.perf_counter()
+                try:
+                    task.callback()
+                finally:
+                    stats = self.__stats.setdefault(task.name, [0, 0.0])
+                    stats[0] += 1
+                    stats[1] += time.perf_counter() - start
+        finally:
+            self.__set_timer()
+
+    @property
+    def stats(self):
+        """(dict[str: tuple[int, float]]): Maps the name of each task that has run to how many
+        times it has run and how many seconds it has spent running in total"""
+
+        return {name: (runs, seconds) for name, (runs, seconds) in self.__stats.items()}
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,87 @@
+import time
+
+class StartupProfile:
+    """A class that records when each phase of starting the program finishes so that a
+    timeline can be printed
+
+    Marks are cheap to record, so they are always recorded, and they are only printed if the
+    profile is enabled (with --startup-profile). The timeline is printed when the main menu
+    can first be used, and marks recorded after that (e.g. by work that was put off until the
+    main menu had appeared) are printed as they happen.
+
+    Methods:
+        enable(): Makes the profile print its timeline
+        mark(name): Records that a phase has finished
+        report(): Prints the marks that have been recorded so far
+    """
+
+    def __init__(self):
+        """Initialises StartupProfile and starts timing from now"""
+
+        # Stores the time that the profile starts from, so that the program's start is at 0ms.
+        self.__origin = time.perf_counter()
+
+        # Stores the name of each mark and the time it was recorded at, in order.
+        self.__marks = []
+
+        # Stores whether the timeline is printed and whether it has been printed yet.
+        self.__enabled = False
+        self.__reported = False
+
+    def enable(self):
+        """Makes the profile print its timeline when report() is called"""
+
+        self.__enabled = True
+
+    def mark(self, name):
+        """Records that a phase of starting the program has finished
+
+        Parameters:
+            name (str): The name of the phase
+        """
+
+        # Appending to a list is atomic, so marks can be recorded from more than one thread.
+        self.__marks.append((name, time.perf_counter()))
+
+        # Marks recorded after the timeline has been printed are printed straight away.
+        if self.__enabled and self.__reported:
+            self.__print_mark(len(self.__marks) - 1)
+
+    def report(self):
+        """Prints the marks that have been recorded so far if the profile is enabled"""
+
+        if not self.__enabled or self.__reported:
+            return
+
+        self.__reported = True
+        print("Startup profile (ms since the program started, ms since the previous mark):")
+        for index in range(len(self.__marks)):
+            self.__print_mark(index)
+
+    def __print_mark(self, index):
+        # Prints a mark with how long after the start and the previous mark it was recorded.
+
+        name, mark_time = self.__marks[index]
+        previous_time = self.__marks[index - 1][1] if index > 0 else self.__origin
+        print(f"{(mark_time - self.__origin) * 1000:9.1f} "
+              f"{(mark_time - previous_time) * 1000:+9.1f}  {name}")
+
+    @property
+    def enabled(self):
+        """(bool): Whether the timeline is printed"""
+
+        return self.__enabled
+
+    @property
+    def marks(self):
+        """(List[tuple[str, float]]): The name of each mark and how many seconds after the
+        start it was recorded"""
+
+        return [(name, mark_time - self.__origin) for name, mark_time in self.__marks]
+
+# The startup profile used by the whole program. It starts timing when it is first imported,
+# which main.py does before anything else.
+STARTUP_PROFILE = StartupProfile()
+
+if __name__ == "__main__":
+    print("Please run main.py")
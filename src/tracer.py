@@ -0,0 +1,230 @@
+import itertools
+import json
+import os
+import threading
+import time
+
+# The default file that traces are dumped to.
+DEFAULT_TRACE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                                  "trace.json")
+
+class _Span:
+    """A class that times a block of code in a with statement and records it in a tracer"""
+
+    __slots__ = ("__tracer", "__name", "__category", "__start")
+
+    def __init__(self, tracer, name, category):
+        """Initialises _Span
+
+        Parameters:
+            tracer (Tracer): The tracer that the span is recorded in
+            name (str): The name of the span
+            category (str): The category of the span
+        """
+
+        self.__tracer = tracer
+        self.__name = name
+        self.__category = category
+        self.__start = 0.0
+
+    def __enter__(self):
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.__tracer.add_span(self.__name, self.__start, time.perf_counter(), self.__category)
+        return False
+
+class _NullSpan:
+    """A class that does nothing in a with statement, which is used when tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        return False
+
+# The span that is returned when tracing is disabled. Only one is needed as it has no state.
+_NULL_SPAN = _NullSpan()
+
+class Tracer:
+    """A class that records how long each phase of the game takes so that a session can be
+    opened in a trace viewer (e.g. Perfetto or chrome://tracing)
+
+    Spans are stored in a ring buffer that is allocated when the tracer is created, so recording
+    a span never allocates a list, and the oldest spans are overwritten once the buffer is full.
+    When the tracer is disabled, span() returns a shared object that does nothing, so code can
+    be traced for the cost of a method call. Very hot code should check enabled first instead.
+
+    Methods:
+        enable(): Starts recording spans
+        disable(): Stops recording spans
+        span(name, category): Returns a context manager that records the time spent inside it
+        add_span(name, start, end, category): Records a span that has already been timed
+        clear(): Removes all of the recorded spans
+        to_chrome_trace(): Returns the recorded spans in the Chrome Trace Event format
+        dump(file_path): Writes the recorded spans to a JSON file
+    """
+
+    def __init__(self, capacity=65536, enabled=False):
+        """Initialises Tracer and allocates its ring buffer
+
+        Parameters:
+            capacity (int) (default 65536): The maximum number of spans that are kept
+            enabled (bool) (default False): Whether spans are recorded straight away
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__capacity = capacity
+        self.__enabled = enabled
+
+        # Allocates the ring buffer as one list for each field of a span.
+        # Times are stored in seconds from time.perf_counter().
+        self.__names = [None] * capacity
+        self.__categories = [None] * capacity
+        self.__starts = [0.0] * capacity
+        self.__ends = [0.0] * capacity
+        self.__thread_ids = [0] * capacity
+
+        # Counts the spans that have been recorded. next() on a count is atomic, so spans can be
+        # recorded from more than one thread.
+        self.__counter = itertools.count()
+        self.__recorded = 0
+
+        # Stores the time that the trace starts from, so that the timestamps in the trace are
+        # small numbers.
+        self.__origin = time.perf_counter()
+
+    def enable(self):
+        """Starts recording spans"""
+
+        self.__enabled = True
+
+    def disable(self):
+        """Stops recording spans"""
+
+        self.__enabled = False
+
+    def span(self, name, category="game"):
+        """Returns a context manager that records the time spent inside a with statement
+        as a span
+
+        Parameters:
+            name (str): The name of the span
+            category (str) (default "game"): The category of the span
+
+        Returns:
+            span (_Span): The context manager, which does nothing if the tracer is disabled
+        """
+
+        if not self.__enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    def add_span(self, name, start, end=None, category="game"):
+        """Records a span that has already been timed
+
+        Parameters:
+            name (str): The name of the span
+            start (float): The time the span started at from time.perf_counter()
+            end (float) (default None): The time the span ended at from time.perf_counter().
+                                        If None, the span ends now.
+            category (str) (default "game"): The category of the span
+        """
+
+        if not self.__enabled:
+            return
+
+        if end is None:
+            end = time.perf_counter()
+
+        # Writes the span over the oldest slot in the ring buffer.
+        recorded = next(self.__counter) + 1
+        index = (recorded - 1) % self.__capacity
+        self.__names[index] = name
+        self.__categories[index] = category
+        self.__starts[index] = start
+        self.__ends[index] = end
+        self.__thread_ids[index] = threading.get_ident()
+        self.__recorded = max(self.__recorded, recorded)
+
+    def clear(self):
+        """Removes all of the recorded spans"""
+
+        self.__counter = itertools.count()
+        self.__recorded = 0
+        self.__origin = time.perf_counter()
+
+    def to_chrome_trace(self):
+        """Returns the recorded spans in the Chrome Trace Event format
+
+        Returns:
+            trace (dict): The trace, which can be written to a JSON file and opened in a trace
+                          viewer
+        """
+
+        process_id = os.getpid()
+        spans = min(self.__recorded, self.__capacity)
+
+        # Creates a complete ("X") event for each span, with times in microseconds.
+        events = []
+        for index in range(spans):
+            events.append({"name": self.__names[index], "cat": self.__categories[index],
+                           "ph": "X", "pid": process_id, "tid": self.__thread_ids[index],
+                           "ts": (self.__starts[index] - self.__origin) * 1e6,
+                           "dur": (self.__ends[index] - self.__starts[index]) * 1e6})
+
+        # The ring buffer wraps around, so the events are sorted into the order they started in.
+        events.sort(key=lambda event: event["ts"])
+
+        # Names each thread that recorded a span so that the viewer shows readable names.
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id in set(self.__thread_ids[:spans]):
+            events.append({"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id,
+                           "args": {"name": thread_names.get(thread_id, str(thread_id))}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"dropped_spans": max(0, self.__recorded - self.__capacity)}}
+
+    def dump(self, file_path=DEFAULT_TRACE_PATH):
+        """Writes the recorded spans to a JSON file in the Chrome Trace Event format
+
+        Parameters:
+            file_path (str) (default assets/trace.json): The path of the file to write
+
+        Returns:
+            spans (int): The number of spans written
+        """
+
+        trace = self.to_chrome_trace()
+        with open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(trace, f, separators=(",", ":"))
+
+        return min(self.__recorded, self.__capacity)
+
+    @property
+    def enabled(self):
+        """(bool): Whether spans are being recorded"""
+
+        return self.__enabled
+
+    @property
+    def capacity(self):
+        """(int): The maximum number of spans that are kept"""
+
+        return self.__capacity
+
+    @property
+    def recorded(self):
+        """(int): The number of spans that have been recorded since the tracer was cleared,
+        including any that have been overwritten"""
+
+        return self.__recorded
+
+# The tracer used by the whole game. It is disabled unless the game is started with --trace.
+TRACER = Tracer()
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,687 @@
+import math
+import random
+import time
+from ball import Ball
+from brick_field import BrickField
+import constants
+from paddle import Paddle
+from tracer import TRACER
+
+class World:
+    """A class that represents the state of a game of Breakout (the ball, paddle, bricks, walls,
+    score, lives and level) independently of how it is drawn
+
+    Nothing in this class uses Tkinter, so it can be stepped without a window
+    (e.g. for tests, benchmarks and bots).
+
+    In multi-ball mode, a ball splits into two whenever it destroys a brick (up to
+    constants.MAX_BALLS balls), and the user only loses a life when every ball has been lost.
+    The difficulty parameters default to the values in constants.py, but can be changed
+    (e.g. to balance the difficulty curve by simulating games with different values).
+
+    Methods:
+        step(): Moves the paddle and balls by one tick (1/constants.PHYSICS_STEPS_PER_SECOND
+                seconds) and applies scoring, lives and levels
+        split_ball(ball): Adds a new ball travelling away from an existing ball
+        to_save_data(): Returns all of the data needed to save the game
+        load_save_data(data): Changes the world to match saved game data
+    """
+
+    def __init__(self, width=constants.WINDOW_WIDTH, height=constants.WINDOW_HEIGHT,
+                 lives=constants.DEFAULT_STARTING_LIVES, level=constants.DEFAULT_STARTING_LEVEL,
+                 multi_ball=False, ball_speed=constants.DEFAULT_BALL_SPEED,
+                 speed_up_amount=constants.DEFAULT_SPEED_UP_AMOUNT,
+                 bounces_until_speed_up=constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP,
+                 paddle_width=constants.DEFAULT_PADDLE_WIDTH,
+                 level_scaling=constants.DEFAULT_LEVEL_SCALING, seed=None):
+        """Initialises World and creates the paddle, ball and bricks for the game
+
+        Parameters:
+            width (int) (default 800): The width of the area the game is played in
+            height (int) (default 500): The height of the area the game is played in
+            lives (int) (default 3): The number of lives the user has
+            level (int) (default 1): The level the game is on
+            multi_ball (bool) (default False): Whether balls split when they destroy a brick
+            ball_speed (float) (default 480.0): The speed of the ball on level 1 in pixels per
+                                                second
+            speed_up_amount (float) (default 60.0): How much the ball speeds up by on level 1
+                                                    in pixels per second
+            bounces_until_speed_up (int) (default 3): How many times the ball has to bounce off
+                                                      the paddle to speed up on level 1.
+                                                      This goes down by 1 each level (to a
+                                                      minimum of 1).
+            paddle_width (int) (default 150): The width of the paddle
+            level_scaling (float) (default 1.2): How many times faster the ball's speed and
+                                                 speed up amount get each level
+            seed (int) (default None): The seed for the game's random number generator.
+                                       Games with the same seed and inputs play out
+                                       exactly the same.
+                                       If None, a random seed is chosen.
+        """
+
+        # Assigns values to the object's attributes based on the arguments to the initialiser.
+        self.__width = width
+        self.__height = height
+        self.__lives = lives
+        self.__level = level
+        self.__multi_ball = multi_ball
+        self.__ball_speed = ball_speed
+        self.__speed_up_amount = speed_up_amount
+        self.__bounces_until_speed_up = bounces_until_speed_up
+        self.__paddle_width = paddle_width
+        self.__level_scaling = level_scaling
+
+        # Stores how many seconds each tick moves the paddle and balls for. This is always the
+        # same so that the game plays out exactly the same however often it is drawn.
+        self.__timestep = 1 / constants.PHYSICS_STEPS_PER_SECOND
+
+        # Chooses a seed if one wasn't given so that the game can still be reproduced later.
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.__seed = seed
+
+        # Creates the random number generator used by all of the game's balls.
+        self.__random = random.Random(seed)
+
+        # Stores the user's score.
+        self.__score = 0
+
+        # Creates a Paddle object to represent the paddle in the game.
+        self.__paddle = Paddle(width, height, paddle_width)
+
+        # Creates a brick field that stores all of the bricks in the game.
+        self.__bricks = self.create_initial_bricks()
+
+        # Stores the Ball objects that represent the balls in the game.
+        # There is only ever one ball unless the game is in multi-ball mode.
+        self.__balls = []
+        self.create_new_ball()
+
+    def step(self):
+        """Moves the paddle and balls by one tick, adds any score gained from destroying bricks,
+        and makes the user lose a life or go onto the next level if necessary
+
+        Each tick moves the paddle and balls for the same number of seconds (the timestep).
+
+        Returns:
+            lost_life (bool): Whether the user lost a life during this tick
+            level_cleared (bool): Whether the user destroyed all the bricks and went onto
+                                  the next level during this tick
+        """
+
+        # Causes the paddle to move based on its speed.
+        with TRACER.span("Paddle.move"):
+            self.__paddle.move(self.__timestep)
+
+        # Stores the score the user gained from destroying bricks, the balls that are still
+        # in play after moving and the balls that were split off this tick.
+        # The lists of balls are only created when a ball is lost or split off, so that a
+        # normal tick doesn't allocate anything.
+        score = 0
+        balls = self.__balls
+        remaining_balls = None
+        new_balls = None
+
+        # Stores whether each ball's move should be traced. This is checked once per tick
+        # instead of once per ball as there can be lots of balls.
+        tracing = TRACER.enabled
+        timestep = self.__timestep
+
+        # Causes each ball to move based on its velocity, and then return whether it went past
+        # the bottom of the canvas and any score the user gained from destroying bricks.
+        for ball in balls:
+            if tracing:
+                start = time.perf_counter()
+                lost_ball, ball_score = ball.move(timestep)
+                TRACER.add_span("Ball.move", start)
+            else:
+                lost_ball, ball_score = ball.move(timestep)
+            score += ball_score
+
+            # Balls that went past the bottom of the canvas are removed from the game.
+            # When the first ball is lost, the balls before it are copied into the list of
+            # balls that are still in play.
+            if lost_ball:
+                if remaining_balls is None:
+                    remaining_balls = balls[:balls.index(ball)]
+                continue
+            if remaining_balls is not None:
+                remaining_balls.append(ball)
+
+            # In multi-ball mode, a ball that destroyed a brick splits into two.
+            if self.__multi_ball and ball_score:
+                if new_balls is None:
+                    new_balls = []
+                if len(balls) + len(new_balls) < constants.MAX_BALLS:
+                    new_balls.append(self.__create_split_ball(ball))
+
+        # Replaces the balls with the ones still in play and the new ones that were split off,
+        # which start moving next tick.
+        if remaining_balls is not None:
+            self.__balls = remaining_balls
+        if new_balls:
+            self.__balls = self.__balls + new_balls
+
+        # The user only loses a life when there are no balls left in play.
+        lost_life = not self.__balls
+
+        # Add the score that the player gained from destroying bricks to their total score
+        # with higher level bricks being worth a higher score.
+        self.__score += self.__level * score
+
+        # If the user should lose lives then call the method for that to happen.
+        if lost_life:
+            with TRACER.span("World.lose_life"):
+                self.lose_life()
+
+        # If there are no more bricks left, then go onto the next level
+        # and fill the screen with bricks again.
+        level_cleared = not self.__bricks
+        if level_cleared:
+            with TRACER.span("World.next_level"):
+                self.next_level()
+
+        return lost_life, level_cleared
+
+    def create_initial_bricks(self, brick_height=constants.DEFAULT_BRICK_HEIGHT,
+                              bricks_per_row=constants.DEFAULT_BRICKS_PER_ROW,
+                              row_gap_from_top=constants.DEFAULT_ROW_GAP_FROM_TOP, colours=None):
+        """Creates all of the initial bricks for the game and returns them
+
+        Parameters:
+            brick_height (int) (default 20): The height of each brick
+            bricks_per_row (int) (default 10): How many bricks there are in each row
+            row_gap_from_top (int) (default 4): How many brick heights of space are left
+                                                above the top row
+            colours (List[str]) (default None): The colour of each row of bricks from the top.
+                                                This defaults to constants.DEFAULT_BRICK_COLOURS.
+
+        Returns:
+            bricks (BrickField): A brick field that stores the bricks created
+        """
+
+        # Assigns the default value to the argument if one wasn't already given.
+        if colours is None:
+            colours = constants.DEFAULT_BRICK_COLOURS
+
+        # Calculates the width of each brick so that a row of bricks
+        # takes up the whole canvas width.
+        brick_width = int(self.__width / bricks_per_row)
+
+        # A brick field that holds all of the bricks created.
+        # The cells of its grid are the same size as the bricks so that each brick only covers
+        # the cells around it.
+        bricks = BrickField(cell_width=brick_width, cell_height=brick_height)
+
+        # Iterates over the number of rows of bricks.
+        for row, colour in enumerate(colours):
+
+            # Iterates over the x coordinate of the top left corner of each brick.
+            for x in range(0, bricks_per_row * brick_width, brick_width):
+
+                # Calculates the x and y coordinates for the top left corner of the brick.
+                # The coordinates are calculated so that a row of bricks takes up the
+                # whole canvas width, and so that there is a space at the top of the canvas
+                # for the ball to bounce in.
+                brick_left_x = x
+                brick_top_y = row * brick_height + row_gap_from_top * brick_height
+
+                # Calculates the score that the brick will be worth based on which row it's in
+                # (brick's in the top row will be worth more than bricks in the bottom row)
+                brick_score = (len(colours) - row) * constants.DEFAULT_BRICK_SCORE
+
+                # Adds a brick to the brick field at the calculated coordinates
+                # in the right colour for the row that the brick is in.
+                bricks.add(brick_left_x, brick_top_y, brick_score, colour, brick_width,
+                           brick_height)
+
+        # Returns the brick field.
+        return bricks
+
+    def split_ball(self, ball):
+        """Adds a new ball to the game at the same position as an existing ball, travelling
+        away from it
+
+        Parameters:
+            ball (Ball): The ball to split
+
+        Returns:
+            new_ball (Ball): The ball that was added
+        """
+
+        # Creates the new ball and adds it to the balls in the game.
+        new_ball = self.__create_split_ball(ball)
+        self.__balls.append(new_ball)
+
+        return new_ball
+
+    def __create_split_ball(self, ball):
+        # Creates a new ball at the same position and speed as the given ball, but mirrored
+        # horizontally so that the two balls travel away from each other.
+
+        # If the ball is travelling straight up or down then the new ball is sent off at 30
+        # degrees from vertical, otherwise its x velocity is reversed.
+        x_velocity = -ball.x_velocity
+        y_velocity = ball.y_velocity
+        if abs(x_velocity) < 1e-9:
+            x_velocity = ball.speed * math.sin(math.radians(30))
+            y_velocity = math.copysign(ball.speed * math.cos(math.radians(30)), y_velocity)
+
+        # Creates the new ball with the same attributes as the ball being split.
+        new_ball = Ball(self.__width, self.__height, self.__paddle, self.__bricks, self.__level,
+                        x_velocity, y_velocity, ball.bounces_until_speed_up,
+                        ball.speed_up_amount, ball.radius, colour=ball.colour,
+                        original_bounces_until_speed_up=self.__level_bounces_until_speed_up(),
+                        rng=self.__random)
+
+        # Moves the new ball to the same position as the ball being split.
+        new_ball.left_x = ball.left_x
+        new_ball.top_y = ball.top_y
+        new_ball.right_x = ball.right_x
+        new_ball.bottom_y = ball.bottom_y
+        new_ball.speed = ball.speed
+
+        return new_ball
+
+    def reset_paddle(self):
+        """Resets the paddle back to the starting position"""
+
+        # Creates a new paddle with the default arguments
+        # so that it's created at the default starting position.
+        new_paddle = Paddle(self.__width, self.__height, self.__paddle_width)
+
+        # Copies all of the relevant attributes of the new paddle to the current paddle
+        # so that the current instance of the paddle acts as the new instance of the paddle.
+        # This is done so that the instance of the Paddle object stored in the Ball object
+        # won't have to change.
+        self.__paddle.left_x = new_paddle.left_x
+        self.__paddle.top_y = new_paddle.top_y
+        self.__paddle.right_x = new_paddle.right_x
+        self.__paddle.bottom_y = new_paddle.bottom_y
+        self.__paddle.width = new_paddle.width
+
+    def __level_bounces_until_speed_up(self):
+        # Returns how many times the ball has to bounce off the paddle to speed up on the
+        # current level.
+
+        return max(1, self.__bounces_until_speed_up - self.__level + 1)
+
+    def create_new_ball(self):
+        """Resets the ball back to the starting position and applies level scaling"""
+
+        # Adjusts some of the default arguments for the Ball object to make further levels harder.
+        ball_bounces_until_speed_up = self.__level_bounces_until_speed_up()
+        ball_speed_up_amount = self.__speed_up_amount * self.__level_scaling**(self.__level - 1)
+        ball_y_velocity = self.__ball_speed * self.__level_scaling**(self.__level - 1)
+
+        # Creates a new ball with the default arguments so that it's created at the default
+        # starting position.
+        ball = Ball(self.__width, self.__height, self.__paddle, self.__bricks,
+                    self.__level, y_velocity=ball_y_velocity,
+                    bounces_until_speed_up=ball_bounces_until_speed_up,
+                    speed_up_amount=ball_speed_up_amount,
+                    original_bounces_until_speed_up=ball_bounces_until_speed_up,
+                    rng=self.__random)
+
+        # Adjusts some of the ball's attributes to make the game exponentially more difficult
+        # in further levels.
+        ball.speed = self.__ball_speed * self.__level_scaling**(self.__level - 1)
+
+        # Replaces all of the balls in the game with the new ball.
+        self.__balls = [ball]
+
+    def lose_life(self):
+        """Makes the user lose 1 life and resets the paddle and ball"""
+
+        # Makes the player lose a life.
+        self.__lives -= 1
+
+        # Resets the paddle back to the middle of the game.
+        self.reset_paddle()
+
+        # Resets the ball back to the middle of the game.
+        self.create_new_ball()
+
+    def next_level(self):
+        """Causes the game to go onto the next level"""
+
+        # Increases the game's level.
+        self.__level += 1
+
+        # Creates a new set of bricks for the game.
+        self.__bricks = self.create_initial_bricks()
+
+        # Resets the paddle back to the middle of the game.
+        self.reset_paddle()
+
+        # Resets the ball back to the middle of the game and applies level scaling.
+        self.create_new_ball()
+
+    def reset_ball_speed(self):
+        """Resets the speed of every ball back to the level 1 value whilst keeping
+        their directions"""
+
+        # Iterates over all of the balls in the game.
+        for ball in self.__balls:
+
+            # Sets the ball's speed back to the level 1 value.
+            ball.speed = self.__ball_speed
+
+            # Calculates the angle that the ball is travelling at.
+            # The angle is taken anti-clockwise from the positive x-axis.
+            angle = math.atan2(ball.y_velocity, ball.x_velocity)
+
+            # Updates the ball's velocities so that it still travels in the same direction but
+            # with the updated speed.
+            ball.x_velocity = ball.speed * math.cos(angle)
+            ball.y_velocity = ball.speed * math.sin(angle)
+
+    def to_save_data(self):
+        """Returns all of the data needed to save the game, in a form that can be stored as JSON
+
+        Returns:
+            data (dict): The game, paddle, ball and brick data
+        """
+
+        # Data structures that will store all of the data necessary to save the game.
+        data = {}
+        game_data = {}
+        paddle_data = {}
+        bricks_data = []
+
+        # Stores all of the relevant game data into the data dictionary.
+        game_data["lives"] = self.__lives
+        game_data["score"] = self.__score
+        game_data["level"] = self.__level
+        game_data["multi_ball"] = self.__multi_ball
+        game_data["velocity_units"] = "pixels per second"
+        data["game"] = game_data
+
+        # Stores all of the relevant paddle data into the data dictionary.
+        paddle_data["left_x"] = self.__paddle.left_x
+        paddle_data["top_y"] = self.__paddle.top_y
+        paddle_data["right_x"] = self.__paddle.right_x
+        paddle_data["bottom_y"] = self.__paddle.bottom_y
+        paddle_data["width"] = self.__paddle.width
+        paddle_data["height"] = self.__paddle.height
+        paddle_data["colour"] = self.__paddle.colour
+        paddle_data["canvas_gap"] = self.__paddle.canvas_gap
+        data["paddle"] = paddle_data
+
+        # Stores all of the relevant data for the first ball into the data dictionary,
+        # and the data for any other balls (in multi-ball mode) in a separate list.
+        data["ball"] = self.__get_ball_data(self.__balls[0])
+        data["extra_balls"] = [self.__get_ball_data(ball) for ball in self.__balls[1:]]
+
+        # Iterates over each brick that is still alive.
+        for brick in self.__bricks:
+
+            # Stores all of the relevant brick data into the bricks_data list.
+            brick_data = {}
+            brick_data["x"] = brick.left_x
+            brick_data["y"] = brick.top_y
+            brick_data["width"] = brick.width
+            brick_data["height"] = brick.height
+            brick_data["score"] = brick.score
+            brick_data["colour"] = brick.colour
+            bricks_data.append(brick_data)
+
+        # Stores the bricks data into the data dictionary.
+        data["bricks"] = bricks_data
+
+        return data
+
+    def __get_ball_data(self, ball):
+        # Returns a dictionary of all of the relevant data needed to save a ball.
+
+        ball_data = {}
+        ball_data["x_velocity"] = ball.x_velocity
+        ball_data["y_velocity"] = ball.y_velocity
+        ball_data["speed"] = ball.speed
+        ball_data["bounces_until_speed_up"] = ball.bounces_until_speed_up
+        ball_data["speed_up_amount"] = ball.speed_up_amount
+        ball_data["radius"] = ball.radius
+        ball_data["left_x"] = ball.left_x
+        ball_data["top_y"] = ball.top_y
+        ball_data["right_x"] = ball.right_x
+        ball_data["bottom_y"] = ball.bottom_y
+        ball_data["colour"] = ball.colour
+        ball_data["paddle_gap"] = ball.paddle_gap
+
+        return ball_data
+
+    def load_save_data(self, data):
+        """Changes the world to match saved game data from to_save_data()
+
+        All of the data is read before anything is changed, so the world is left as it was
+        if the data isn't correctly formatted.
+
+        Parameters:
+            data (dict): The saved game data
+
+        Raises:
+            KeyError: If the data is missing something needed to load the game
+        """
+
+        # Split the saved game data into various different data dictionaries.
+        game_data = data["game"]
+        paddle_data = data["paddle"]
+        bricks_data = data["bricks"]
+
+        # Gets the data for the first ball and any other balls (in multi-ball mode).
+        # Games saved before multi-ball mode existed only have the first ball.
+        balls_data = [data["ball"]] + data.get("extra_balls", [])
+
+        # Gets the score and number of lives the user has and whether balls split.
+        lives = game_data["lives"]
+        score = game_data["score"]
+        level = game_data["level"]
+        multi_ball = game_data.get("multi_ball", False)
+
+        # Games saved before velocities were measured in pixels per second stored them in
+        # pixels per tick, so they are converted.
+        if game_data.get("velocity_units") == "pixels per second":
+            velocity_scale = 1
+        else:
+            velocity_scale = constants.PHYSICS_STEPS_PER_SECOND
+
+        # Gets the saved paddle data.
+        paddle_width = paddle_data["width"]
+        paddle_height = paddle_data["height"]
+        paddle_canvas_gap = paddle_data["canvas_gap"]
+        paddle_colour = paddle_data["colour"]
+        paddle_left_x = paddle_data["left_x"]
+        paddle_top_y = paddle_data["top_y"]
+        paddle_right_x = paddle_data["right_x"]
+        paddle_bottom_y = paddle_data["bottom_y"]
+
+        # Stores lists of the different attribute values for the balls.
+        balls_attribute_values = []
+
+        # Gets the saved data for each ball and stores it in a list.
+        for ball_data in balls_data:
+
+            # Gets the saved ball data and appends it to the list in the order that
+            # the attributes are used to create the ball.
+            balls_attribute_values.append([ball_data["x_velocity"] * velocity_scale,
+                                           ball_data["y_velocity"] * velocity_scale,
+                                           ball_data["bounces_until_speed_up"],
+                                           ball_data["speed_up_amount"] * velocity_scale,
+                                           ball_data["radius"], ball_data["paddle_gap"],
+                                           ball_data["colour"], ball_data["left_x"],
+                                           ball_data["top_y"], ball_data["right_x"],
+                                           ball_data["bottom_y"],
+                                           ball_data["speed"] * velocity_scale])
+
+        # Stores lists of the different attribute values for the bricks.
+        bricks_attribute_values = []
+
+        # Gets the saved data for each brick and stores it in a list.
+        for brick_data in bricks_data:
+
+            # Gets the saved brick data and appends it to the list in the order that
+            # the attributes are used to add the brick.
+            bricks_attribute_values.append([brick_data["x"], brick_data["y"],
+                                            brick_data["score"], brick_data["colour"],
+                                            brick_data["width"], brick_data["height"]])
+
+        # Changes the world's attributes to the saved attribute values.
+        self.__lives = lives
+        self.__score = score
+        self.__level = level
+        self.__multi_ball = multi_ball
+
+        # Creates a new Paddle with the saved attribute values.
+        self.__paddle = Paddle(self.__width, self.__height, paddle_width, paddle_height,
+                               paddle_canvas_gap, paddle_colour)
+
+        # Changes the new Paddle object's attributes to the saved attribute values.
+        self.__paddle.left_x = paddle_left_x
+        self.__paddle.top_y = paddle_top_y
+        self.__paddle.right_x = paddle_right_x
+        self.__paddle.bottom_y = paddle_bottom_y
+
+        # Creates a new brick field that holds all of the saved bricks.
+        self.__bricks = BrickField()
+        for brick_attribute_values in bricks_attribute_values:
+            self.__bricks.add(*brick_attribute_values)
+
+        # Holds all of the saved balls.
+        self.__balls = []
+
+        # Iterates over all of the saved ball datas.
+        for ball_attribute_values in balls_attribute_values:
+
+            # Creates a new Ball with the saved attribute values.
+            ball = Ball(self.__width, self.__height, self.__paddle, self.__bricks, self.__level,
+                        *ball_attribute_values[:7], rng=self.__random)
+
+            # Changes the new Ball object's attributes to the saved attribute values.
+            ball.left_x = ball_attribute_values[7]
+            ball.top_y = ball_attribute_values[8]
+            ball.right_x = ball_attribute_values[9]
+            ball.bottom_y = ball_attribute_values[10]
+            ball.speed = ball_attribute_values[11]
+            self.__balls.append(ball)
+
+    @property
+    def width(self):
+        """(int): The width of the area the game is played in"""
+
+        return self.__width
+
+    @property
+    def height(self):
+        """(int): The height of the area the game is played in"""
+
+        return self.__height
+
+    @property
+    def timestep(self):
+        """(float): How many seconds each tick moves the paddle and balls for"""
+
+        return self.__timestep
+
+    @property
+    def seed(self):
+        """(int): The seed of the game's random number generator"""
+
+        return self.__seed
+
+    @property
+    def random(self):
+        """(Random): The random number generator used by the game's balls"""
+
+        return self.__random
+
+    @property
+    def lives(self):
+        """(int): The number of lives the user has"""
+
+        return self.__lives
+
+    @lives.setter
+    def lives(self, value):
+
+        self.__lives = value
+
+    @property
+    def score(self):
+        """(int): The score the user has"""
+
+        return self.__score
+
+    @score.setter
+    def score(self, value):
+
+        self.__score = value
+
+    @property
+    def level(self):
+        """(int): The level that the game is on"""
+
+        return self.__level
+
+    @level.setter
+    def level(self, value):
+
+        self.__level = value
+
+    @property
+    def paddle(self):
+        """(Paddle): The Paddle object that represents the game's paddle"""
+
+        return self.__paddle
+
+    @paddle.setter
+    def paddle(self, value):
+
+        self.__paddle = value
+
+    @property
+    def bricks(self):
+        """(BrickField): The brick field that stores the game's bricks"""
+
+        return self.__bricks
+
+    @bricks.setter
+    def bricks(self, value):
+
+        self.__bricks = value
+
+    @property
+    def multi_ball(self):
+        """(bool): Whether balls split when they destroy a brick"""
+
+        return self.__multi_ball
+
+    @multi_ball.setter
+    def multi_ball(self, value):
+
+        self.__multi_ball = value
+
+    @property
+    def ball(self):
+        """(Ball): The Ball object that represents the game's first ball.
+        Setting this replaces all of the balls in the game with the new ball."""
+
+        return self.__balls[0]
+
+    @ball.setter
+    def ball(self, value):
+
+        self.__balls = [value]
+
+    @property
+    def balls(self):
+        """(List[Ball]): The Ball objects that represent all of the balls in the game"""
+
+        return self.__balls
+
+    @balls.setter
+    def balls(self, value):
+
+        self.__balls = value
+
+if __name__ == "__main__":
+    print("Please run main.py")
@@ -0,0 +1,253 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import itertools
+import json
+import os
+import statistics
+import sys
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+import constants
+from world import World
+
+# The difficulty parameters that can be swept, mapped to the type of their values and their
+# default values. These are passed to World as keyword arguments, so speeds are in pixels
+# per second.
+PARAMETERS = {"ball_speed": (float, constants.DEFAULT_BALL_SPEED),
+              "speed_up_amount": (float, constants.DEFAULT_SPEED_UP_AMOUNT),
+              "bounces_until_speed_up": (int, constants.DEFAULT_BOUNCES_UNTIL_SPEED_UP),
+              "paddle_width": (int, constants.DEFAULT_PADDLE_WIDTH),
+              "level_scaling": (float, constants.DEFAULT_LEVEL_SCALING)}
+
+# The default directory that simulated games are cached in.
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       "sweep_cache")
+
+# Changing this makes all cached results stale, which should be done whenever the rules of
+# the game or the bot change.
+CACHE_VERSION = 5
+
+def move_bot_paddle(world, dead_zone):
+    """Moves the world's paddle so that its centre follows the centre of the lowest ball
+
+    Parameters:
+        world (World): The world whose paddle is moved
+        dead_zone (float): How far the ball's centre can be from the paddle's centre
+                           before the paddle is moved
+    """
+
+    # Follows the ball that is closest to the paddle.
+    ball = max(world.balls, key=lambda ball: ball.bottom_y)
+    ball_centre_x = (ball.left_x + ball.right_x) / 2
+    paddle_centre_x = (world.paddle.left_x + world.paddle.right_x) / 2
+
+    if ball_centre_x > paddle_centre_x + dead_zone:
+        world.paddle.move_right()
+    elif ball_centre_x < paddle_centre_x - dead_zone:
+        world.paddle.move_left()
+    else:
+        world.paddle.stop()
+
+def simulate_game(parameters, seed, max_ticks, dead_zone):
+    """Simulates a whole game with a bot paddle until the game is over or the maximum number
+    of ticks has passed
+
+    Parameters:
+        parameters (dict[str: float]): The difficulty parameters passed to World
+        seed (int): The seed for the random number generator used by the game
+        max_ticks (int): The maximum number of ticks to simulate the game for
+        dead_zone (float): The dead zone of the bot paddle
+
+    Returns:
+        result (dict[str: int]): The level reached, the score, the number of ticks survived
+                                 and whether the game ended by running out of lives
+    """
+
+    # Creates the world and steps it until the user runs out of lives.
+    # The world is seeded so that the same parameters and seed always give the same game.
+    world = World(seed=seed, **parameters)
+    ticks = 0
+    while world.lives > 0 and ticks < max_ticks:
+        move_bot_paddle(world, dead_zone)
+        world.step()
+        ticks += 1
+
+    return {"level": world.level, "score": world.score, "ticks": ticks,
+            "game_over": world.lives <= 0}
+
+def cache_key(parameters, seed, max_ticks, dead_zone):
+    """Returns the name of the cache file for a simulated game
+
+    Parameters:
+        parameters (dict[str: float]): The difficulty parameters passed to World
+        seed (int): The seed for the random number generator used by the game
+        max_ticks (int): The maximum number of ticks to simulate the game for
+        dead_zone (float): The dead zone of the bot paddle
+
+    Returns:
+        key (str): A hash of everything that affects the result of the game
+    """
+
+    key_data = {"version": CACHE_VERSION, "parameters": parameters, "seed": seed,
+                "max_ticks": max_ticks, "dead_zone": dead_zone}
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+def run_task(task):
+    """Simulates a game, or reads its result from the cache if it has already been simulated
+
+    This runs in a worker process.
+
+    Parameters:
+        task (tuple): The parameters, seed, maximum ticks, dead zone and cache directory
+                      (or None to not use the cache)
+
+    Returns:
+        result (dict[str: int]): The result of the game from simulate_game()
+    """
+
+    parameters, seed, max_ticks, dead_zone, cache_directory = task
+
+    # If the game is in the cache, then return the cached result.
+    if cache_directory is not None:
+        file_path = os.path.join(cache_directory,
+                                 cache_key(parameters, seed, max_ticks, dead_zone) + ".json")
+        try:
+            with open(file_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    # Otherwise, simulate the game and cache the result.
+    result = simulate_game(parameters, seed, max_ticks, dead_zone)
+    if cache_directory is not None:
+
+        # The result is written to a temporary file first so that another process never
+        # reads a half-written file.
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wt", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(temporary_path, file_path)
+
+    return result
+
+def summarise(results):
+    """Summarises the results of the games simulated for one set of parameters
+
+    Parameters:
+        results (List[dict[str: int]]): The results from simulate_game()
+
+    Returns:
+        summary (dict[str: float]): The mean level reached, the mean survival time in seconds,
+                                    the score distribution and how many games ended
+    """
+
+    # Gets the scores in order so that their quartiles can be found.
+    scores = sorted(result["score"] for result in results)
+    if len(scores) > 1:
+        score_quartiles = statistics.quantiles(scores, n=4)
+    else:
+        score_quartiles = scores * 3
+
+    return {"games": len(results),
+            "mean_level": statistics.fmean(result["level"] for result in results),
+            "mean_survival_seconds": statistics.fmean(result["ticks"] for result in results)
+                                     / constants.PHYSICS_STEPS_PER_SECOND,
+            "games_over": sum(result["game_over"] for result in results),
+            "score_min": scores[0],
+            "score_25": score_quartiles[0],
+            "score_median": score_quartiles[1],
+            "score_75": score_quartiles[2],
+            "score_max": scores[-1],
+            "score_mean": statistics.fmean(scores)}
+
+def create_argument_parser():
+    """Returns the parser for the command line arguments of the sweep tool"""
+
+    parser = argparse.ArgumentParser(description="Simulates games of Breakout with a bot paddle "
+                                                 "for every combination of the given difficulty "
+                                                 "parameters and reports how far the bot gets.")
+
+    # Each difficulty parameter can be given one or more values.
+    for name, (value_type, default) in PARAMETERS.items():
+        parser.add_argument("--" + name.replace("_", "-"), type=value_type, nargs="+",
+                            default=[default], metavar="VALUE",
+                            help=f"values of {name} to sweep (default {default})")
+
+    parser.add_argument("--games", type=int, default=20,
+                        help="games simulated for each set of parameters (default 20)")
+    parser.add_argument("--first-seed", type=int, default=0,
+                        help="seed of the first game, the others use the following seeds "
+                             "(default 0)")
+    parser.add_argument("--max-minutes", type=float, default=10,
+                        help="how many minutes of game time a game can last (default 10)")
+    parser.add_argument("--dead-zone", type=float, default=20,
+                        help="how far the ball can be from the centre of the bot's paddle "
+                             "before it moves (default 20)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIRECTORY,
+                        help="directory that simulated games are cached in")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="don't read or write the cache")
+    parser.add_argument("--json", metavar="PATH",
+                        help="also write the report to a JSON file")
+
+    return parser
+
+def main(arguments=None):
+    """Runs the sweep from the command line arguments and prints the report
+
+    Parameters:
+        arguments (List[str]) (default None): The command line arguments.
+                                              If None, sys.argv is used.
+    """
+
+    arguments = create_argument_parser().parse_args(arguments)
+
+    # Creates a set of parameters for every combination of the values given.
+    names = list(PARAMETERS)
+    parameter_sets = [dict(zip(names, values)) for values in
+                      itertools.product(*(getattr(arguments, name) for name in names))]
+
+    # Creates the cache directory if the cache is being used.
+    cache_directory = None if arguments.no_cache else arguments.cache_dir
+    if cache_directory is not None:
+        os.makedirs(cache_directory, exist_ok=True)
+
+    # Creates a task for every game of every set of parameters.
+    max_ticks = int(arguments.max_minutes * 60 * constants.PHYSICS_STEPS_PER_SECOND)
+    seeds = range(arguments.first_seed, arguments.first_seed + arguments.games)
+    tasks = [(parameters, seed, max_ticks, arguments.dead_zone, cache_directory)
+             for parameters in parameter_sets for seed in seeds]
+
+    # Simulates the games across the worker processes. The results come back in the same
+    # order as the tasks.
+    with ProcessPoolExecutor(max_workers=arguments.workers) as executor:
+        results = list(executor.map(run_task, tasks, chunksize=max(1, arguments.games // 4)))
+
+    # Summarises the games for each set of parameters.
+    report = []
+    for index, parameters in enumerate(parameter_sets):
+        parameter_results = results[index * arguments.games:(index + 1) * arguments.games]
+        report.append({"parameters": parameters, **summarise(parameter_results)})
+
+    # Prints the report as a table with a column for each parameter.
+    print(" ".join(names)
+          + f" {'level':>6} {'survived':>9} {'over':>5}  score p25/p50/p75")
+    for row in report:
+        print(" ".join(f"{row['parameters'][name]:>{len(name)}}" for name in names)
+              + f" {row['mean_level']:6.2f} {row['mean_survival_seconds']:8.1f}s"
+              + f" {row['games_over']:>5}"
+              + f"  {row['score_25']:.0f}/{row['score_median']:.0f}/{row['score_75']:.0f}")
+
+    # Writes the report to a JSON file if one was given.
+    if arguments.json is not None:
+        with open(arguments.json, "wt", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+
+if __name__ == "__main__":
+    main()
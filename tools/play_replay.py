@@ -0,0 +1,80 @@
+import argparse
+import os
+import sys
+
+# Makes it so that the game's modules in src can be imported.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "src"))
+
+from replay import ReplayPlayer, load_replay
+
+# The replay that is saved when a game finishes.
+DEFAULT_REPLAY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "assets", "replay.json")
+
+def print_result(player):
+    """Prints the state that the replayed game finished in
+
+    Parameters:
+        player (ReplayPlayer): The player that played the replay
+    """
+
+    world = player.world
+    print(f"Ticks: {player.ticks}, lives: {world.lives}, level: {world.level}, "
+          f"score: {world.score}, bricks left: {len(world.bricks)}")
+
+def play_in_window(player):
+    """Plays a replay in real time in a window
+
+    Parameters:
+        player (ReplayPlayer): The player for the replay
+    """
+
+    # Tkinter and the renderer are only imported when a window is needed so that headless
+    # playback works without a display.
+    from tkinter import Canvas
+    from main import create_window
+    from renderer import Renderer
+
+    # Creates a window with a canvas that the replay is drawn onto.
+    window = create_window(player.world.width, player.world.height)
+    canvas = Canvas(window, background="#000000", width=player.world.width,
+                    height=player.world.height)
+    canvas.pack()
+    renderer = Renderer(canvas, player.world)
+
+    # Plays the replay and closes the window when it has finished.
+    def finish():
+        print_result(player)
+        window.after(1000, window.destroy)
+
+    player.play_real_time(canvas, renderer, finish)
+    window.mainloop()
+
+def main(arguments=None):
+    """Plays back a replay from the command line arguments
+
+    Parameters:
+        arguments (List[str]) (default None): The command line arguments.
+                                              If None, sys.argv is used.
+    """
+
+    parser = argparse.ArgumentParser(description="Plays back a recorded game of Breakout.")
+    parser.add_argument("replay", nargs="?", default=DEFAULT_REPLAY_PATH,
+                        help="the replay file (default assets/replay.json)")
+    parser.add_argument("--headless", action="store_true",
+                        help="play the replay as fast as possible without a window and "
+                             "print the throughput")
+    arguments = parser.parse_args(arguments)
+
+    player = ReplayPlayer(load_replay(arguments.replay))
+
+    if arguments.headless:
+        steps_per_second = player.play_headless()
+        print_result(player)
+        print(f"{steps_per_second:,.0f} ticks/s")
+    else:
+        play_in_window(player)
+
+if __name__ == "__main__":
+    main()